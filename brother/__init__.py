@@ -1,11 +1,13 @@
 """Python wrapper for getting data from Brother laser and inkjet printers via SNMP."""
 
+import asyncio
 import logging
 import re
-from asyncio import timeout
-from collections.abc import Generator, Iterable
-from contextlib import suppress
+from collections.abc import Generator, Iterable, Mapping
+from contextlib import AbstractContextManager, nullcontext, suppress
+from copy import copy
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Self, cast
 
 from dacite import from_dict
@@ -16,21 +18,26 @@ from pysnmp.hlapi.v3arch.asyncio import (
     ObjectIdentity,
     SnmpEngine,
     UdpTransportTarget,
+    bulk_cmd,
     get_cmd,
     set_cmd,
 )
 from pysnmp.hlapi.v3arch.asyncio.cmdgen import LCD
+from pysnmp.proto.errind import RequestTimedOut
 from pysnmp.proto.rfc1902 import OctetString
+from pysnmp.proto.rfc1905 import EndOfMibView
 from pysnmp.smi.rfc1902 import ObjectType
 
+from .circuit import CircuitBreaker
+from .codecs import (
+    LEGACY_CODEC,
+    MODERN_CODEC,
+    RecordCodec,
+    RecordParser,
+    detect_codec,
+)
 from .const import (
-    ATTR_CHARSET,
-    ATTR_COUNTERS,
-    ATTR_FIRMWARE,
-    ATTR_MAC,
-    ATTR_MAINTENANCE,
     ATTR_MODEL,
-    ATTR_NEXTCARE,
     ATTR_PAGE_COUNT,
     ATTR_SERIAL,
     ATTR_STATUS,
@@ -39,32 +46,95 @@ from .const import (
     DATETIME_SET_SUPPORTED_MODELS,
     DEFAULT_TIMEOUT,
     DEFAULT_WRITE_COMMUNITY,
+    HEX_SLOTS,
     OID_DATETIME,
+    OID_SLOTS,
+    OID_SUPPLIES_DESCRIPTION,
+    OID_SUPPLIES_LEVEL,
+    OID_SUPPLIES_MAX_CAPACITY,
     OIDS,
-    OIDS_HEX,
-    PERCENT_VALUES,
     PRINTER_TYPES,
+    PROBE_TIMEOUT,
     RETRIES,
+    SLOT_CHARSET,
+    SLOT_COUNTERS,
+    SLOT_FIRMWARE,
+    SLOT_MAC,
+    SLOT_MAINTENANCE,
+    SLOT_MODEL,
+    SLOT_NEXTCARE,
+    SLOT_PAGE_COUNT,
+    SLOT_SERIAL,
+    SLOT_STATUS,
+    SLOT_UPTIME,
+    SUPPLIES_MAX_REPETITIONS,
     UNSUPPORTED_MODELS,
     VALUES_COUNTERS,
     VALUES_INK_MAINTENANCE,
     VALUES_LASER_MAINTENANCE,
     VALUES_LASER_NEXTCARE,
 )
+from .exceptions import CircuitOpenError as CircuitOpenError
 from .exceptions import MethodNotSupportedError, SnmpError, UnsupportedModelError
-from .model import BrotherSensors
+from .exceptions import SnmpNoSuchNameError as SnmpNoSuchNameError
+from .exceptions import SnmpSetError as SnmpSetError
+from .exceptions import SnmpTransportError as SnmpTransportError
+from .hedging import Hedger
+from .model import BrotherSensors, BrotherSupply
+from .profiles import get_model_profile
+from .profiling import (
+    PHASE_DECODE,
+    PHASE_FROM_DICT,
+    PHASE_GET_DATA,
+    PHASE_INITIALIZE,
+    PHASE_PROCESS_VARBINDS,
+    Profiler,
+    get_default_profiler,
+)
+from .ratelimit import SubnetRateLimiter, TokenBucket
+from .recorder import Recorder
 from .utils import (
     async_get_snmp_engine,
+    async_resolve_host,
     build_dateandtime,
-    bytes_to_hex_string,
+    build_set_varbinds,
+    decode_status,
+    get_oid_table,
     parse_dateandtime,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 REGEX_MODEL_PATTERN = re.compile(r"MDL:(?P<model>[\w\-]+)")
-CHUNK_SIZE = 14
-LEGACY_CHUNK_SIZE = 10
+# bit of every OIDS attribute in the mask of OIDs to retrieve
+OID_BITS = {attr: 1 << slot for attr, slot in OID_SLOTS.items()}
+OID_ATTRS = {oid: attr for attr, oid in OIDS.items()}
+OID_VALUES = tuple(OIDS.values())
+REQUIRED_ATTRS = (ATTR_MODEL, ATTR_SERIAL)
+# slots decoded with record codecs and maps of their codes, in decoding order
+DECODED_SLOTS = {
+    "laser": {
+        SLOT_COUNTERS: VALUES_COUNTERS,
+        SLOT_MAINTENANCE: VALUES_LASER_MAINTENANCE,
+        SLOT_NEXTCARE: VALUES_LASER_NEXTCARE,
+    },
+    "ink": {
+        SLOT_COUNTERS: VALUES_COUNTERS,
+        SLOT_MAINTENANCE: VALUES_INK_MAINTENANCE,
+    },
+}
+
+
+@lru_cache
+def _mask_slots(mask: int) -> tuple[int, ...]:
+    """Return OIDS slots selected by the mask, in the order of the request."""
+    return tuple(slot for slot in range(len(OIDS)) if mask >> slot & 1)
+
+
+@lru_cache
+def _get_parser(codec: RecordCodec, printer_type: str, slot: int) -> RecordParser:
+    """Return parser of a slot compiled for the codec and printer type."""
+    return codec.compile(DECODED_SLOTS[printer_type][slot])
 
 
 class Brother:
@@ -75,10 +145,16 @@ class Brother:
         host: str,
         port: int = 161,
         community: str = "public",
-        printer_type: str = "laser",
+        printer_type: str | None = None,
         model: str | None = None,
         snmp_engine: SnmpEngine | None = None,
         write_community: str = DEFAULT_WRITE_COMMUNITY,
+        circuit_breaker: CircuitBreaker | None = None,
+        recorder: Recorder | None = None,
+        profiler: Profiler | None = None,
+        hedger: Hedger | None = None,
+        rate_limiter: TokenBucket | None = None,
+        subnet_limiter: SubnetRateLimiter | None = None,
     ) -> None:
         """Initialize."""
         if model and any(
@@ -90,13 +166,24 @@ class Brother:
                 "It seems that this printer model is not supported"
             )
 
+        self._profile = get_model_profile(model) if model else None
+
+        # the profile gives the printer type only if the caller did not
+        if printer_type is None:
+            printer_type = self._profile.printer_type if self._profile else "laser"
         if printer_type not in PRINTER_TYPES:
             _LOGGER.warning("Wrong printer_type argument, 'laser' was used")
-            self._printer_type = "laser"
-        else:
-            self._printer_type = printer_type
-
-        self._legacy: bool | None = None
+            printer_type = "laser"
+        self._printer_type = printer_type
+
+        # codecs of decoded slots, detected once from the first data of a slot
+        self._codecs: dict[int, RecordCodec] = {}
+        if self._profile:
+            self._codecs[SLOT_MAINTENANCE] = (
+                LEGACY_CODEC if self._profile.legacy else MODERN_CODEC
+            )
+        # parsers of the codecs, resolved once per slot
+        self._parsers: dict[int, RecordParser] = {}
 
         self._firmware: str | None = None
         self.model: str
@@ -107,7 +194,23 @@ class Brother:
         self._community = community
         self._write_community = write_community
         self._snmp_engine = snmp_engine
-        self._oids: list[ObjectType] = []
+        self._circuit_breaker = circuit_breaker
+        self._recorder = recorder
+        self._profiler = profiler or get_default_profiler()
+        self._hedger = hedger
+        # limits of all SNMP requests to this printer and to its subnet
+        self._rate_limiter = rate_limiter
+        self._subnet_limiter = subnet_limiter
+        self._address: str | None = None
+        # OIDs to retrieve as a mask over the OID table shared by the engine
+        self._oids = 0
+        self._oid_table: tuple[ObjectType, ...] = ()
+        self._transport: UdpTransportTarget | None = None
+        # the transport without retransmits, for requests that are sent once
+        self._single_try_transport: UdpTransportTarget | None = None
+        # the largest number of varbinds per request the printer accepts
+        self._max_varbinds: int | None = None
+        self._max_answered = 0
         self._request_args: tuple[
             SnmpEngine, CommunityData, UdpTransportTarget, ContextData
         ]
@@ -132,9 +235,21 @@ class Brother:
         """Return SNMP community."""
         return self._community
 
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """Return circuit breaker of the printer."""
+        return self._circuit_breaker
+
+    @property
+    def hedger(self) -> Hedger | None:
+        """Return hedger of requests to the printer."""
+        return self._hedger
+
     @property
     def is_datetime_set_supported(self) -> bool:
         """Return True if the printer model supports setting the datetime via SNMP."""
+        if self._profile:
+            return self._profile.datetime_set_supported
         return any(m in self.model.lower() for m in DATETIME_SET_SUPPORTED_MODELS)
 
     @classmethod
@@ -143,12 +258,24 @@ class Brother:
         host: str,
         port: int = 161,
         community: str = "public",
-        printer_type: str = "laser",
+        printer_type: str | None = None,
         model: str | None = None,
         snmp_engine: SnmpEngine | None = None,
         write_community: str = DEFAULT_WRITE_COMMUNITY,
+        circuit_breaker: CircuitBreaker | None = None,
+        recorder: Recorder | None = None,
+        profiler: Profiler | None = None,
+        hedger: Hedger | None = None,
+        rate_limiter: TokenBucket | None = None,
+        subnet_limiter: SubnetRateLimiter | None = None,
+        *,
+        timeout: float | None = None,
     ) -> Self:
-        """Create a new device instance."""
+        """Create a new device instance.
+
+        `timeout` caps initialization in seconds, TimeoutError is raised when
+        it passes.
+        """
         instance = cls(
             host=host,
             port=port,
@@ -157,156 +284,177 @@ class Brother:
             model=model,
             snmp_engine=snmp_engine,
             write_community=write_community,
+            circuit_breaker=circuit_breaker,
+            recorder=recorder,
+            profiler=profiler,
+            hedger=hedger,
+            rate_limiter=rate_limiter,
+            subnet_limiter=subnet_limiter,
         )
-        await instance.initialize()
+        await instance.initialize(timeout=timeout)
         return instance
 
-    async def initialize(self) -> None:
+    async def initialize(self, *, timeout: float | None = None) -> None:
+        """Initialize snmp_engine and check which OIDs are supported."""
+        # the breaker is entered outside of the timeout, which cancels the
+        # call and raises TimeoutError only when leaving its scope
+        with self._phase(PHASE_INITIALIZE), self._circuit():
+            async with asyncio.timeout(timeout):
+                await self._initialize()
+
+    async def _initialize(self) -> None:
         """Initialize snmp_engine and check which OIDs are supported."""
         _LOGGER.debug("Initializing device %s", self._host)
 
         if not self._snmp_engine:
             self._snmp_engine = await async_get_snmp_engine()
 
-        oids = list(self._iterate_oids(OIDS.values()))
+        self._oid_table = get_oid_table(self._snmp_engine)
+        if self._profile:
+            # known model, no need to probe which OIDs are supported
+            self._oids = sum(OID_BITS[attr] for attr in self._profile.oids)
+        else:
+            self._oids = sum(OID_BITS.values())
+
+        # the transport is kept across re-initialization, e.g. after
+        # a firmware update, so the host is not resolved again
+        if self._transport is None:
+            self._address = await async_resolve_host(self._host)
+            try:
+                self._transport = await UdpTransportTarget.create(
+                    (self._address, self._port),
+                    timeout=DEFAULT_TIMEOUT,
+                    retries=RETRIES,
+                )
+            except PySnmpError as err:
+                raise ConnectionError(err) from err
+
+        self._request_args = (
+            self._snmp_engine,
+            CommunityData(self.community, mpModel=0),
+            self._transport,
+            ContextData(),
+        )
 
-        try:
-            self._request_args = (
-                self._snmp_engine,
-                CommunityData(self.community, mpModel=0),
-                await UdpTransportTarget.create(
-                    (self._host, self._port), timeout=DEFAULT_TIMEOUT, retries=RETRIES
-                ),
-                ContextData(),
-            )
-        except PySnmpError as err:
-            raise ConnectionError(err) from err
+        async with asyncio.timeout(PROBE_TIMEOUT):
+            while not self._profile:
+                # the probe is split as polls are, for agents that do not
+                # answer a request carrying all OIDs
+                try:
+                    await self._get_varbinds(self._selected_oids())
+                except SnmpNoSuchNameError as err:
+                    self._drop_unsupported_oid(err)
+                    continue
 
-        while True:
-            async with timeout(DEFAULT_TIMEOUT * RETRIES):
-                _, errstatus, errindex, _ = await get_cmd(*self._request_args, *oids)
+                break
 
-            if str(errstatus) == "noSuchName":
-                # 5 and 8 are indexes from OIDS consts, model and serial are obligatory
-                if errindex in (5, 8):
-                    raise UnsupportedModelError(
-                        "It seems that this printer model is not supported"
-                    )
+    async def async_update(self, *, timeout: float | None = None) -> BrotherSensors:
+        """Update data from printer.
 
-                oids.pop(errindex - 1)
-                continue
+        `timeout` caps the whole update in seconds, retries included,
+        TimeoutError is raised when it passes.
+        """
+        with self._profiler.poll() if self._profiler else nullcontext():
+            data = await self.async_update_data(timeout=timeout)
 
-            break
+            with self._phase(PHASE_FROM_DICT):
+                result: BrotherSensors = from_dict(BrotherSensors, data)
 
-        self._oids = oids
+        return result
 
-    async def async_update(self) -> BrotherSensors:
-        """Update data from printer."""
-        if not (raw_data := await self._get_data()):
+    async def async_update_data(
+        self, *, timeout: float | None = None
+    ) -> dict[str, Any]:
+        """Update data from printer and return decoded values as a dict."""
+        with self._phase(PHASE_GET_DATA), self._circuit():
+            async with asyncio.timeout(timeout):
+                raw_data = await self._get_data()
+
+        if raw_data is None or raw_data.count(None) == len(raw_data):
             raise SnmpError("The printer did not return data")
 
         _LOGGER.debug("RAW data: %s", raw_data)
 
+        with self._phase(PHASE_DECODE):
+            data = self._decode_raw_data(raw_data)
+
+        _LOGGER.debug("Data: %s", data)
+
+        return data
+
+    def _decode_raw_data(self, raw_data: list[Any]) -> dict[str, Any]:
+        """Decode raw data from printer."""
         data: dict[str, Any] = {}
 
         try:
-            model_match = REGEX_MODEL_PATTERN.search(raw_data[OIDS[ATTR_MODEL]])
+            model_match = REGEX_MODEL_PATTERN.search(raw_data[SLOT_MODEL])
 
             if TYPE_CHECKING:
                 assert model_match is not None
 
             self.model = model_match.group("model")
-            self.serial = raw_data[OIDS[ATTR_SERIAL]]
+            self.serial = raw_data[SLOT_SERIAL]
         except (TypeError, AttributeError) as err:
             raise UnsupportedModelError(
                 "It seems that this printer model is not supported"
             ) from err
 
-        self.mac = raw_data[OIDS[ATTR_MAC]]
-        self._firmware = raw_data.get(OIDS[ATTR_FIRMWARE])
+        self.mac = raw_data[SLOT_MAC]
+        self._firmware = raw_data[SLOT_FIRMWARE]
 
-        if status := raw_data[OIDS[ATTR_STATUS]]:
-            data[ATTR_STATUS] = self._cleanse_status(status.lower())
+        if status := raw_data[SLOT_STATUS]:
+            # already cleansed by decode_status()
+            data[ATTR_STATUS] = status
 
         try:
-            uptime = int(cast(str, raw_data.get(OIDS[ATTR_UPTIME]))) / 100
+            uptime = int(cast(str, raw_data[SLOT_UPTIME])) / 100
         except TypeError:
             pass
         else:
             data[ATTR_UPTIME] = (
                 datetime.now(tz=UTC) - timedelta(seconds=uptime)
             ).replace(microsecond=0, tzinfo=UTC)
-        if self._legacy:
-            if self._printer_type == "laser":
-                data.update(
-                    self._iterate_data_legacy(
-                        raw_data.get(OIDS[ATTR_MAINTENANCE], {}),
-                        VALUES_LASER_MAINTENANCE,
-                    )
-                )
-            elif self._printer_type == "ink":
-                data.update(
-                    self._iterate_data_legacy(
-                        raw_data.get(OIDS[ATTR_MAINTENANCE], {}),
-                        VALUES_INK_MAINTENANCE,
-                    )
-                )
-        else:
-            data.update(
-                self._iterate_data(
-                    raw_data.get(OIDS[ATTR_COUNTERS], {}), VALUES_COUNTERS
-                )
-            )
-            if self._printer_type == "laser":
-                data.update(
-                    self._iterate_data(
-                        raw_data.get(OIDS[ATTR_MAINTENANCE], {}),
-                        VALUES_LASER_MAINTENANCE,
-                    )
-                )
-                data.update(
-                    self._iterate_data(
-                        raw_data.get(OIDS[ATTR_NEXTCARE], {}), VALUES_LASER_NEXTCARE
-                    )
-                )
-            elif self._printer_type == "ink":
-                data.update(
-                    self._iterate_data(
-                        raw_data.get(OIDS[ATTR_MAINTENANCE], {}),
-                        VALUES_INK_MAINTENANCE,
+        for slot in DECODED_SLOTS[self._printer_type]:
+            if not (records := raw_data[slot]):
+                continue
+            if (parser := self._parsers.get(slot)) is None:
+                if (codec := self._codecs.get(slot)) is None:
+                    codec = self._codecs[slot] = detect_codec(records)
+                    _LOGGER.debug(
+                        "Detected %s records of %s", codec.name, list(OIDS)[slot]
                     )
+                parser = self._parsers[slot] = _get_parser(
+                    codec, self._printer_type, slot
                 )
+            data.update(parser(records))
         # page counter for old printer models
         with suppress(ValueError):
-            if not data.get(ATTR_PAGE_COUNT) and raw_data.get(OIDS[ATTR_PAGE_COUNT]):
-                data[ATTR_PAGE_COUNT] = int(
-                    cast(str, raw_data.get(OIDS[ATTR_PAGE_COUNT]))
-                )
-
-        _LOGGER.debug("Data: %s", data)
-
-        result: BrotherSensors = from_dict(BrotherSensors, data)
+            if not data.get(ATTR_PAGE_COUNT) and raw_data[SLOT_PAGE_COUNT]:
+                data[ATTR_PAGE_COUNT] = int(raw_data[SLOT_PAGE_COUNT])
 
-        return result
+        return data
 
     def shutdown(self) -> None:
         """Unconfigure SNMP engine."""
         if self._snmp_engine:
             LCD.unconfigure(self._snmp_engine, None)
 
-    async def async_get_datetime(self) -> datetime | None:
+    async def async_get_datetime(
+        self, *, timeout: float | None = None
+    ) -> datetime | None:
         """Return the printer's current date and time, or None if not available."""
         oid = ObjectType(ObjectIdentity(OID_DATETIME))
 
         try:
-            errindication, errstatus, errindex, restable = await get_cmd(
-                *self._request_args, oid
-            )
+            async with asyncio.timeout(timeout):
+                errindication, errstatus, errindex, restable = await self._get_cmd(
+                    [oid]
+                )
         except PySnmpError as err:
             raise ConnectionError(err) from err
 
         if errindication:
-            raise SnmpError(str(errindication))
+            raise SnmpTransportError(str(errindication))
         if errstatus:
             if str(errstatus) == "noSuchName":
                 return None
@@ -316,7 +464,9 @@ class Brother:
         raw: bytes = restable[0][-1].asOctets()
         return parse_dateandtime(raw)
 
-    async def async_set_datetime(self, dt: datetime | None = None) -> None:
+    async def async_set_datetime(
+        self, dt: datetime | None = None, *, timeout: float | None = None
+    ) -> None:
         """Set the printer's date and time via SNMP."""
         if not self.is_datetime_set_supported:
             msg = f"Setting datetime is not supported on model {self.model}"
@@ -325,26 +475,114 @@ class Brother:
         if dt is None:
             dt = datetime.now(tz=UTC).astimezone()
 
-        payload = OctetString(build_dateandtime(dt))
-        oid = ObjectType(
-            ObjectIdentity(OID_DATETIME),
-            payload,
+        await self.async_set(
+            {OID_DATETIME: OctetString(build_dateandtime(dt))}, timeout=timeout
         )
 
+        _LOGGER.debug("Printer datetime set to %s", dt.isoformat())
+
+    async def async_set(
+        self, values: Mapping[str, object], *, timeout: float | None = None
+    ) -> None:
+        """Set values on the printer with one SNMP SET request.
+
+        Values are SNMP typed values keyed by numeric OID and are validated
+        before the request is sent. SET is atomic, if the printer rejects any
+        varbind nothing is set and SnmpSetError carries the rejected OID.
+        """
+        varbinds = build_set_varbinds(values)
+
         try:
-            errindication, errstatus, errindex, _ = await set_cmd(
-                *self._write_request_args(), oid
-            )
+            async with asyncio.timeout(timeout):
+                await self._throttle()
+                errindication, errstatus, errindex, _ = await set_cmd(
+                    *self._write_request_args(), *varbinds
+                )
         except PySnmpError as err:
             raise ConnectionError(err) from err
 
         if errindication:
-            raise SnmpError(str(errindication))
+            raise SnmpTransportError(str(errindication))
         if errstatus:
+            oids = list(values)
+            oid = oids[int(errindex) - 1] if 0 < int(errindex) <= len(oids) else None
             msg = f"SNMP SET failed: {errstatus} at index {errindex}"
-            raise SnmpError(msg)
+            if oid:
+                msg = f"{msg} ({oid})"
+            raise SnmpSetError(msg, oid)
 
-        _LOGGER.debug("Printer datetime set to %s", dt.isoformat())
+    async def async_get_supplies(
+        self,
+        max_supplies: int = SUPPLIES_MAX_REPETITIONS,
+        *,
+        timeout: float | None = None,
+    ) -> list[BrotherSupply]:
+        """Return marker supplies from the Printer-MIB supplies table.
+
+        The table is walked with a single SNMPv2c GETBULK request, so at most
+        `max_supplies` supplies are returned.
+        """
+        columns = (
+            OID_SUPPLIES_DESCRIPTION,
+            OID_SUPPLIES_MAX_CAPACITY,
+            OID_SUPPLIES_LEVEL,
+        )
+
+        with self._circuit():
+            try:
+                async with asyncio.timeout(timeout):
+                    await self._throttle()
+                    errindication, errstatus, errindex, varbinds = await bulk_cmd(
+                        self._request_args[0],
+                        CommunityData(self.community, mpModel=1),
+                        self._request_args[2],
+                        self._request_args[3],
+                        0,
+                        max_supplies,
+                        *self._iterate_oids(columns),
+                    )
+            except PySnmpError as err:
+                raise ConnectionError(err) from err
+            if errindication:
+                raise SnmpTransportError(str(errindication))
+            if errstatus:
+                msg = f"SNMP GETBULK failed: {errstatus} at index {errindex}"
+                raise SnmpError(msg)
+
+        supplies: list[BrotherSupply] = []
+        # varbinds are ordered row by row, one varbind per column
+        for ind in range(0, len(varbinds) - len(columns) + 1, len(columns)):
+            row = varbinds[ind : ind + len(columns)]
+            description_oid = str(row[0][0])
+            if any(
+                isinstance(resrow[-1], EndOfMibView)
+                or not str(resrow[0]).startswith(f"{column}.")
+                for resrow, column in zip(row, columns, strict=True)
+            ):
+                break
+            max_capacity = int(row[1][-1])
+            level = int(row[2][-1])
+            supplies.append(
+                BrotherSupply(
+                    index=description_oid.removeprefix(f"{OID_SUPPLIES_DESCRIPTION}."),
+                    description=str(row[0][-1]),
+                    level=level,
+                    max_capacity=max_capacity,
+                    remaining=round(level / max_capacity * 100)
+                    if level >= 0 and max_capacity > 0
+                    else None,
+                )
+            )
+
+        return supplies
+
+    def _circuit(self) -> AbstractContextManager:
+        """Return circuit breaker context for a call to the printer."""
+        return self._circuit_breaker or nullcontext()
+
+    def _phase(self, name: str) -> AbstractContextManager:
+        """Return profiler context for a phase of a poll."""
+        return self._profiler.phase(name) if self._profiler else nullcontext()
 
     def _write_request_args(
         self,
@@ -357,137 +595,225 @@ class Brother:
             self._request_args[3],
         )
 
-    async def _get_data(self) -> dict[str, Any]:
+    async def _get_data(self) -> list[Any] | None:
         """Retrieve data from printer."""
-        raw_data: dict[str, str | list[str]] = {}
+        while True:
+            # a profile may list an OID the firmware of the unit lacks
+            try:
+                restable = await self._get_varbinds(self._selected_oids())
+            except SnmpNoSuchNameError as err:
+                self._drop_unsupported_oid(err)
+                continue
+
+            break
+
+        with self._phase(PHASE_PROCESS_VARBINDS):
+            raw_data = self._process_varbinds(restable)
+
+        if self._recorder:
+            self._recorder.record(self._host, raw_data, restable)
+
+        return raw_data
+
+    def _process_varbinds(self, restable: list[ObjectType]) -> list[Any]:
+        """Convert varbinds to raw data, a list of OIDS slots.
+
+        Varbinds are in the order of the request, so the slot of every varbind
+        is known from the OIDs mask.
+        """
+        raw_data: list[Any] = [None] * len(OIDS)
         raw_status: bytes | None = None
 
-        try:
-            errindication, errstatus, errindex, restable = await get_cmd(
-                *self._request_args, *self._oids
+        for slot, resrow in zip(_mask_slots(self._oids), restable, strict=False):
+            if HEX_SLOTS[slot]:
+                # records without checksum FF at the end, decoded by the codec
+                # of the slot, e.g. b'c\x01\x04\x00\x00\x00\x01\x11\x01\x04\x00\x00'
+                raw_data[slot] = resrow[-1].asOctets()[:-1]
+            elif slot == SLOT_MAC:
+                data = resrow[-1].asOctets()
+                raw_data[slot] = ":".join([f"{x:02x}" for x in data])
+            elif slot == SLOT_STATUS:
+                raw_status = resrow[-1]._value  # noqa: SLF001
+            else:
+                raw_data[slot] = str(resrow[-1])
+
+        if raw_status is not None:
+            encoding = CHARSET_MAP.get(raw_data[SLOT_CHARSET] or "unknown", "roman8")
+            if status := decode_status(raw_status, encoding):
+                raw_data[SLOT_STATUS] = status
+
+        return raw_data
+
+    def _selected_oids(self) -> list[ObjectType]:
+        """Return shared OID objects selected by the mask."""
+        return [self._oid_table[slot] for slot in _mask_slots(self._oids)]
+
+    async def _get_varbinds(self, oids: list[ObjectType]) -> list[ObjectType]:
+        """Get OIDs from printer, split into smaller requests if necessary.
+
+        Some agents reply tooBig or do not reply at all when a request carries
+        too many varbinds. The largest accepted request size is learned and the
+        OIDs are then requested with concurrent smaller requests.
+        """
+        size = min(self._max_varbinds or len(oids), len(oids)) or 1
+        chunks = [oids[ind : ind + size] for ind in range(0, len(oids), size)]
+
+        results = await asyncio.gather(
+            *(self._get_varbinds_chunk(chunk) for chunk in chunks or [oids])
+        )
+
+        if any(restable is None for restable in results):
+            self._max_varbinds = (size + 1) // 2
+            _LOGGER.debug(
+                "Request too big for %s, using %s varbinds per request",
+                self._host,
+                self._max_varbinds,
             )
+            return await self._get_varbinds(oids)
+
+        self._max_answered = max(self._max_answered, size)
+        return [resrow for restable in results if restable for resrow in restable]
+
+    async def _get_varbinds_chunk(
+        self, oids: list[ObjectType]
+    ) -> list[ObjectType] | None:
+        """Get OIDs with one request, return None if the request is too big."""
+        try:
+            errindication, errstatus, errindex, restable = await self._get_cmd(oids)
         except PySnmpError as err:
             raise ConnectionError(err) from err
+
+        if len(oids) > 1:
+            if str(errstatus) == "tooBig":
+                return None
+            if (
+                isinstance(errindication, RequestTimedOut)
+                and len(oids) > self._max_answered
+                and await self._is_responding(oids[0])
+            ):
+                return None
+
         if errindication:
-            raise SnmpError(str(errindication))
+            raise SnmpTransportError(str(errindication))
         if errstatus:
             msg = f"{errstatus}, {errindex}"
+            if str(errstatus) == "noSuchName" and 0 < int(errindex) <= len(oids):
+                raise SnmpNoSuchNameError(msg, self._oid_of(oids[int(errindex) - 1]))
             raise SnmpError(msg)
-        for resrow in restable:
-            oid_str = str(resrow[0])
-            if oid_str in OIDS_HEX:
-                # asOctets gives bytes data b'c\x01\x04\x00\x00\x00\x01\x11\x01\x04\x00\
-                # x00\x05,A\x01\x04\x00\x00"\xc41\x01\x04\x00\x00\x00\x01o\x01\x04\x00\
-                # x00\x19\x00\x81\x01\x04\x00\x00\x00F\x86\x01\x04\x00\x00\x00\n\xff'
-                data = resrow[-1].asOctets()
-                # convert to string without checksum FF at the end, gives
-                # '630104000000011101040000052c410104000022c4310104000000016f01040000190
-                #  0810104000000468601040000000a'
-                data_str = bytes_to_hex_string(data)
-                # split to 14 digits words in list, gives ['63010400000001',
-                # '1101040000052c', '410104000022c4', '31010400000001',
-                # '6f010400001900', '81010400000046', '8601040000000a']
-                result = [
-                    data_str[ind : ind + CHUNK_SIZE]
-                    for ind in range(0, len(data_str), CHUNK_SIZE)
-                ]
-                # map sensors names to OIDs
-                raw_data[oid_str] = result
-            elif oid_str == OIDS[ATTR_MAC]:
-                data = resrow[-1].asOctets()
-                raw_data[oid_str] = ":".join([f"{x:02x}" for x in data])
-            elif oid_str == OIDS[ATTR_STATUS]:
-                raw_status = resrow[-1]._value  # noqa: SLF001
-            else:
-                raw_data[oid_str] = str(resrow[-1])
-
-        if raw_status is not None:
-            charset = raw_data.get(OIDS[ATTR_CHARSET], "unknown")
-
-            if TYPE_CHECKING:
-                assert isinstance(charset, str)
+        return list(restable)
+
+    async def _get_cmd(self, oids: list[ObjectType]) -> tuple[Any, Any, Any, Any]:
+        """Send SNMP GET request, hedged if the hedger is set.
+
+        The rate limits are awaited before the request, so the wait is not
+        a latency sample of the hedger, a duplicate is sent only if their
+        tokens are available without waiting.
+        """
+        await self._throttle()
+
+        if self._hedger is None:
+            return await get_cmd(*self._request_args, *oids)
+
+        async def request() -> tuple[Any, Any, Any, Any]:
+            # every call of get_cmd sends a request with a new request-id
+            return await get_cmd(*self._request_args, *oids)
+
+        async def single_try() -> tuple[Any, Any, Any, Any]:
+            # pysnmp keeps retransmitting a cancelled request, requests that
+            # may be duplicated are sent once, the duplicate is their resend
+            return await get_cmd(*self._single_try_request_args(), *oids)
+
+        # a reply with an error indication, e.g. a timeout, is not a win
+        return await self._hedger.async_run(
+            request,
+            failed=lambda result: bool(result[0]),
+            single_try=single_try,
+            try_acquire=self._try_throttle,
+            release=self._release_throttle,
+        )
 
-            encoding = CHARSET_MAP.get(charset, "roman8")
-            if status := self._decode_status(raw_status, encoding):
-                raw_data[OIDS[ATTR_STATUS]] = status
+    async def _throttle(self) -> None:
+        """Wait until rate limits allow an SNMP request."""
+        if self._rate_limiter:
+            await self._rate_limiter.async_acquire()
+        if self._subnet_limiter:
+            await self._subnet_limiter.async_acquire(self._address or self._host)
+
+    def _try_throttle(self) -> bool:
+        """Take tokens of the rate limits without waiting, False if any is out."""
+        if self._rate_limiter and not self._rate_limiter.try_acquire():
+            return False
+        if self._subnet_limiter and not self._subnet_limiter.try_acquire(
+            self._address or self._host
+        ):
+            if self._rate_limiter:
+                self._rate_limiter.release()
+            return False
+        return True
+
+    def _release_throttle(self) -> None:
+        """Return tokens of the rate limits taken but not used."""
+        if self._rate_limiter:
+            self._rate_limiter.release()
+        if self._subnet_limiter:
+            self._subnet_limiter.release(self._address or self._host)
+
+    async def _is_responding(self, oid: ObjectType) -> bool:
+        """Return True if the printer answers a request with a single varbind.
+
+        The request is sent once, so a printer that is offline costs a single
+        timeout on top of the retried request, not another retried request.
+        """
+        await self._throttle()
+        try:
+            errindication, errstatus, _, _ = await get_cmd(
+                *self._single_try_request_args(), oid
+            )
+        except PySnmpError:
+            return False
+        if errindication:
+            return False
+        if not errstatus:
+            self._max_answered = max(self._max_answered, 1)
+        return True
+
+    def _drop_unsupported_oid(self, err: SnmpNoSuchNameError) -> None:
+        """Stop requesting the OID the printer does not support."""
+        if (attr := OID_ATTRS.get(err.oid or "")) is None:
+            raise err
+        # model and serial are obligatory
+        if attr in REQUIRED_ATTRS:
+            raise UnsupportedModelError(
+                "It seems that this printer model is not supported"
+            ) from err
 
-        if self._legacy is False:
-            return raw_data
+        _LOGGER.debug("%s does not support %s, removing it", self._host, attr)
+        self._oids &= ~OID_BITS[attr]
 
-        # for legacy printers
-        for resrow in restable:
-            oid_str = str(resrow[0])
-            if oid_str == OIDS[ATTR_MAINTENANCE]:
-                # asOctets() gives bytes data
-                data = resrow[-1].asOctets()
-                # convert to string without checksum FF at the end, gives
-                # 'a101020414a201020c14a301020614a401020b14'
-                data_str = bytes_to_hex_string(data)
-                if self._legacy is None:
-                    self._legacy = self._legacy_printer(data_str)
-                if self._legacy:
-                    # split to 10 digits words in list, gives ['a101020414',
-                    # 'a201020c14', 'a301020614', 'a401020b14']
-                    result = [
-                        data_str[ind : ind + LEGACY_CHUNK_SIZE]
-                        for ind in range(0, len(data_str), LEGACY_CHUNK_SIZE)
-                    ]
-                    # map sensors names to OIDs
-                    raw_data[oid_str] = result
-                    break
-        return raw_data
+    def _single_try_request_args(
+        self,
+    ) -> tuple[SnmpEngine, CommunityData, UdpTransportTarget, ContextData]:
+        """Return SNMP request args using the transport without retransmits."""
+        if self._single_try_transport is None:
+            # the address is resolved already, a copy does not resolve it again
+            self._single_try_transport = copy(self._request_args[2])
+            self._single_try_transport.retries = 0
+        return (
+            self._request_args[0],
+            self._request_args[1],
+            self._single_try_transport,
+            self._request_args[3],
+        )
 
-    @staticmethod
-    def _legacy_printer(string: str) -> bool:
-        """Return True if printer is legacy."""
-        length = len(string)
-        nums = [x * LEGACY_CHUNK_SIZE for x in range(length // LEGACY_CHUNK_SIZE)][1:]
-        if results := [string[i - 2 : i] == "14" for i in nums]:
-            return all(item for item in results)
-        return False
+    def _oid_of(self, oid: ObjectType) -> str | None:
+        """Return numeric OID of a shared OID object."""
+        for slot, shared_oid in enumerate(self._oid_table):
+            if shared_oid is oid:
+                return OID_VALUES[slot]
+        return None
 
     @staticmethod
     def _iterate_oids(oids: Iterable) -> Generator:
         """Iterate OIDS to retrieve from printer."""
         for oid in oids:
             yield ObjectType(ObjectIdentity(oid))
-
-    @staticmethod
-    def _iterate_data(iterable: Iterable, values_map: dict[str, str]) -> Generator:
-        """Iterate data from hex words."""
-        for item in iterable:
-            # first byte means kind of sensor, last 4 bytes means value
-            if item[:2] in values_map:
-                if values_map[item[:2]] in PERCENT_VALUES:
-                    yield (values_map[item[:2]], round(int(item[-8:], 16) / 100))
-                else:
-                    yield (values_map[item[:2]], int(item[-8:], 16))
-
-    @staticmethod
-    def _iterate_data_legacy(
-        iterable: Iterable, values_map: dict[str, str]
-    ) -> Generator:
-        """Iterate data from hex words for legacy printers."""
-        for item in iterable:
-            # first byte means kind of sensor, last 4 bytes means value
-            if item[:2] in values_map:
-                yield (
-                    values_map[item[:2]],
-                    round(int(item[6:8], 16) / int(item[8:10], 16) * 100),
-                )
-
-    @staticmethod
-    def _cleanse_status(status: str) -> str:
-        """Cleanse and format status."""
-        return " ".join(status.split()).strip()
-
-    @staticmethod
-    def _decode_status(status: bytes, encoding: str) -> str | None:
-        """Decode status."""
-        _LOGGER.debug("Status: %s, encoding: %s", status, encoding)
-        try:
-            result = status.decode(encoding)
-        except UnicodeDecodeError:
-            return None
-        else:
-            return result
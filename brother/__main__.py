@@ -0,0 +1,210 @@
+"""Poll Brother printers from the command line and print NDJSON results."""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from collections.abc import Sequence
+from datetime import datetime
+from functools import partial
+from typing import Any, TextIO
+
+from pysnmp.hlapi.v3arch.asyncio import SnmpEngine
+
+from . import Brother
+from .const import DEFAULT_CONCURRENCY, PRINTER_TYPES
+from .ratelimit import SubnetRateLimiter, TokenBucket
+from .utils import async_gather_bounded, async_get_snmp_engine
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m brother",
+        description="Poll Brother printers and print one JSON line per printer.",
+    )
+    parser.add_argument("hosts", nargs="*", help="printer IP addresses or hostnames")
+    parser.add_argument(
+        "-f",
+        "--file",
+        help="file with one host per line, '-' reads standard input",
+    )
+    parser.add_argument("--port", type=int, default=161, help="SNMP port")
+    parser.add_argument("--community", default="public", help="SNMP community")
+    parser.add_argument(
+        "--printer-type",
+        choices=PRINTER_TYPES,
+        default="laser",
+        help="printer type used for hosts of unknown models",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="maximum number of printers polled at once",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        type=float,
+        metavar="SECONDS",
+        help="poll again every SECONDS until interrupted",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        metavar="REQUESTS",
+        help="maximum SNMP requests per second to every printer",
+    )
+    parser.add_argument(
+        "--subnet-rate",
+        type=float,
+        metavar="REQUESTS",
+        help="maximum SNMP requests per second to all printers in a /24 subnet",
+    )
+    parser.add_argument("--debug", action="store_true", help="enable debug logging")
+
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.watch is not None and args.watch <= 0:
+        parser.error("--watch must be greater than 0")
+    if args.rate is not None and args.rate <= 0:
+        parser.error("--rate must be greater than 0")
+    if args.subnet_rate is not None and args.subnet_rate <= 0:
+        parser.error("--subnet-rate must be greater than 0")
+    args.hosts = read_hosts(args.hosts, args.file)
+    if not args.hosts:
+        parser.error("no hosts given")
+    return args
+
+
+def read_hosts(hosts: Sequence[str], path: str | None) -> list[str]:
+    """Return unique hosts from arguments and the file.
+
+    Empty lines and lines starting with # are skipped.
+    """
+    lines = list(hosts)
+    if path == "-":
+        lines.extend(sys.stdin)
+    elif path:
+        with open(path, encoding="utf-8") as file:
+            lines.extend(file)
+    return list(
+        dict.fromkeys(
+            host
+            for line in lines
+            if (host := line.strip()) and not host.startswith("#")
+        )
+    )
+
+
+def _json_default(value: object) -> str:
+    """Serialize values not supported by json."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+class Poller:
+    """Poll hosts concurrently and write a JSON line for every result."""
+
+    def __init__(self, args: argparse.Namespace, output: TextIO) -> None:
+        """Initialize."""
+        self._args = args
+        self._output = output
+        self._printers: dict[str, Brother] = {}
+        self._snmp_engine: SnmpEngine | None = None
+        self._subnet_limiter = (
+            SubnetRateLimiter(args.subnet_rate) if args.subnet_rate else None
+        )
+
+    async def async_poll(self) -> int:
+        """Poll all hosts once and return the number of failed hosts."""
+        if self._snmp_engine is None:
+            self._snmp_engine = await async_get_snmp_engine()
+        hosts = self._args.hosts
+
+        def on_error(index: int, err: Exception) -> None:
+            self._write({"host": hosts[index], "error": str(err) or repr(err)})
+
+        results = await async_gather_bounded(
+            [partial(self._async_poll_host, host, self._snmp_engine) for host in hosts],
+            self._args.concurrency,
+            on_error,
+        )
+        return len(results) - results.count(None)
+
+    async def async_watch(self, interval: float) -> None:
+        """Poll all hosts every `interval` seconds."""
+        while True:
+            start = time.monotonic()
+            await self.async_poll()
+            await asyncio.sleep(max(interval - (time.monotonic() - start), 0))
+
+    def shutdown(self) -> None:
+        """Unconfigure SNMP engine of printers."""
+        for printer in self._printers.values():
+            printer.shutdown()
+
+    async def _async_poll_host(self, host: str, snmp_engine: SnmpEngine) -> None:
+        """Poll one host and write its result."""
+        if (printer := self._printers.get(host)) is None:
+            printer = await Brother.create(
+                host,
+                port=self._args.port,
+                community=self._args.community,
+                printer_type=self._args.printer_type,
+                snmp_engine=snmp_engine,
+                rate_limiter=TokenBucket(self._args.rate) if self._args.rate else None,
+                subnet_limiter=self._subnet_limiter,
+            )
+            self._printers[host] = printer
+        sensors = await printer.async_update()
+
+        self._write(
+            {
+                "host": host,
+                "model": printer.model,
+                "serial": printer.serial,
+                "firmware": printer.firmware,
+                "data": sensors.to_dict(),
+            }
+        )
+
+    def _write(self, result: dict[str, Any]) -> None:
+        """Write a result as a JSON line."""
+        self._output.write(json.dumps(result, default=_json_default) + "\n")
+        self._output.flush()
+
+
+async def async_main(args: argparse.Namespace, output: TextIO) -> int:
+    """Poll hosts, return exit code."""
+    poller = Poller(args, output)
+    try:
+        if args.watch is None:
+            return 1 if await poller.async_poll() else 0
+        await poller.async_watch(args.watch)
+    finally:
+        poller.shutdown()
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run command line interface."""
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.WARNING, stream=sys.stderr
+    )
+    try:
+        return asyncio.run(async_main(args, sys.stdout))
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
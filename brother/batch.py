@@ -0,0 +1,101 @@
+"""Columnar batch of Brother printers data."""
+
+import csv
+import json
+from array import array
+from collections.abc import Iterator, Mapping
+from dataclasses import fields
+from datetime import UTC, datetime
+from typing import IO, Any, Final
+
+from .const import ATTR_STATUS, ATTR_UPTIME
+from .model import BrotherSensors
+
+SENSOR_FIELDS: Final = tuple(field.name for field in fields(BrotherSensors))
+INT_FIELDS: Final = tuple(
+    name for name in SENSOR_FIELDS if name not in (ATTR_STATUS, ATTR_UPTIME)
+)
+
+
+class SensorsBatch:
+    """Per-field columns of data from many printers.
+
+    Integer fields are kept in `array.array("q")` columns and uptime in an
+    `array.array("d")` column of POSIX timestamps, each with a `bytearray` null
+    mask where 1 means the value is present.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.hosts: list[str] = []
+        self.status: list[str | None] = []
+        self._columns: dict[str, array] = {name: array("q") for name in INT_FIELDS}
+        self._columns[ATTR_UPTIME] = array("d")
+        self._masks: dict[str, bytearray] = {
+            name: bytearray() for name in self._columns
+        }
+
+    def __len__(self) -> int:
+        """Return the number of printers in the batch."""
+        return len(self.hosts)
+
+    def append(self, host: str, data: Mapping[str, Any]) -> None:
+        """Append decoded printer data, as returned by `async_update_data`."""
+        row = len(self.hosts)
+        self.hosts.append(host)
+        self.status.append(data.get(ATTR_STATUS))
+
+        # only present values are written, columns are padded lazily so the
+        # cost depends on the number of sensors the printer reports
+        for name, value in data.items():
+            if value is None or (column := self._columns.get(name)) is None:
+                continue
+            mask = self._masks[name]
+            if (missing := row - len(column)) > 0:
+                column.frombytes(bytes(missing * column.itemsize))
+                mask.extend(bytes(missing))
+            column.append(value.timestamp() if name == ATTR_UPTIME else value)
+            mask.append(1)
+
+    def append_sensors(self, host: str, sensors: BrotherSensors) -> None:
+        """Append printer data from a BrotherSensors object."""
+        self.append(host, vars(sensors))
+
+    def column(self, name: str) -> tuple[array, bytearray]:
+        """Return values and null mask of the column."""
+        if name not in self._columns:
+            raise KeyError(name)
+        column = self._columns[name]
+        mask = self._masks[name]
+        if (missing := len(self.hosts) - len(column)) > 0:
+            column.frombytes(bytes(missing * column.itemsize))
+            mask.extend(bytes(missing))
+        return column, mask
+
+    def iter_rows(self) -> Iterator[dict[str, Any]]:
+        """Iterate printers data as dicts of present values."""
+        columns = [(name, *self.column(name)) for name in self._columns]
+        for row, host in enumerate(self.hosts):
+            result: dict[str, Any] = {"host": host}
+            if (status := self.status[row]) is not None:
+                result[ATTR_STATUS] = status
+            for name, column, mask in columns:
+                if mask[row]:
+                    result[name] = column[row]
+            if ATTR_UPTIME in result:
+                result[ATTR_UPTIME] = datetime.fromtimestamp(
+                    result[ATTR_UPTIME], tz=UTC
+                ).isoformat()
+            yield result
+
+    def write_csv(self, file: IO[str]) -> None:
+        """Write the batch as CSV, missing values are empty cells."""
+        writer = csv.DictWriter(file, fieldnames=("host", *SENSOR_FIELDS))
+        writer.writeheader()
+        writer.writerows(self.iter_rows())
+
+    def write_ndjson(self, file: IO[str]) -> None:
+        """Write the batch as newline delimited JSON, one printer per line."""
+        for row in self.iter_rows():
+            file.write(json.dumps(row, ensure_ascii=False))
+            file.write("\n")
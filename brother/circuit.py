@@ -0,0 +1,119 @@
+"""Circuit breaker for unreachable Brother printers."""
+
+import logging
+import time
+from enum import StrEnum
+from types import TracebackType
+from typing import Final, Self
+
+from .exceptions import CircuitOpenError, SnmpTransportError
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD: Final = 3
+DEFAULT_BACKOFF: Final = 30.0
+DEFAULT_MAX_BACKOFF: Final = 3600.0
+
+# an error status proves the printer is up, only failed transport counts
+FAILURE_EXCEPTIONS: Final = (ConnectionError, SnmpTransportError, TimeoutError)
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast for a printer that does not respond.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    raise CircuitOpenError without touching the network. When the backoff time
+    passes, the circuit is half-open and one trial call is let through. Success
+    closes the circuit, failure opens it again with doubled backoff, capped at
+    `max_backoff` seconds.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+    ) -> None:
+        """Initialize."""
+        self._failure_threshold = failure_threshold
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._failures = 0
+        self._opened = 0
+        self._retry_at = 0.0
+        self._trial = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return circuit state."""
+        if self._opened == 0:
+            return CircuitState.CLOSED
+        if self._trial or time.monotonic() >= self._retry_at:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Return seconds until the next call is allowed."""
+        if self._opened == 0:
+            return 0.0
+        return max(self._retry_at - time.monotonic(), 0.0)
+
+    def allow_request(self) -> bool:
+        """Return True if a call would reach the printer."""
+        state = self.state
+        return state is CircuitState.CLOSED or (
+            state is CircuitState.HALF_OPEN and not self._trial
+        )
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        if self._opened:
+            _LOGGER.debug("Circuit closed")
+        self._failures = 0
+        self._opened = 0
+        self._trial = False
+
+    def record_failure(self) -> None:
+        """Record a failed call and open the circuit if needed."""
+        self._failures += 1
+        if not self._trial and self._failures < self._failure_threshold:
+            return
+        self._trial = False
+        backoff = min(self._backoff * 2**self._opened, self._max_backoff)
+        self._opened += 1
+        self._retry_at = time.monotonic() + backoff
+        _LOGGER.debug("Circuit opened for %s seconds", backoff)
+
+    def __enter__(self) -> Self:
+        """Check the circuit before a call."""
+        if not self.allow_request():
+            msg = f"Circuit is open, retry in {self.retry_in:.0f} seconds"
+            raise CircuitOpenError(msg)
+        if self._opened:
+            self._trial = True
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Record the result of a call."""
+        if exc_type is None:
+            self.record_success()
+        elif issubclass(exc_type, FAILURE_EXCEPTIONS):
+            self.record_failure()
+        else:
+            # the printer answered, e.g. with an error status or data of
+            # unsupported model
+            self._trial = False
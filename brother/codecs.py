@@ -0,0 +1,135 @@
+"""Codecs of binary records in counters and maintenance data of printers."""
+
+import struct
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Final
+
+from .const import PERCENT_VALUES
+
+# type and length bytes of a record with 4-byte value
+MODERN_RECORD_HEADER: Final = b"\x01\x04"
+# type and length bytes of a record with 2-byte value of legacy printers
+LEGACY_RECORD_HEADER: Final = b"\x01\x02"
+# denominator of values in records of legacy printers
+LEGACY_DENOMINATOR: Final = 0x14
+
+
+@dataclass(frozen=True)
+class RecordCodec:
+    """Format of data made of fixed size records.
+
+    `record_format` is a struct format of one record, the first field is the
+    code of the value. `value` converts the unpacked record to the value of the
+    sensor, the second argument is True if the value is a percentage. `detect`
+    returns True if data, without the checksum byte, is in this format.
+    """
+
+    name: str
+    record_format: str
+    value: Callable[[tuple[int, ...], bool], int]
+    detect: Callable[[bytes], bool]
+    record: struct.Struct = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile record format."""
+        object.__setattr__(self, "record", struct.Struct(self.record_format))
+
+    @property
+    def record_size(self) -> int:
+        """Return size of a record in bytes."""
+        return self.record.size
+
+    def records(self, data: bytes) -> Iterator[tuple[int, ...]]:
+        """Iterate records of data, an incomplete last record is skipped."""
+        end = len(data) - len(data) % self.record.size
+        return self.record.iter_unpack(memoryview(data)[:end])
+
+    def compile(self, values_map: Mapping[str, str]) -> "RecordParser":
+        """Return parser of data in this format for the map of hex codes."""
+        return RecordParser(
+            self,
+            {
+                int(code, 16): (name, name in PERCENT_VALUES)
+                for code, name in values_map.items()
+            },
+        )
+
+
+@dataclass(frozen=True)
+class RecordParser:
+    """Parser of data in a format to sensor values."""
+
+    codec: RecordCodec
+    values: Mapping[int, tuple[str, bool]]
+
+    def __call__(self, data: bytes) -> Iterator[tuple[str, int]]:
+        """Iterate (sensor name, value) of records with known codes."""
+        values = self.values
+        value = self.codec.value
+        for record in self.codec.records(data):
+            if (item := values.get(record[0])) is not None:
+                yield item[0], value(record, item[1])
+
+
+def _detect_modern(data: bytes) -> bool:
+    """Return True if data is made of records with 4-byte value."""
+    return all(
+        data[ind + 1 : ind + 3] == MODERN_RECORD_HEADER
+        for ind in range(0, len(data), 7)
+    )
+
+
+def _detect_legacy(data: bytes) -> bool:
+    """Return True if data is made of percentage records of legacy printers.
+
+    Every record has 1-byte numerator and denominator, the denominator of all
+    records except the last is 20.
+    """
+    end = len(data) // 5 * 5
+    return (
+        end >= 10  # noqa: PLR2004
+        and all(
+            data[ind + 1 : ind + 3] == LEGACY_RECORD_HEADER for ind in range(0, end, 5)
+        )
+        and all(data[ind] == LEGACY_DENOMINATOR for ind in range(4, end - 5, 5))
+    )
+
+
+MODERN_CODEC: Final = RecordCodec(
+    name="modern",
+    # code, type and length bytes, value
+    record_format=">B2xI",
+    value=lambda record, percent: round(record[1] / 100) if percent else record[1],
+    detect=_detect_modern,
+)
+
+LEGACY_CODEC: Final = RecordCodec(
+    name="legacy",
+    # code, type and length bytes, numerator, denominator
+    record_format=">B2xBB",
+    value=lambda record, _: round(record[1] / record[2] * 100),
+    detect=_detect_legacy,
+)
+
+# codecs in the order of detection, the modern codec is the fallback
+CODECS: list[RecordCodec] = [LEGACY_CODEC, MODERN_CODEC]
+
+
+def register_codec(codec: RecordCodec) -> None:
+    """Register codec of a new format, it is detected before known formats."""
+    CODECS.insert(0, codec)
+
+
+def detect_codec(data: bytes) -> RecordCodec:
+    """Return codec of data, without the checksum byte."""
+    for codec in CODECS:
+        if codec.detect(data):
+            return codec
+    return MODERN_CODEC
+
+
+def split_records(data: bytes) -> list[str]:
+    """Split data to records as hex strings, the format of fixtures."""
+    size = detect_codec(data).record_size
+    return [data[ind : ind + size].hex() for ind in range(0, len(data), size)]
@@ -15,7 +15,14 @@ ATTR_STATUS: Final = "status"
 ATTR_UPTIME: Final = "uptime"
 
 OID_DATETIME: Final = "1.3.6.1.2.1.25.1.2.0"
+
+# Printer-MIB prtMarkerSuppliesTable columns
+OID_SUPPLIES_DESCRIPTION: Final = "1.3.6.1.2.1.43.11.1.1.6"
+OID_SUPPLIES_MAX_CAPACITY: Final = "1.3.6.1.2.1.43.11.1.1.8"
+OID_SUPPLIES_LEVEL: Final = "1.3.6.1.2.1.43.11.1.1.9"
+SUPPLIES_MAX_REPETITIONS: Final = 16
 DATEANDTIME_MIN_LENGTH: Final = 8
+DATEANDTIME_LENGTHS: Final = (8, 11)
 
 DEFAULT_WRITE_COMMUNITY: Final = "internal"
 
@@ -209,9 +216,38 @@ OIDS_HEX: Final = (
     OIDS[ATTR_NEXTCARE],
 )
 
+# position of every OIDS attribute in raw data and in the shared OID table
+OID_SLOTS: Final = {attr: slot for slot, attr in enumerate(OIDS)}
+SLOT_CHARSET: Final = OID_SLOTS[ATTR_CHARSET]
+SLOT_COUNTERS: Final = OID_SLOTS[ATTR_COUNTERS]
+SLOT_FIRMWARE: Final = OID_SLOTS[ATTR_FIRMWARE]
+SLOT_MAC: Final = OID_SLOTS[ATTR_MAC]
+SLOT_MAINTENANCE: Final = OID_SLOTS[ATTR_MAINTENANCE]
+SLOT_MODEL: Final = OID_SLOTS[ATTR_MODEL]
+SLOT_NEXTCARE: Final = OID_SLOTS[ATTR_NEXTCARE]
+SLOT_PAGE_COUNT: Final = OID_SLOTS[ATTR_PAGE_COUNT]
+SLOT_SERIAL: Final = OID_SLOTS[ATTR_SERIAL]
+SLOT_STATUS: Final = OID_SLOTS[ATTR_STATUS]
+SLOT_UPTIME: Final = OID_SLOTS[ATTR_UPTIME]
+# True for slots with hex records
+HEX_SLOTS: Final = tuple(oid in OIDS_HEX for oid in OIDS.values())
+
 UNSUPPORTED_MODELS: Final = ("mfc-8660dn", "mfc-8860dn")
 
 DATETIME_SET_SUPPORTED_MODELS: Final = ("dcp-j552dw",)
 
+STATUS_CACHE_SIZE: Final = 256
+
+OID_TABLE_CACHE_KEY: Final = "brother_oid_table"
+
+RESOLVE_TTL: Final = 300
+RESOLVE_NEGATIVE_TTL: Final = 30
+
 DEFAULT_TIMEOUT: Final = 2
 RETRIES: Final = 10
+# the probe of an unknown model, a request retried until it timed out, a single
+# try request and the split requests
+PROBE_TIMEOUT: Final = 2 * DEFAULT_TIMEOUT * (RETRIES + 1)
+
+# printers polled at the same time by operations on many printers
+DEFAULT_CONCURRENCY: Final = 64
@@ -0,0 +1,89 @@
+"""Vectorized decoding of many recorded counters and maintenance blobs."""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Final, NamedTuple, cast
+
+import numpy as np
+
+from .const import PERCENT_VALUES
+
+# code, type and length bytes, big-endian 4-byte value, as MODERN_CODEC
+RECORD_DTYPE: Final = np.dtype([("code", "u1"), ("header", "V2"), ("value", ">u4")])
+
+
+class DecodedRecords(NamedTuple):
+    """Known records of many blobs, one element per record in blob order."""
+
+    # index of the blob the record comes from
+    blob: np.ndarray
+    # index of the sensor name in `names`
+    name: np.ndarray
+    # decoded value, percentages are already scaled
+    value: np.ndarray
+    names: tuple[str, ...]
+    blobs: int
+
+    def to_dicts(self) -> list[dict[str, int]]:
+        """Return a dict of values for every blob, as the parser of the codec."""
+        result: list[dict[str, int]] = [{} for _ in range(self.blobs)]
+        names = self.names
+        for blob, name, value in zip(
+            self.blob.tolist(), self.name.tolist(), self.value.tolist(), strict=True
+        ):
+            result[blob][names[name]] = value
+        return result
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Return a column per sensor name with NaN for blobs without the value.
+
+        When a blob has more records of the same sensor the last one is used.
+        """
+        result = {name: np.full(self.blobs, np.nan) for name in self.names}
+        key = self.blob * len(self.names) + self.name
+        # the first occurrence in the reversed keys is the last record
+        _, index = np.unique(key[::-1], return_index=True)
+        last = len(key) - 1 - index
+        for name_index, name in enumerate(self.names):
+            selected = last[self.name[last] == name_index]
+            result[name][self.blob[selected]] = self.value[selected]
+        return result
+
+
+def decode_blobs(
+    blobs: Sequence[bytes], values_map: Mapping[str, str]
+) -> DecodedRecords:
+    """Decode blobs of records with 4-byte values at once.
+
+    Blobs are raw data slots, bytes without the checksum, in the format of
+    MODERN_CODEC. An incomplete last record of a blob is skipped, records with
+    codes missing in `values_map` are left out. Values are equal to those
+    yielded by the compiled parser of MODERN_CODEC.
+    """
+    names = tuple(dict.fromkeys(values_map.values()))
+    name_lut = np.full(256, -1, dtype=np.int16)
+    percent_lut = np.zeros(256, dtype=bool)
+    for code, name in values_map.items():
+        name_lut[int(code, 16)] = names.index(name)
+        percent_lut[int(code, 16)] = name in PERCENT_VALUES
+
+    size = RECORD_DTYPE.itemsize
+    counts = np.fromiter((len(blob) // size for blob in blobs), np.int64, len(blobs))
+    buffer = b"".join(blob[: len(blob) - len(blob) % size] for blob in blobs)
+    records = cast(
+        np.ndarray[Any, np.dtype[np.void]], np.frombuffer(buffer, dtype=RECORD_DTYPE)
+    )
+
+    codes = records["code"]
+    name = name_lut[codes]
+    known = name >= 0
+    raw = records["value"][known].astype(np.int64)
+    # np.rint rounds half to even as round() does
+    value = np.where(percent_lut[codes[known]], np.rint(raw / 100), raw)
+
+    return DecodedRecords(
+        blob=np.repeat(np.arange(len(blobs)), counts)[known],
+        name=name[known].astype(np.int64),
+        value=value.astype(np.int64),
+        names=names,
+        blobs=len(blobs),
+    )
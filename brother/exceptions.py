@@ -14,9 +14,35 @@ class SnmpError(BrotherError):
     """Raised when SNMP request ended in error."""
 
 
+class SnmpTransportError(SnmpError):
+    """Raised when SNMP request got no valid reply, e.g. it timed out."""
+
+
+class SnmpSetError(SnmpError):
+    """Raised when the printer rejected a varbind of SNMP SET request."""
+
+    def __init__(self, status: str, oid: str | None = None) -> None:
+        """Initialize."""
+        super().__init__(status)
+        self.oid = oid
+
+
+class SnmpNoSuchNameError(SnmpError):
+    """Raised when the printer does not know an OID of SNMP GET request."""
+
+    def __init__(self, status: str, oid: str | None = None) -> None:
+        """Initialize."""
+        super().__init__(status)
+        self.oid = oid
+
+
 class UnsupportedModelError(BrotherError):
     """Raised when no model, serial no, firmware data."""
 
 
 class MethodNotSupportedError(BrotherError):
     """Raised when a method is not supported by the printer model."""
+
+
+class CircuitOpenError(BrotherError):
+    """Raised when the printer is skipped because its circuit is open."""
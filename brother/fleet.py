@@ -0,0 +1,67 @@
+"""Operations on many Brother printers at once."""
+
+import logging
+from collections.abc import Iterable, Mapping
+from functools import partial
+
+from . import Brother
+from .const import DEFAULT_CONCURRENCY
+from .pipeline import ResultPipeline
+from .utils import async_gather_bounded, build_set_varbinds
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_set_fleet(
+    printers: Iterable[Brother],
+    values: Mapping[str, object],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, Exception | None]:
+    """Set the same values on many printers concurrently.
+
+    Values are validated once before any request is sent. Returns a dict
+    mapping host to None on success or to the exception raised for that host.
+    """
+    build_set_varbinds(values)
+    printers = list(printers)
+
+    def on_error(index: int, err: Exception) -> None:
+        _LOGGER.debug("Failed to set values on %s: %s", printers[index].host, err)
+
+    results = await async_gather_bounded(
+        [partial(printer.async_set, values) for printer in printers],
+        concurrency,
+        on_error,
+    )
+    return {
+        printer.host: result for printer, result in zip(printers, results, strict=True)
+    }
+
+
+async def async_update_fleet(
+    printers: Iterable[Brother],
+    pipeline: ResultPipeline,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, Exception | None]:
+    """Update many printers concurrently and publish results to the pipeline.
+
+    A printer keeps its concurrency slot until its result is accepted by the
+    pipeline, so with the BLOCK policy slow consumers slow down polling.
+    Returns a dict mapping host to None on success or to the exception raised
+    for that host.
+    """
+    printers = list(printers)
+
+    async def update(printer: Brother) -> None:
+        sensors = await printer.async_update()
+        await pipeline.async_publish(printer.host, sensors)
+
+    def on_error(index: int, err: Exception) -> None:
+        _LOGGER.debug("Failed to update %s: %s", printers[index].host, err)
+
+    results = await async_gather_bounded(
+        [partial(update, printer) for printer in printers], concurrency, on_error
+    )
+    return {
+        printer.host: result for printer, result in zip(printers, results, strict=True)
+    }
@@ -0,0 +1,187 @@
+"""Consumable depletion forecasting for Brother printers."""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, fields
+from datetime import UTC, datetime
+from typing import Final, NamedTuple
+
+import numpy as np
+
+from .const import ATTR_PAGE_COUNT
+from .model import BrotherSensors
+
+FORECAST_FIELDS: Final = tuple(
+    field.name
+    for field in fields(BrotherSensors)
+    if field.name.endswith(("_remaining", "_remaining_life", "_remaining_pages"))
+)
+
+SECONDS_PER_DAY: Final = 86400
+MIN_SAMPLES: Final = 2
+
+
+class ForecastArrays(NamedTuple):
+    """Per-series forecast results, one element per input row."""
+
+    # consumable units lost per second, NaN when not enough samples
+    rate_per_second: np.ndarray
+    # consumable units lost per printed page, NaN without page counter data
+    rate_per_page: np.ndarray
+    # POSIX timestamp when the consumable reaches 0, NaN when not depleting
+    run_out: np.ndarray
+    # pages left until the consumable reaches 0, NaN when not depleting
+    pages_left: np.ndarray
+
+
+@dataclass(frozen=True)
+class DepletionForecast:
+    """Depletion forecast for one consumable of one printer."""
+
+    rate_per_day: float
+    rate_per_page: float | None
+    run_out: datetime | None
+    pages_left: int | None
+
+
+def _current_cycle(values: np.ndarray) -> np.ndarray:
+    """Return a mask of samples taken since the last consumable replacement."""
+    # a replaced consumable shows up as a value increase, everything before the
+    # last increase belongs to the previous cartridge, drum, etc.
+    rows, cols = values.shape
+    increased = np.zeros((rows, cols), dtype=bool)
+    if cols > 1:
+        increased[:, 1:] = np.diff(values, axis=1) > 0
+    # index of the last increase in each row, 0 when there was none
+    last = cols - 1 - np.argmax(increased[:, ::-1], axis=1)
+    last[~increased.any(axis=1)] = 0
+    return np.arange(cols) >= last[:, None]
+
+
+def _linear_fit(
+    x: np.ndarray, y: np.ndarray, mask: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fit y = a * x + b for every row and return slope, mean x and mean y."""
+    count = mask.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_x = np.where(mask, x, 0).sum(axis=1) / count
+        mean_y = np.where(mask, y, 0).sum(axis=1) / count
+        dx = np.where(mask, x - mean_x[:, None], 0)
+        dy = np.where(mask, y - mean_y[:, None], 0)
+        slope = (dx * dy).sum(axis=1) / (dx * dx).sum(axis=1)
+    slope[count < MIN_SAMPLES] = np.nan
+    slope[~np.isfinite(slope)] = np.nan
+    return slope, mean_x, mean_y
+
+
+def forecast_arrays(
+    timestamps: np.ndarray, values: np.ndarray, pages: np.ndarray | None = None
+) -> ForecastArrays:
+    """Forecast depletion for many series at once.
+
+    All arguments are 2D arrays of shape (series, samples) ordered by time, with
+    NaN for missing samples. Timestamps are POSIX seconds, pages is the page
+    counter read together with the value.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(timestamps) & ~np.isnan(values)
+    # forward fill gaps so a replacement is detected across missing samples
+    last_valid = np.maximum.accumulate(
+        np.where(valid, np.arange(values.shape[1]), 0), axis=1
+    )
+    filled = np.take_along_axis(values, last_valid, axis=1)
+    valid &= _current_cycle(filled)
+
+    slope, mean_t, mean_v = _linear_fit(timestamps, values, valid)
+    depleting = slope < 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        run_out = np.where(depleting, mean_t - mean_v / slope, np.nan)
+
+    if pages is None:
+        rate_per_page = np.full(len(values), np.nan)
+        pages_left = np.full(len(values), np.nan)
+    else:
+        pages = np.asarray(pages, dtype=np.float64)
+        page_valid = valid & ~np.isnan(pages)
+        page_slope, mean_p, mean_pv = _linear_fit(pages, values, page_valid)
+        last_page = np.where(page_valid, pages, -np.inf).max(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pages_left = np.where(
+                page_slope < 0,
+                np.maximum(mean_p - mean_pv / page_slope - last_page, 0),
+                np.nan,
+            )
+        rate_per_page = -page_slope
+
+    return ForecastArrays(
+        rate_per_second=-slope,
+        rate_per_page=rate_per_page,
+        run_out=run_out,
+        pages_left=pages_left,
+    )
+
+
+def forecast_fleet(
+    histories: Mapping[str, Sequence[tuple[datetime, BrotherSensors]]],
+    consumables: Sequence[str] = FORECAST_FIELDS,
+) -> dict[str, dict[str, DepletionForecast]]:
+    """Forecast depletion for every consumable of every printer.
+
+    Histories map a printer identifier to its (time, sensors) samples ordered by
+    time. Consumables that are never reported by a printer are left out.
+    """
+    keys: list[tuple[str, str]] = []
+    rows_time: list[list[float]] = []
+    rows_value: list[list[float]] = []
+    rows_pages: list[list[float]] = []
+
+    for printer, history in histories.items():
+        times = [dt.timestamp() for dt, _ in history]
+        pages = [
+            float(value)
+            if (value := getattr(sensors, ATTR_PAGE_COUNT)) is not None
+            else np.nan
+            for _, sensors in history
+        ]
+        for consumable in consumables:
+            samples = [getattr(sensors, consumable) for _, sensors in history]
+            if all(sample is None for sample in samples):
+                continue
+            keys.append((printer, consumable))
+            rows_time.append(times)
+            rows_value.append(
+                [np.nan if sample is None else float(sample) for sample in samples]
+            )
+            rows_pages.append(pages)
+
+    result: dict[str, dict[str, DepletionForecast]] = {}
+    if not keys:
+        return result
+
+    width = max(len(row) for row in rows_time)
+    forecast = forecast_arrays(
+        _pad(rows_time, width), _pad(rows_value, width), _pad(rows_pages, width)
+    )
+
+    for index, (printer, consumable) in enumerate(keys):
+        run_out = forecast.run_out[index]
+        pages_left = forecast.pages_left[index]
+        rate_per_page = forecast.rate_per_page[index]
+        result.setdefault(printer, {})[consumable] = DepletionForecast(
+            rate_per_day=float(forecast.rate_per_second[index] * SECONDS_PER_DAY),
+            rate_per_page=None if np.isnan(rate_per_page) else float(rate_per_page),
+            run_out=None
+            if np.isnan(run_out)
+            else datetime.fromtimestamp(float(run_out), tz=UTC),
+            pages_left=None if np.isnan(pages_left) else int(pages_left),
+        )
+
+    return result
+
+
+def _pad(rows: list[list[float]], width: int) -> np.ndarray:
+    """Return rows as a 2D array padded with NaN to the given width."""
+    array = np.full((len(rows), width), np.nan)
+    for index, row in enumerate(rows):
+        array[index, : len(row)] = row
+    return array
@@ -0,0 +1,146 @@
+"""Hedged requests for printers with a long latency tail."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, Final, TypeVar
+
+from .utils import nearest_rank
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PERCENTILE: Final = 90
+DEFAULT_BUDGET: Final = 0.05
+DEFAULT_MAX_TOKENS: Final = 10.0
+DEFAULT_MIN_SAMPLES: Final = 20
+DEFAULT_MAX_SAMPLES: Final = 100
+DEFAULT_MIN_DELAY: Final = 0.005
+
+_T = TypeVar("_T")
+
+
+class Hedger:
+    """Send a duplicate request when the first one is slower than usual.
+
+    Latencies of the printer are tracked and when a request does not complete
+    within their `percentile`, one duplicate request is sent, the first
+    completed request wins and the other is cancelled. Every request earns
+    `budget` tokens, up to `max_tokens`, and a duplicate costs one token, so
+    at most `budget` of requests are duplicated in the long run. Use one
+    instance per printer.
+
+    Cancelling only abandons the awaiting of a request, a request that
+    retransmits by itself, as pysnmp does, keeps sending. Requests that may
+    be duplicated are therefore sent with `single_try`, which sends the
+    request once, so a hedged request sends two datagrams at most. The
+    duplicate is also a request of rate limits, `try_acquire` takes its token
+    without waiting and the request is not hedged when there is none.
+    """
+
+    def __init__(
+        self,
+        percentile: int = DEFAULT_PERCENTILE,
+        budget: float = DEFAULT_BUDGET,
+        max_tokens: float = DEFAULT_MAX_TOKENS,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        min_delay: float = DEFAULT_MIN_DELAY,
+    ) -> None:
+        """Initialize."""
+        self._percentile = percentile
+        self._budget = budget
+        self._max_tokens = max_tokens
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._samples: deque[float] = deque(maxlen=max_samples)
+        self._tokens = 0.0
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    @property
+    def delay(self) -> float | None:
+        """Return time after which a request is hedged, None without samples."""
+        if len(self._samples) < self._min_samples:
+            return None
+        return max(
+            nearest_rank(sorted(self._samples), self._percentile), self._min_delay
+        )
+
+    async def async_run(
+        self,
+        request: Callable[[], Awaitable[_T]],
+        *,
+        failed: Callable[[_T], bool] | None = None,
+        single_try: Callable[[], Awaitable[_T]] | None = None,
+        try_acquire: Callable[[], bool] | None = None,
+        release: Callable[[], None] | None = None,
+    ) -> _T:
+        """Run request, send a duplicate if it is slow and the budget allows.
+
+        When a duplicate may be sent, its token and the token of `try_acquire`
+        are reserved and both requests are made with `single_try` if given,
+        the tokens are returned, the latter with `release`, when the request
+        completes within the delay. A request that raises, or whose
+        result `failed` returns True for, does not win while the other request
+        is pending and is not a latency sample. When both requests fail, the
+        outcome of the first one is returned.
+        """
+        self.requests += 1
+        self._tokens = min(self._tokens + self._budget, self._max_tokens)
+        delay = self.delay
+        if hedging := (
+            delay is not None
+            and self._tokens >= 1
+            and (try_acquire is None or try_acquire())
+        ):
+            self._tokens -= 1
+            request = single_try or request
+        start = time.monotonic()
+        tasks = [asyncio.ensure_future(request())]
+
+        try:
+            if hedging:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if done:
+                    self._tokens = min(self._tokens + 1, self._max_tokens)
+                    if release:
+                        release()
+                else:
+                    self.hedged += 1
+                    tasks.append(asyncio.ensure_future(request()))
+                    _LOGGER.debug("Hedging request after %.3f s", delay)
+
+            while True:
+                succeeded = [
+                    task for task in tasks if task.done() and _succeeded(task, failed)
+                ]
+                pending = [task for task in tasks if not task.done()]
+                if succeeded or not pending:
+                    break
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            winner = succeeded[0] if succeeded else tasks[0]
+            if winner is not tasks[0]:
+                self.hedge_wins += 1
+            result = winner.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # mark the exception of the other request as retrieved
+                    task.exception()
+
+        if succeeded:
+            self._samples.append(time.monotonic() - start)
+        return result
+
+
+def _succeeded(task: asyncio.Future[Any], failed: Callable[[Any], bool] | None) -> bool:
+    """Return True if the completed request succeeded."""
+    if task.cancelled() or task.exception() is not None:
+        return False
+    return failed is None or not failed(task.result())
@@ -1,7 +1,12 @@
 """Type definitions for Brother."""
 
-from dataclasses import dataclass
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
 from datetime import datetime
+from typing import Any, Final, Self
+
+_JSON_ENCODER: Final = json.JSONEncoder(separators=(",", ":"))
 
 
 @dataclass(frozen=True)
@@ -69,3 +74,55 @@ class BrotherSensors:
     yellow_toner_remaining: int | None = None
     yellow_toner_status: int | None = None
     yellow_toner: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a dict of present values, faster than dataclasses.asdict."""
+        return {key: value for key, value in self.__dict__.items() if value is not None}
+
+    def to_json(self) -> bytes:
+        """Return present values as compact JSON, uptime in ISO 8601 format."""
+        data = self.to_dict()
+        if (uptime := data.get("uptime")) is not None:
+            data["uptime"] = uptime.isoformat()
+        return _JSON_ENCODER.encode(data).encode()
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Self:
+        """Create sensors from a dict of values without type checking.
+
+        Unknown keys are ignored, uptime may be an ISO 8601 string.
+        """
+        values = {key: value for key, value in data.items() if key in _SENSOR_FIELDS}
+        if isinstance(uptime := values.get("uptime"), str):
+            values["uptime"] = datetime.fromisoformat(uptime)
+        return cls(**values)
+
+    @classmethod
+    def from_json(cls, data: bytes | str) -> Self:
+        """Create sensors from JSON created by to_json."""
+        return cls.from_dict(json.loads(data))
+
+
+_SENSOR_FIELDS: Final = frozenset(field.name for field in fields(BrotherSensors))
+
+
+@dataclass(frozen=True)
+class BrotherSupply:
+    """Marker supply from the Printer-MIB supplies table."""
+
+    index: str
+    description: str
+    level: int
+    max_capacity: int
+    # None when the printer does not report exact level
+    remaining: int | None
+
+
+@dataclass(frozen=True)
+class ModelProfile:
+    """Capabilities of a printer model family."""
+
+    oids: tuple[str, ...]
+    legacy: bool
+    printer_type: str
+    datetime_set_supported: bool
@@ -0,0 +1,170 @@
+"""Bounded pipeline of printer results between pollers and consumers."""
+
+import asyncio
+import itertools
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Final, NamedTuple, Self
+
+from .model import BrotherSensors
+
+DEFAULT_MAX_SIZE: Final = 1024
+
+
+class OverflowPolicy(StrEnum):
+    """What to do with a new result when the pipeline is full."""
+
+    # wait until a consumer takes a result, this slows down polling
+    BLOCK = "block"
+    # discard the oldest queued result
+    DROP_OLDEST = "drop_oldest"
+    # replace a queued result of the same host, otherwise wait
+    COALESCE = "coalesce"
+
+
+class PipelineItem(NamedTuple):
+    """Result of polling one printer."""
+
+    host: str
+    sensors: BrotherSensors
+
+
+@dataclass(frozen=True)
+class PipelineStats:
+    """Counters of a pipeline."""
+
+    depth: int
+    max_depth: int
+    published: int
+    delivered: int
+    dropped: int
+    coalesced: int
+    blocked: int
+
+
+class ResultPipeline:
+    """Queue results of polls for consumers with bounded memory.
+
+    At most `max_size` results are queued. When the pipeline is full, new
+    results are handled according to `policy`. With COALESCE a host has at
+    most one queued result, a newer result replaces it in place, so the queue
+    is bounded by the number of hosts even when consumers stall. Iterate the
+    pipeline with `async for` until it is closed and empty.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        """Initialize."""
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+
+        self._max_size = max_size
+        self._policy = policy
+        self._items: OrderedDict[Hashable, PipelineItem] = OrderedDict()
+        self._sequence = itertools.count()
+        self._condition = asyncio.Condition()
+        self._closed = False
+        self._max_depth = 0
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._blocked = 0
+
+    @property
+    def policy(self) -> OverflowPolicy:
+        """Return overflow policy."""
+        return self._policy
+
+    @property
+    def depth(self) -> int:
+        """Return the number of queued results."""
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        """Return True if the pipeline does not accept new results."""
+        return self._closed
+
+    @property
+    def stats(self) -> PipelineStats:
+        """Return counters of the pipeline."""
+        return PipelineStats(
+            depth=len(self._items),
+            max_depth=self._max_depth,
+            published=self._published,
+            delivered=self._delivered,
+            dropped=self._dropped,
+            coalesced=self._coalesced,
+            blocked=self._blocked,
+        )
+
+    async def async_publish(self, host: str, sensors: BrotherSensors) -> None:
+        """Queue a result, wait for free space if the policy requires it."""
+        item = PipelineItem(host, sensors)
+        coalesce = self._policy is OverflowPolicy.COALESCE
+
+        async with self._condition:
+            waited = False
+            while True:
+                if self._closed:
+                    msg = "Pipeline is closed"
+                    raise RuntimeError(msg)
+                if coalesce and host in self._items:
+                    self._items[host] = item
+                    self._published += 1
+                    self._coalesced += 1
+                    return
+                if len(self._items) < self._max_size:
+                    break
+                if self._policy is OverflowPolicy.DROP_OLDEST:
+                    self._items.popitem(last=False)
+                    self._dropped += 1
+                    break
+                if not waited:
+                    self._blocked += 1
+                    waited = True
+                await self._condition.wait()
+
+            self._items[host if coalesce else next(self._sequence)] = item
+            self._published += 1
+            self._max_depth = max(self._max_depth, len(self._items))
+            self._condition.notify_all()
+
+    async def async_get(self) -> PipelineItem:
+        """Return the oldest result, wait for one if the pipeline is empty.
+
+        Raises RuntimeError when the pipeline is closed and empty.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._items or self._closed)
+            if not self._items:
+                msg = "Pipeline is closed"
+                raise RuntimeError(msg)
+            _, item = self._items.popitem(last=False)
+            self._delivered += 1
+            self._condition.notify_all()
+        return item
+
+    async def async_close(self) -> None:
+        """Stop accepting results, queued results can still be consumed."""
+        async with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def __aiter__(self) -> Self:
+        """Return async iterator of results."""
+        return self
+
+    async def __anext__(self) -> PipelineItem:
+        """Return the next result."""
+        try:
+            return await self.async_get()
+        except RuntimeError:
+            raise StopAsyncIteration from None
@@ -0,0 +1,232 @@
+"""Capabilities of known printer models.
+
+Generated by scripts/generate_profiles.py from tests/fixtures, do not edit.
+"""
+
+from typing import Final
+
+from .model import ModelProfile
+
+MODEL_PROFILES: Final = {
+    "dcp-1618w": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="laser",
+        datetime_set_supported=False,
+    ),
+    "dcp-7070dw": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="laser",
+        datetime_set_supported=False,
+    ),
+    "dcp-9020cdw": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="laser",
+        datetime_set_supported=False,
+    ),
+    "dcp-j132w": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="ink",
+        datetime_set_supported=False,
+    ),
+    "dcp-l2540dn": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="laser",
+        datetime_set_supported=False,
+    ),
+    "dcp-l3550cdw": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="laser",
+        datetime_set_supported=False,
+    ),
+    "hl-2270dw": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="laser",
+        datetime_set_supported=False,
+    ),
+    "hl-5350dn": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="laser",
+        datetime_set_supported=False,
+    ),
+    "hl-l2340dw": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="laser",
+        datetime_set_supported=False,
+    ),
+    "mfc-5490cn": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=True,
+        printer_type="ink",
+        datetime_set_supported=False,
+    ),
+    "mfc-j680dw": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="ink",
+        datetime_set_supported=False,
+    ),
+    "mfc-t910dw": ModelProfile(
+        oids=(
+            "charset",
+            "counters",
+            "firmware",
+            "mac",
+            "maintenance",
+            "model",
+            "nextcare",
+            "page_counter",
+            "serial",
+            "status",
+            "uptime",
+        ),
+        legacy=False,
+        printer_type="ink",
+        datetime_set_supported=False,
+    ),
+}
+
+
+def get_model_profile(model: str) -> ModelProfile | None:
+    """Return capabilities of the printer model, or None if the model is unknown."""
+    return MODEL_PROFILES.get(model.lower().removesuffix(" series"))
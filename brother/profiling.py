@@ -0,0 +1,163 @@
+"""Opt-in profiling of printer polling."""
+
+import json
+import logging
+import os
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Final
+
+from .utils import nearest_rank
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILING_ENV: Final = "BROTHER_PROFILING"
+PROFILING_TRACEMALLOC_ENV: Final = "BROTHER_PROFILING_TRACEMALLOC"
+
+PHASE_POLL: Final = "poll"
+PHASE_INITIALIZE: Final = "initialize"
+PHASE_GET_DATA: Final = "get_data"
+PHASE_PROCESS_VARBINDS: Final = "process_varbinds"
+PHASE_DECODE: Final = "decode"
+PHASE_FROM_DICT: Final = "from_dict"
+
+DEFAULT_REPORT_INTERVAL: Final = 60.0
+DEFAULT_MAX_SAMPLES: Final = 10000
+PERCENTILES: Final = (50, 95, 99)
+TRACEMALLOC_TOP: Final = 10
+
+_default_profiler: "Profiler | None" = None
+
+
+class Profiler:
+    """Collect timings of polling phases and report aggregated summaries.
+
+    Every phase keeps the last `max_samples` durations. Every
+    `report_interval` seconds, on the end of a poll, a summary with p50, p95
+    and p99 of every phase is appended as a JSON line to `output`, or logged
+    when no output file is given, and samples are cleared. With
+    `trace_memory` the peak of traced memory during a poll above the memory
+    traced at its start is measured with tracemalloc and the summary lists
+    top allocation sites. Tracing is process-wide, so the peak of a poll
+    includes memory of polls running concurrently.
+    """
+
+    def __init__(
+        self,
+        output: str | Path | None = None,
+        *,
+        report_interval: float = DEFAULT_REPORT_INTERVAL,
+        trace_memory: bool = False,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+    ) -> None:
+        """Initialize."""
+        self._output = Path(output) if output else None
+        self._report_interval = report_interval
+        self._trace_memory = trace_memory
+        self._max_samples = max_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._peaks: deque[int] = deque(maxlen=max_samples)
+        self._last_report = time.monotonic()
+
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None]:
+        """Measure duration of a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_sample(name, time.perf_counter() - start)
+
+    @contextmanager
+    def poll(self) -> Generator[None]:
+        """Measure a whole poll and report the summary when it is due."""
+        memory_start = 0
+        if self._trace_memory:
+            tracemalloc.reset_peak()
+            memory_start = tracemalloc.get_traced_memory()[0]
+        try:
+            with self.phase(PHASE_POLL):
+                yield
+        finally:
+            if self._trace_memory:
+                self._peaks.append(tracemalloc.get_traced_memory()[1] - memory_start)
+            if time.monotonic() - self._last_report >= self._report_interval:
+                self.report()
+
+    def summary(self) -> dict[str, Any]:
+        """Return aggregated timings in milliseconds."""
+        result: dict[str, Any] = {
+            name: {
+                "count": len(samples),
+                **{
+                    f"p{percentile}": round(
+                        nearest_rank(sorted(samples), percentile) * 1000, 3
+                    )
+                    for percentile in PERCENTILES
+                },
+            }
+            for name, samples in self._samples.items()
+            if samples
+        }
+        if self._peaks:
+            peaks = sorted(self._peaks)
+            result["peak_bytes"] = {
+                f"p{percentile}": int(nearest_rank(peaks, percentile))
+                for percentile in PERCENTILES
+            }
+        return result
+
+    def report(self) -> None:
+        """Write the summary and clear samples."""
+        summary = self.summary()
+        if self._trace_memory and tracemalloc.is_tracing():
+            summary["top_allocations"] = [
+                str(stat)
+                for stat in tracemalloc.take_snapshot().statistics("lineno")[
+                    :TRACEMALLOC_TOP
+                ]
+            ]
+        self._samples.clear()
+        self._peaks.clear()
+        self._last_report = time.monotonic()
+
+        if not summary:
+            return
+        if self._output is None:
+            _LOGGER.info("Profiling summary: %s", summary)
+            return
+        try:
+            with open(self._output, "a", encoding="utf-8") as file:
+                file.write(json.dumps(summary) + "\n")
+        except OSError:
+            _LOGGER.exception("Failed to write profiling summary")
+
+    def _add_sample(self, name: str, duration: float) -> None:
+        """Add a phase duration."""
+        if (samples := self._samples.get(name)) is None:
+            samples = self._samples[name] = deque(maxlen=self._max_samples)
+        samples.append(duration)
+
+
+def get_default_profiler() -> Profiler | None:
+    """Return profiler shared by all instances when enabled by environment.
+
+    BROTHER_PROFILING set to 1 logs summaries, any other value is a path of
+    the output file. BROTHER_PROFILING_TRACEMALLOC set to 1 traces memory.
+    """
+    global _default_profiler  # noqa: PLW0603
+
+    value = os.environ.get(PROFILING_ENV)
+    if _default_profiler is None and value and value != "0":
+        _default_profiler = Profiler(
+            output=None if value == "1" else value,
+            trace_memory=os.environ.get(PROFILING_TRACEMALLOC_ENV) == "1",
+        )
+    return _default_profiler
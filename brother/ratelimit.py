@@ -0,0 +1,114 @@
+"""Token bucket rate limiting of SNMP requests."""
+
+import asyncio
+import ipaddress
+import time
+from typing import Final
+
+DEFAULT_SUBNET_PREFIX: Final = 24
+
+
+def _check_limits(rate: float, burst: float) -> None:
+    """Raise ValueError if the rate or burst is invalid."""
+    if rate <= 0 or burst < 1:
+        msg = "rate must be greater than 0 and burst at least 1"
+        raise ValueError(msg)
+
+
+class TokenBucket:
+    """Let through at most `rate` requests per second with bursts of `burst`.
+
+    Waiting requests are let through in the order of arrival.
+    """
+
+    def __init__(self, rate: float, burst: float = 1) -> None:
+        """Initialize."""
+        _check_limits(rate, burst)
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Return requests per second."""
+        return self._rate
+
+    async def async_acquire(self) -> None:
+        """Wait until a request is allowed."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def try_acquire(self) -> bool:
+        """Take a token without waiting, return False if there is none."""
+        # waiting requests go first
+        if self._lock.locked():
+            return False
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def release(self) -> None:
+        """Return a token that was taken but not used."""
+        self._tokens = min(self._tokens + 1, self._burst)
+
+    def _refill(self) -> None:
+        """Add tokens earned since the last update."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._updated) * self._rate, self._burst
+        )
+        self._updated = now
+
+
+class SubnetRateLimiter:
+    """Share a token bucket between all printers in the same subnet.
+
+    Printers are grouped by the IPv4 network of their address with the given
+    prefix length, e.g. a /24 site, hosts that are not IP addresses have their
+    own bucket.
+    """
+
+    def __init__(
+        self, rate: float, burst: float = 1, prefix: int = DEFAULT_SUBNET_PREFIX
+    ) -> None:
+        """Initialize."""
+        _check_limits(rate, burst)
+        self._rate = rate
+        self._burst = burst
+        self._prefix = prefix
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def subnet(self, address: str) -> str:
+        """Return subnet of the address."""
+        try:
+            return str(ipaddress.ip_network(f"{address}/{self._prefix}", strict=False))
+        except ValueError:
+            return address
+
+    async def async_acquire(self, address: str) -> None:
+        """Wait until a request to the address is allowed."""
+        await self._bucket(address).async_acquire()
+
+    def try_acquire(self, address: str) -> bool:
+        """Take a token of the address without waiting, False if there is none."""
+        return self._bucket(address).try_acquire()
+
+    def release(self, address: str) -> None:
+        """Return a token of the address that was taken but not used."""
+        self._bucket(address).release()
+
+    def _bucket(self, address: str) -> TokenBucket:
+        """Return token bucket of the subnet of the address."""
+        subnet = self.subnet(address)
+        if (bucket := self._buckets.get(subnet)) is None:
+            bucket = self._buckets[subnet] = TokenBucket(self._rate, self._burst)
+        return bucket
@@ -0,0 +1,118 @@
+"""Record raw printer responses to fixture files."""
+
+import json
+import logging
+import queue
+import re
+import threading
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+from .const import ATTR_STATUS, CHARSET_MAP, OIDS, SLOT_CHARSET
+from .utils import raw_data_to_dict
+
+_LOGGER = logging.getLogger(__name__)
+
+REGEX_UNSAFE_CHARS = re.compile(r"[^\w.-]")
+
+
+class Recorder:
+    """Write printer responses to JSON files from a background thread.
+
+    For every response two files are written, `<host>-<time>.json` in the
+    tests/fixtures format, with the status as reported by the printer, and
+    `<host>-<time>.raw.json` with raw octets of every varbind as hex string,
+    including checksum bytes.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize."""
+        self._directory = Path(directory)
+        self._queue: queue.SimpleQueue[
+            tuple[str, datetime, list[Any], Sequence[Any]] | None
+        ] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def record(
+        self, host: str, raw_data: Sequence[Any], varbinds: Sequence[Any]
+    ) -> None:
+        """Queue a printer response, raw data as a list of OIDS slots."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="brother-recorder", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((host, datetime.now(tz=UTC), list(raw_data), varbinds))
+
+    def close(self) -> None:
+        """Write queued responses and stop the writer thread."""
+        with self._lock:
+            if self._thread is None:
+                return
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        """Enter context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit context."""
+        self.close()
+
+    def _run(self) -> None:
+        """Write queued responses."""
+        while (item := self._queue.get()) is not None:
+            try:
+                self._write(*item)
+            except (OSError, TypeError, ValueError):
+                _LOGGER.exception("Failed to record response from %s", item[0])
+
+    def _write(
+        self,
+        host: str,
+        timestamp: datetime,
+        raw_data: list[Any],
+        varbinds: Sequence[Any],
+    ) -> None:
+        """Write response files."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        name = f"{REGEX_UNSAFE_CHARS.sub('_', host)}-{timestamp:%Y%m%dT%H%M%S%f}"
+
+        fixture = raw_data_to_dict(raw_data)
+        raw_octets: dict[str, str] = {}
+        for resrow in varbinds:
+            oid, value = str(resrow[0]), resrow[-1]
+            raw_octets[oid] = (
+                value.asOctets().hex() if hasattr(value, "asOctets") else str(value)
+            )
+            if oid == OIDS[ATTR_STATUS]:
+                # raw data holds the cleansed status, fixtures the decoded one
+                encoding = CHARSET_MAP.get(
+                    raw_data[SLOT_CHARSET] or "unknown", "roman8"
+                )
+                try:
+                    fixture[oid] = value.asOctets().decode(encoding)
+                except UnicodeDecodeError:
+                    fixture.pop(oid, None)
+
+        for suffix, data in (
+            (".json", fixture),
+            (".raw.json", raw_octets),
+        ):
+            with open(
+                self._directory / f"{name}{suffix}", "w", encoding="utf-8"
+            ) as file:
+                json.dump(data, file, indent=2, ensure_ascii=False)
+                file.write("\n")
@@ -0,0 +1,197 @@
+"""Share Brother instances between users of the same printer."""
+
+import asyncio
+import logging
+from contextlib import suppress
+from types import TracebackType
+from typing import Self
+
+from pysnmp.error import PySnmpError
+from pysnmp.hlapi.v3arch.asyncio import CommunityData, SnmpEngine
+from pysnmp.hlapi.v3arch.asyncio.cmdgen import LCD
+
+from . import Brother
+from .const import DEFAULT_WRITE_COMMUNITY
+from .model import BrotherSensors
+from .utils import async_get_snmp_engine
+
+_LOGGER = logging.getLogger(__name__)
+
+DeviceKey = tuple[str, int, str]
+
+
+class _SharedDevice:
+    """Brother instance of one endpoint with the number of open handles."""
+
+    def __init__(self, init: asyncio.Task[Brother], communities: set[str]) -> None:
+        """Initialize."""
+        self.init = init
+        self.communities = communities
+        self.refs = 0
+        self.poll: asyncio.Task[BrotherSensors] | None = None
+
+
+class DeviceHandle:
+    """Handle of a shared Brother instance, close it when no longer needed."""
+
+    def __init__(
+        self, registry: "DeviceRegistry", key: DeviceKey, device: _SharedDevice
+    ) -> None:
+        """Initialize."""
+        self._registry = registry
+        self._key = key
+        self._device: _SharedDevice | None = device
+        self._brother = device.init.result()
+
+    @property
+    def brother(self) -> Brother:
+        """Return shared Brother instance."""
+        return self._brother
+
+    @property
+    def closed(self) -> bool:
+        """Return True if the handle is closed."""
+        return self._device is None
+
+    async def async_update(self, *, timeout: float | None = None) -> BrotherSensors:
+        """Update data from printer, join a poll already in progress.
+
+        `timeout` caps the wait in seconds and a poll started by this call,
+        TimeoutError is raised when it passes.
+        """
+        if (device := self._device) is None:
+            msg = "Device handle is closed"
+            raise RuntimeError(msg)
+
+        if device.poll is None:
+            device.poll = asyncio.create_task(
+                self._brother.async_update(timeout=timeout)
+            )
+            device.poll.add_done_callback(lambda _: setattr(device, "poll", None))
+        # one caller giving up does not cancel the poll of the others
+        async with asyncio.timeout(timeout):
+            return await asyncio.shield(device.poll)
+
+    def close(self) -> None:
+        """Release the handle, the last one releases the printer."""
+        if self._device is None:
+            return
+        device, self._device = self._device, None
+        self._registry._release(self._key, device)  # noqa: SLF001
+
+    async def __aenter__(self) -> Self:
+        """Enter context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit context."""
+        self.close()
+
+
+class DeviceRegistry:
+    """Hand out shared handles of Brother instances per endpoint.
+
+    All handles of the same (host, port, community) share one Brother
+    instance, so the printer is initialized once, its transport and probe
+    results are reused and concurrent polls are joined. Options of the first
+    acquire are used for the instance. The instance is dropped when its last
+    handle is closed, together with the engine configuration of its
+    communities not used by other printers, and the SNMP engine created by the
+    registry is released when no printers are left.
+    """
+
+    def __init__(self, snmp_engine: SnmpEngine | None = None) -> None:
+        """Initialize."""
+        self._snmp_engine = snmp_engine
+        self._own_engine = snmp_engine is None
+        self._devices: dict[DeviceKey, _SharedDevice] = {}
+
+    def __len__(self) -> int:
+        """Return the number of shared printers."""
+        return len(self._devices)
+
+    async def async_acquire(
+        self,
+        host: str,
+        port: int = 161,
+        community: str = "public",
+        printer_type: str | None = None,
+        model: str | None = None,
+        write_community: str = DEFAULT_WRITE_COMMUNITY,
+    ) -> DeviceHandle:
+        """Return a handle of the printer, initialize it on the first acquire."""
+        key = (host, port, community)
+        if key not in self._devices and self._snmp_engine is None:
+            snmp_engine = await async_get_snmp_engine()
+            # another acquire may have created the engine in the meantime
+            if self._snmp_engine is None:
+                self._snmp_engine = snmp_engine
+            else:
+                snmp_engine.close_dispatcher()
+
+        if (device := self._devices.get(key)) is None:
+            device = _SharedDevice(
+                asyncio.create_task(
+                    Brother.create(
+                        host,
+                        port=port,
+                        community=community,
+                        printer_type=printer_type,
+                        model=model,
+                        snmp_engine=self._snmp_engine,
+                        write_community=write_community,
+                    )
+                ),
+                {community, write_community},
+            )
+            self._devices[key] = device
+
+        device.refs += 1
+        try:
+            await asyncio.shield(device.init)
+        except BaseException:
+            # a failed initialization is not kept, the next acquire retries it
+            self._release(key, device)
+            raise
+        return DeviceHandle(self, key, device)
+
+    def _release(self, key: DeviceKey, device: _SharedDevice) -> None:
+        """Release a reference to the device."""
+        device.refs -= 1
+        init = device.init
+        failed = init.done() and (init.cancelled() or init.exception() is not None)
+        if (failed or device.refs == 0) and self._devices.get(key) is device:
+            del self._devices[key]
+        if device.refs > 0:
+            return
+
+        init.cancel()
+        if device.poll is not None:
+            device.poll.cancel()
+        _LOGGER.debug("Released %s", key[0])
+
+        if not self._own_engine or self._snmp_engine is None:
+            return
+
+        if self._devices:
+            # printers of the same community share its configuration
+            in_use = set().union(
+                *(other.communities for other in self._devices.values())
+            )
+            for community in device.communities - in_use:
+                # unknown when the printer did not send any request
+                with suppress(PySnmpError):
+                    LCD.unconfigure(
+                        self._snmp_engine, CommunityData(community, mpModel=0)
+                    )
+            return
+
+        # configuration of the engine is shared by all printers
+        LCD.unconfigure(self._snmp_engine, None)
+        self._snmp_engine.close_dispatcher()
+        self._snmp_engine = None
@@ -0,0 +1,200 @@
+"""Poll large fleets of Brother printers from many processes."""
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from typing import Any, Final
+
+from . import Brother
+from .const import DEFAULT_CONCURRENCY
+from .utils import async_gather_bounded, async_get_snmp_engine
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_RESTARTS: Final = 3
+QUEUE_POLL_INTERVAL: Final = 0.5
+
+
+@dataclass(frozen=True)
+class PollOptions:
+    """Options used by workers to poll printers."""
+
+    port: int = 161
+    community: str = "public"
+    printer_type: str = "laser"
+    concurrency: int = DEFAULT_CONCURRENCY
+
+
+@dataclass(frozen=True)
+class ShardResult:
+    """Result of polling one printer."""
+
+    host: str
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+WorkerTarget = Callable[[int, Sequence[str], Queue, PollOptions], None]
+
+
+def split_hosts(hosts: Sequence[str], shards: int) -> list[list[str]]:
+    """Split hosts into shards of similar size."""
+    return [list(hosts[index::shards]) for index in range(shards)]
+
+
+async def async_poll_shard(
+    worker_id: int, hosts: Sequence[str], results: Queue, options: PollOptions
+) -> None:
+    """Poll hosts with one SNMP engine and put results into the queue."""
+    snmp_engine = await async_get_snmp_engine()
+
+    async def poll(host: str) -> None:
+        brother = await Brother.create(
+            host,
+            port=options.port,
+            community=options.community,
+            printer_type=options.printer_type,
+            snmp_engine=snmp_engine,
+        )
+        data = await brother.async_update_data()
+        results.put((worker_id, ShardResult(host, data=data)))
+
+    def on_error(index: int, err: Exception) -> None:
+        results.put((worker_id, ShardResult(hosts[index], error=repr(err))))
+
+    await async_gather_bounded(
+        [partial(poll, host) for host in hosts], options.concurrency, on_error
+    )
+
+
+def poll_shard(
+    worker_id: int, hosts: Sequence[str], results: Queue, options: PollOptions
+) -> None:
+    """Worker process entry point, poll hosts on a new event loop."""
+    asyncio.run(async_poll_shard(worker_id, hosts, results, options))
+    # tell the parent that the shard is complete
+    results.put((worker_id, None))
+
+
+class ShardedPoller:
+    """Split a host list across worker processes and aggregate their results.
+
+    Every worker runs its own event loop and SNMP engine. A worker that dies
+    before finishing its shard is restarted with the hosts it did not report,
+    up to `max_restarts` times, after that those hosts are reported as failed.
+    """
+
+    def __init__(
+        self,
+        hosts: Sequence[str],
+        workers: int = 1,
+        options: PollOptions | None = None,
+        max_restarts: int = DEFAULT_MAX_RESTARTS,
+        worker_target: WorkerTarget = poll_shard,
+    ) -> None:
+        """Initialize."""
+        self._shards = [shard for shard in split_hosts(hosts, workers) if shard]
+        self._options = options or PollOptions()
+        self._max_restarts = max_restarts
+        self._worker_target = worker_target
+        self._context = multiprocessing.get_context("spawn")
+        self.restarts = 0
+
+    def _start(
+        self, worker_id: int, hosts: Sequence[str], results: Queue
+    ) -> BaseProcess:
+        """Start a worker process."""
+        process = self._context.Process(
+            target=self._worker_target,
+            args=(worker_id, hosts, results, self._options),
+            daemon=True,
+        )
+        process.start()
+        return process
+
+    def poll(self) -> Iterator[ShardResult]:
+        """Poll all hosts and yield results as they arrive."""
+        results: Queue = self._context.Queue()
+        pending = {
+            worker_id: Counter(shard) for worker_id, shard in enumerate(self._shards)
+        }
+        processes = {
+            worker_id: self._start(worker_id, shard, results)
+            for worker_id, shard in enumerate(self._shards)
+        }
+        restarts = dict.fromkeys(processes, 0)
+
+        try:
+            while processes:
+                try:
+                    message = results.get(timeout=QUEUE_POLL_INTERVAL)
+                except queue.Empty:
+                    pass
+                else:
+                    yield from self._handle(message, pending, processes)
+
+                for worker_id, process in list(processes.items()):
+                    if process.is_alive():
+                        continue
+                    # everything a dead worker sent is already in the queue
+                    yield from self._drain(results, pending, processes)
+                    if worker_id not in processes:
+                        continue
+
+                    hosts = list(pending[worker_id].elements())
+                    if restarts[worker_id] < self._max_restarts:
+                        _LOGGER.warning(
+                            "Worker %s exited with code %s, restarting",
+                            worker_id,
+                            process.exitcode,
+                        )
+                        restarts[worker_id] += 1
+                        self.restarts += 1
+                        processes[worker_id] = self._start(worker_id, hosts, results)
+                        continue
+
+                    _LOGGER.error("Worker %s failed too many times", worker_id)
+                    del processes[worker_id]
+                    for host in hosts:
+                        yield ShardResult(host, error="Worker process failed")
+        finally:
+            for process in processes.values():
+                process.terminate()
+            results.close()
+
+    @classmethod
+    def _drain(
+        cls,
+        results: Queue,
+        pending: dict[int, Counter[str]],
+        processes: dict[int, BaseProcess],
+    ) -> Iterator[ShardResult]:
+        """Handle all messages waiting in the queue."""
+        while True:
+            try:
+                message = results.get_nowait()
+            except queue.Empty:
+                return
+            yield from cls._handle(message, pending, processes)
+
+    @staticmethod
+    def _handle(
+        message: tuple[int, ShardResult | None],
+        pending: dict[int, Counter[str]],
+        processes: dict[int, BaseProcess],
+    ) -> Iterator[ShardResult]:
+        """Handle a message from a worker."""
+        worker_id, result = message
+        if result is None:
+            if (process := processes.pop(worker_id, None)) is not None:
+                process.join()
+            return
+        pending[worker_id][result.host] -= 1
+        yield result
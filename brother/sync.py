@@ -0,0 +1,185 @@
+"""Blocking client for Brother printers, for use from synchronous code."""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import CancelledError
+from datetime import datetime
+from types import TracebackType
+from typing import Any, Self, TypeVar
+
+from pysnmp.hlapi.v3arch.asyncio import SnmpEngine
+from pysnmp.hlapi.v3arch.asyncio.cmdgen import LCD
+
+from . import Brother
+from .const import DEFAULT_WRITE_COMMUNITY
+from .model import BrotherSensors
+from .utils import _get_snmp_engine
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class BrotherClient:
+    """Thread-safe blocking client for many Brother printers.
+
+    The client owns one event loop running in a background thread and one SNMP
+    engine. Calls from any thread are run on that loop, so printers are polled
+    concurrently. Brother instances are created on the first call for a host
+    and reused by later calls.
+    """
+
+    def __init__(
+        self,
+        port: int = 161,
+        community: str = "public",
+        printer_type: str = "laser",
+        write_community: str = DEFAULT_WRITE_COMMUNITY,
+    ) -> None:
+        """Initialize."""
+        self._port = port
+        self._community = community
+        self._printer_type = printer_type
+        self._write_community = write_community
+        self._devices: dict[str, asyncio.Task[Brother]] = {}
+        # calls running on the loop, only used from the loop thread
+        self._calls: set[asyncio.Task[Any]] = set()
+        self._lock = threading.Lock()
+        self._snmp_engine: SnmpEngine = _get_snmp_engine()
+        self._loop = asyncio.new_event_loop()
+        self._thread: threading.Thread | None = threading.Thread(
+            target=self._loop.run_forever, name="brother-sync", daemon=True
+        )
+        self._thread.start()
+
+    def update(self, host: str, *, timeout: float | None = None) -> BrotherSensors:
+        """Update data from printer.
+
+        `timeout` caps the whole call in seconds, initialization of a new
+        printer included, TimeoutError is raised when it passes.
+        """
+        return self._call(self._async_update(host), timeout)
+
+    def get_datetime(
+        self, host: str, *, timeout: float | None = None
+    ) -> datetime | None:
+        """Get date and time from printer."""
+        return self._call(self._async_get_datetime(host), timeout)
+
+    def set_datetime(
+        self, host: str, dt: datetime | None = None, *, timeout: float | None = None
+    ) -> None:
+        """Set date and time on printer."""
+        self._call(self._async_set_datetime(host, dt), timeout)
+
+    def close(self) -> None:
+        """Stop the event loop and release the SNMP engine.
+
+        Calls still in progress in other threads raise RuntimeError.
+        """
+        with self._lock:
+            if self._thread is None:
+                return
+            thread, self._thread = self._thread, None
+
+        asyncio.run_coroutine_threadsafe(self._async_close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> Self:
+        """Enter context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit context."""
+        self.close()
+
+    def _call(self, coro: Coroutine[Any, Any, _T], timeout: float | None) -> _T:
+        """Run coroutine on the event loop and wait for the result."""
+        with self._lock:
+            if self._thread is None:
+                coro.close()
+                msg = "Client is closed"
+                raise RuntimeError(msg)
+            future = asyncio.run_coroutine_threadsafe(
+                self._async_call(coro, timeout), self._loop
+            )
+        try:
+            return future.result()
+        except CancelledError:
+            if self._thread is None:
+                msg = "Client is closed"
+                raise RuntimeError(msg) from None
+            raise
+
+    async def _async_call(
+        self, coro: Coroutine[Any, Any, _T], timeout: float | None
+    ) -> _T:
+        """Run coroutine, cancel it when the timeout passes or on close."""
+        if task := asyncio.current_task():
+            self._calls.add(task)
+        try:
+            async with asyncio.timeout(timeout):
+                return await coro
+        finally:
+            if task:
+                self._calls.discard(task)
+
+    async def _async_get_device(self, host: str) -> Brother:
+        """Return Brother instance for host, create it on the first call."""
+        if (task := self._devices.get(host)) is None:
+            task = self._loop.create_task(
+                Brother.create(
+                    host,
+                    port=self._port,
+                    community=self._community,
+                    printer_type=self._printer_type,
+                    snmp_engine=self._snmp_engine,
+                    write_community=self._write_community,
+                )
+            )
+            self._devices[host] = task
+
+        try:
+            return await asyncio.shield(task)
+        except BaseException:
+            # do not keep a failed initialization, the next call retries it
+            if task.done() and self._devices.get(host) is task:
+                del self._devices[host]
+            raise
+
+    async def _async_update(self, host: str) -> BrotherSensors:
+        """Update data from printer."""
+        brother = await self._async_get_device(host)
+        return await brother.async_update()
+
+    async def _async_get_datetime(self, host: str) -> datetime | None:
+        """Get date and time from printer."""
+        brother = await self._async_get_device(host)
+        return await brother.async_get_datetime()
+
+    async def _async_set_datetime(self, host: str, dt: datetime | None) -> None:
+        """Set date and time on printer."""
+        brother = await self._async_get_device(host)
+        await brother.async_set_datetime(dt)
+
+    async def _async_close(self) -> None:
+        """Cancel calls and initializations and unconfigure the SNMP engine."""
+        for call in self._calls:
+            call.cancel()
+        await asyncio.gather(*self._calls, return_exceptions=True)
+        for task in self._devices.values():
+            task.cancel()
+        await asyncio.gather(*self._devices.values(), return_exceptions=True)
+        self._devices.clear()
+        LCD.unconfigure(self._snmp_engine, None)
+        self._snmp_engine.close_dispatcher()
+        _LOGGER.debug("Client closed")
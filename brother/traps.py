@@ -0,0 +1,166 @@
+"""Receive SNMP notifications from Brother printers."""
+
+import asyncio
+import logging
+import socket
+from collections.abc import Callable
+from types import TracebackType
+from typing import Final, Self
+
+from pysnmp.carrier.asyncio.dgram import udp
+from pysnmp.entity import config
+from pysnmp.entity.rfc3413 import ntfrcv
+from pysnmp.hlapi.v3arch.asyncio import SnmpEngine
+
+from . import Brother
+from .model import BrotherSensors
+from .utils import HOST_ERRORS, async_get_snmp_engine, async_resolve_host
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TRAP_PORT: Final = 162
+TRAP_COMMUNITY_INDEX: Final = "brother-traps"
+
+UpdateCallback = Callable[[Brother, BrotherSensors], None]
+
+
+class TrapListener:
+    """Update printers as soon as they send an SNMP notification.
+
+    Printers send traps on status changes, e.g. paper jam or empty toner. A
+    notification from a known printer triggers async_update() of the matching
+    Brother instance and the result is passed to `on_update`. Notifications
+    received while that printer is updating trigger one more update after it,
+    so a burst of traps does not flood the printer with requests.
+    """
+
+    def __init__(
+        self,
+        on_update: UpdateCallback,
+        host: str = "0.0.0.0",  # noqa: S104
+        port: int = DEFAULT_TRAP_PORT,
+        community: str = "public",
+    ) -> None:
+        """Initialize."""
+        self._on_update = on_update
+        self._host = host
+        self._port = port
+        self._community = community
+        self._printers: dict[str, Brother] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._pending: set[str] = set()
+        self._snmp_engine: SnmpEngine | None = None
+
+    @property
+    def port(self) -> int:
+        """Return UDP port the listener is bound to."""
+        return self._port
+
+    async def async_add(self, printer: Brother) -> None:
+        """Add printer whose notifications trigger an update."""
+        address = await async_resolve_host(printer.host)
+        self._printers[address] = printer
+
+    def remove(self, printer: Brother) -> None:
+        """Remove printer."""
+        for address in [
+            address for address, item in self._printers.items() if item is printer
+        ]:
+            del self._printers[address]
+
+    async def async_start(self) -> None:
+        """Start listening for notifications."""
+        if self._snmp_engine is not None:
+            return
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.bind((self._host, self._port))
+        except OSError as err:
+            sock.close()
+            raise ConnectionError(err) from err
+        self._port = sock.getsockname()[1]
+
+        snmp_engine = await async_get_snmp_engine()
+        config.add_transport(
+            snmp_engine,
+            udp.DOMAIN_NAME,
+            udp.UdpAsyncioTransport().open_server_mode(sock=sock),
+        )
+        config.add_v1_system(snmp_engine, TRAP_COMMUNITY_INDEX, self._community)
+        ntfrcv.NotificationReceiver(snmp_engine, self._receive)
+        snmp_engine.transport_dispatcher.job_started(1)
+        self._snmp_engine = snmp_engine
+        _LOGGER.debug("Listening for notifications on %s:%s", self._host, self._port)
+
+    def stop(self) -> None:
+        """Stop listening and cancel running updates."""
+        for task in self._tasks.values():
+            task.cancel()
+        self._pending.clear()
+
+        if self._snmp_engine is None:
+            return
+        self._snmp_engine.transport_dispatcher.job_finished(1)
+        self._snmp_engine.close_dispatcher()
+        self._snmp_engine = None
+
+    async def __aenter__(self) -> Self:
+        """Enter context."""
+        await self.async_start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit context."""
+        self.stop()
+
+    def _receive(
+        self,
+        snmp_engine: SnmpEngine,
+        _state_reference: object,
+        _context_engine_id: object,
+        _context_name: object,
+        _varbinds: object,
+        _cb_ctx: object,
+    ) -> None:
+        """Handle a notification received by the SNMP engine."""
+        context = snmp_engine.observer.get_execution_context(
+            "rfc3412.receiveMessage:request"
+        )
+        address = context["transportAddress"][0]
+
+        if (printer := self._printers.get(address)) is None:
+            _LOGGER.debug("Notification from unknown host %s", address)
+            return
+
+        _LOGGER.debug("Notification from %s", printer.host)
+        if address in self._tasks:
+            self._pending.add(address)
+            return
+        self._tasks[address] = asyncio.create_task(self._async_update(address, printer))
+
+    async def _async_update(self, address: str, printer: Brother) -> None:
+        """Update printer until no notification is pending."""
+        try:
+            while True:
+                self._pending.discard(address)
+                try:
+                    data = await printer.async_update()
+                except HOST_ERRORS as err:
+                    _LOGGER.warning(
+                        "Update of %s after notification failed: %s", printer.host, err
+                    )
+                except Exception:
+                    # a bug must not stop updates after later notifications
+                    _LOGGER.exception("Unexpected error updating %s", printer.host)
+                else:
+                    self._on_update(printer, data)
+                if address not in self._pending:
+                    break
+        finally:
+            del self._tasks[address]
@@ -1,12 +1,46 @@
 """Utils for Brother."""
 
 import asyncio
+import logging
+import re
+import socket
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Final
 
-from pysnmp.hlapi.v3arch.asyncio import SnmpEngine
+from pyasn1.type.base import SimpleAsn1Type
+from pysnmp.hlapi.v3arch.asyncio import ObjectIdentity, SnmpEngine
 from pysnmp.hlapi.varbinds import MibViewControllerManager
+from pysnmp.proto.rfc1902 import OctetString
+from pysnmp.smi.rfc1902 import ObjectType
 
-from .const import DATEANDTIME_MIN_LENGTH
+from .codecs import split_records
+from .const import (
+    DATEANDTIME_LENGTHS,
+    DATEANDTIME_MIN_LENGTH,
+    DEFAULT_CONCURRENCY,
+    HEX_SLOTS,
+    OID_DATETIME,
+    OID_TABLE_CACHE_KEY,
+    OIDS,
+    RESOLVE_NEGATIVE_TTL,
+    RESOLVE_TTL,
+    SLOT_STATUS,
+    STATUS_CACHE_SIZE,
+)
+from .exceptions import BrotherError
+
+_LOGGER = logging.getLogger(__name__)
+
+REGEX_NUMERIC_OID = re.compile(r"^\d+(?:\.\d+)+$")
+
+# expected errors of a single printer, e.g. unreachable or unsupported
+HOST_ERRORS: Final = (ConnectionError, BrotherError, TimeoutError)
+
+# host -> (expiry time, IPv4 address or None when the host could not be resolved)
+_RESOLVE_CACHE: dict[str, tuple[float, str | None]] = {}
 
 
 async def async_get_snmp_engine() -> SnmpEngine:
@@ -27,6 +61,84 @@ def _get_snmp_engine() -> SnmpEngine:
     return engine
 
 
+def get_oid_table(snmp_engine: SnmpEngine) -> tuple[ObjectType, ...]:
+    """Return resolved OIDS objects shared by all instances using the engine.
+
+    The objects are in OIDS order and are resolved against the MIB view of the
+    engine once, pysnmp skips resolution of an already resolved ObjectType.
+    """
+    if (oid_table := snmp_engine.cache.get(OID_TABLE_CACHE_KEY)) is None:
+        mib_view_controller = MibViewControllerManager.get_mib_view_controller(
+            snmp_engine.cache
+        )
+        oid_table = tuple(
+            ObjectType(ObjectIdentity(oid)).resolve_with_mib(mib_view_controller)
+            for oid in OIDS.values()
+        )
+        snmp_engine.cache[OID_TABLE_CACHE_KEY] = oid_table
+    return oid_table
+
+
+def raw_data_from_dict(data: Mapping[str, Any]) -> list[Any]:
+    """Convert raw data keyed by OID, e.g. a fixture, to a list of OIDS slots.
+
+    Records, hex strings in fixtures, are joined to bytes and the status is
+    cleansed as decode_status() does.
+    """
+    raw_data = [data.get(oid) for oid in OIDS.values()]
+    for slot, hex_slot in enumerate(HEX_SLOTS):
+        if hex_slot and isinstance(records := raw_data[slot], list):
+            raw_data[slot] = bytes.fromhex("".join(records))
+    # statuses in fixtures are decoded text, polls have them also cleansed
+    if isinstance(status := raw_data[SLOT_STATUS], str):
+        raw_data[SLOT_STATUS] = cleanse_status(status)
+    return raw_data
+
+
+def raw_data_to_dict(raw_data: Sequence[Any]) -> dict[str, Any]:
+    """Convert a list of OIDS slots to raw data keyed by OID, the fixture format."""
+    return {
+        oid: split_records(value) if isinstance(value, bytes) else value
+        for oid, value in zip(OIDS.values(), raw_data, strict=True)
+        if value is not None
+    }
+
+
+async def async_resolve_host(host: str) -> str:
+    """Resolve host to an IPv4 address.
+
+    Results are cached for all instances, failures are cached for a shorter
+    time so a slow or broken resolver is not asked again on every
+    initialization.
+    """
+    now = time.monotonic()
+    if (cached := _RESOLVE_CACHE.get(host)) and cached[0] > now:
+        if cached[1] is None:
+            msg = f"Could not resolve host {host}"
+            raise ConnectionError(msg)
+        return cached[1]
+
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.getaddrinfo(
+            host, None, family=socket.AF_INET, type=socket.SOCK_DGRAM
+        )
+    except OSError as err:
+        _RESOLVE_CACHE[host] = (now + RESOLVE_NEGATIVE_TTL, None)
+        msg = f"Could not resolve host {host}: {err}"
+        raise ConnectionError(msg) from err
+
+    address = str(result[0][4][0])
+    _RESOLVE_CACHE[host] = (now + RESOLVE_TTL, address)
+    _LOGGER.debug("Resolved %s to %s", host, address)
+    return address
+
+
+def clear_resolve_cache() -> None:
+    """Clear cached host addresses."""
+    _RESOLVE_CACHE.clear()
+
+
 def bytes_to_hex_string(data: bytes) -> str:
     """Convert bytes to hex string efficiently, excluding last byte (checksum)."""
     # More efficient than join with list comprehension
@@ -34,6 +146,33 @@ def bytes_to_hex_string(data: bytes) -> str:
     return data[:-1].hex()
 
 
+@lru_cache(maxsize=STATUS_CACHE_SIZE)
+def decode_status(status: bytes, encoding: str) -> str | None:
+    """Decode raw status bytes and return lowercased status with single spaces.
+
+    Printers report only a handful of different statuses, so results are cached
+    per raw bytes and encoding for all instances, `decode_status.cache_info()`
+    returns hits and misses.
+    """
+    _LOGGER.debug("Status: %s, encoding: %s", status, encoding)
+    try:
+        result = status.decode(encoding)
+    except UnicodeDecodeError:
+        return None
+    return cleanse_status(result)
+
+
+def cleanse_status(status: str) -> str:
+    """Return lowercased status with single spaces."""
+    return " ".join(status.lower().split())
+
+
+def nearest_rank(samples: Sequence[float], percentile: float) -> float:
+    """Return percentile of sorted samples with the nearest-rank method."""
+    index = max(-(-len(samples) * percentile // 100) - 1, 0)
+    return samples[int(index)]
+
+
 def build_dateandtime(dt: datetime) -> bytes:
     """Encode a datetime as an 8-byte SNMP DateAndTime value (RFC 2579)."""
     return dt.year.to_bytes(2, "big") + bytes(
@@ -56,3 +195,68 @@ def parse_dateandtime(raw: bytes) -> datetime | None:
         )
     except ValueError:
         return None
+
+
+def build_set_varbinds(values: Mapping[str, object]) -> list[ObjectType]:
+    """Validate values to set and return varbinds of SNMP SET request.
+
+    Every value must be an SNMP typed value, e.g. OctetString or Integer32,
+    keyed by numeric OID. All values are checked before anything is sent,
+    ValueError lists every invalid one.
+    """
+    if not values:
+        msg = "No values to set"
+        raise ValueError(msg)
+
+    errors: list[str] = []
+    varbinds: list[ObjectType] = []
+    for oid, value in values.items():
+        if not REGEX_NUMERIC_OID.match(oid):
+            errors.append(f"{oid} is not a numeric OID")
+        elif not isinstance(value, SimpleAsn1Type) or not value.isValue:
+            errors.append(f"{value!r} is not an SNMP value for {oid}")
+        elif oid == OID_DATETIME and (
+            not isinstance(value, OctetString)
+            or len(value) not in DATEANDTIME_LENGTHS
+            or parse_dateandtime(value.asOctets()) is None
+        ):
+            errors.append(f"{value!r} is not a valid DateAndTime for {oid}")
+        else:
+            varbinds.append(ObjectType(ObjectIdentity(oid), value))
+
+    if errors:
+        msg = f"Invalid values to set: {'; '.join(errors)}"
+        raise ValueError(msg)
+
+    return varbinds
+
+
+async def async_gather_bounded(
+    calls: Sequence[Callable[[], Awaitable[object]]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_error: Callable[[int, Exception], None] | None = None,
+) -> list[Exception | None]:
+    """Run calls concurrently, at most `concurrency` at a time.
+
+    An exception of one call does not stop the others, it is passed to
+    `on_error` with the index of the call as soon as it is raised and is
+    returned in place of None. Errors other than HOST_ERRORS are logged with
+    the traceback.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(
+        index: int, call: Callable[[], Awaitable[object]]
+    ) -> Exception | None:
+        async with semaphore:
+            try:
+                await call()
+            except Exception as err:
+                if not isinstance(err, HOST_ERRORS):
+                    _LOGGER.exception("Unexpected error")
+                if on_error:
+                    on_error(index, err)
+                return err
+        return None
+
+    return await asyncio.gather(*(run(index, call) for index, call in enumerate(calls)))
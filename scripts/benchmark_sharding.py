@@ -0,0 +1,45 @@
+"""Benchmark sharded polling throughput against a local SNMP simulator.
+
+Start a simulator serving a recorded printer first, for example with snmpsim:
+
+    snmpsim-command-responder --data-dir=./data --agent-udpv4-endpoint=127.0.0.1:1161
+
+then run `uv run python scripts/benchmark_sharding.py --port 1161 --count 2000`.
+"""
+
+import argparse
+import time
+
+from brother.sharding import PollOptions, ShardedPoller
+
+WORKERS = (1, 2, 4, 8)
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1161)
+    parser.add_argument("--community", default="public")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    hosts = [args.host] * args.count
+    options = PollOptions(
+        port=args.port, community=args.community, concurrency=args.concurrency
+    )
+
+    for workers in WORKERS:
+        poller = ShardedPoller(hosts, workers=workers, options=options)
+        start = time.perf_counter()
+        errors = sum(result.error is not None for result in poller.poll())
+        elapsed = time.perf_counter() - start
+        print(  # noqa: T201
+            f"workers={workers} printers={args.count} errors={errors} "
+            f"time={elapsed:.2f}s throughput={args.count / elapsed:.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Generate brother/profiles.py from recorded printer responses.
+
+Run with `uv run python scripts/generate_profiles.py` after adding a fixture.
+"""
+
+import json
+import re
+from pathlib import Path
+
+from brother import REGEX_MODEL_PATTERN
+from brother.codecs import LEGACY_CODEC, detect_codec
+from brother.const import (
+    ATTR_MAINTENANCE,
+    ATTR_MODEL,
+    DATETIME_SET_SUPPORTED_MODELS,
+    OIDS,
+)
+
+ROOT = Path(__file__).parent.parent
+FIXTURES = ROOT / "tests" / "fixtures"
+OUTPUT = ROOT / "brother" / "profiles.py"
+
+# inkjet models that can not be recognized by the model name
+INK_MODELS = ("mfc-5490cn",)
+REGEX_INK_MODEL = re.compile(r"^(dcp|mfc)-[jt]\d")
+
+# OIDs known to be unsupported by a model, fixtures recorded with an older set
+# of OIDS do not tell which OIDs the model supports
+UNSUPPORTED_OIDS: dict[str, tuple[str, ...]] = {}
+
+HEADER = '''"""Capabilities of known printer models.
+
+Generated by scripts/generate_profiles.py from tests/fixtures, do not edit.
+"""
+
+from typing import Final
+
+from .model import ModelProfile
+
+MODEL_PROFILES: Final = {
+'''
+
+FOOTER = '''}
+
+
+def get_model_profile(model: str) -> ModelProfile | None:
+    """Return capabilities of the printer model, or None if the model is unknown."""
+    return MODEL_PROFILES.get(model.lower().removesuffix(" series"))
+'''
+
+
+def printer_type(model: str, model_string: str) -> str:
+    """Return printer type of the model."""
+    if "CID:Brother Laser" in model_string:
+        return "laser"
+    if model in INK_MODELS or REGEX_INK_MODEL.match(model):
+        return "ink"
+    return "laser"
+
+
+def main() -> None:
+    """Generate profiles."""
+    profiles: dict[str, str] = {}
+
+    for path in sorted(FIXTURES.glob("*.json")):
+        with path.open(encoding="utf-8") as file:
+            data = json.load(file)
+
+        model_string = data.get(OIDS[ATTR_MODEL]) or ""
+        if not (model_match := REGEX_MODEL_PATTERN.search(model_string)):
+            continue
+
+        model = model_match.group("model").lower()
+        oids = [attr for attr in OIDS if attr not in UNSUPPORTED_OIDS.get(model, ())]
+        legacy = (
+            detect_codec(bytes.fromhex("".join(data.get(OIDS[ATTR_MAINTENANCE], []))))
+            is LEGACY_CODEC
+        )
+        datetime_set_supported = any(
+            supported in model for supported in DATETIME_SET_SUPPORTED_MODELS
+        )
+
+        lines = [f'    "{model}": ModelProfile(', "        oids=("]
+        lines.extend(f'            "{attr}",' for attr in oids)
+        lines.extend(
+            [
+                "        ),",
+                f"        legacy={legacy},",
+                f'        printer_type="{printer_type(model, model_string)}",',
+                f"        datetime_set_supported={datetime_set_supported},",
+                "    ),",
+            ]
+        )
+        profiles[model] = "\n".join(lines)
+
+    OUTPUT.write_text(
+        HEADER + "\n".join(profiles.values()) + "\n" + FOOTER, encoding="utf-8"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,13 @@ from unittest.mock import MagicMock
 
 import pytest
 from pysnmp.hlapi.v3arch.asyncio import CommunityData, ContextData, SnmpEngine
+from pysnmp.smi.view import MibViewController
 from syrupy.assertion import SnapshotAssertion
 from syrupy.extensions.amber import AmberSnapshotExtension
 from syrupy.location import PyTestLocation
 
 from brother import Brother
+from brother.utils import _get_snmp_engine
 
 
 @pytest.fixture
@@ -32,6 +34,12 @@ def brother_with_request_args() -> Brother:
     return brother
 
 
+@pytest.fixture(scope="session")
+def mib_view_controller() -> MibViewController:
+    """Return MIB view controller to resolve varbinds sent in tests."""
+    return _get_snmp_engine().cache["mibViewController"]
+
+
 class SnapshotExtension(AmberSnapshotExtension):
     """Extension for Syrupy."""
 
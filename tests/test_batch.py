@@ -0,0 +1,99 @@
+"""Tests for brother batch."""
+
+import io
+import json
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from freezegun import freeze_time
+
+from brother import Brother
+from brother.batch import SENSOR_FIELDS, SensorsBatch
+from brother.model import BrotherSensors
+from brother.utils import raw_data_from_dict
+
+TEST_TIME = datetime(2019, 11, 11, 9, 10, 32, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_batch_from_decoder_output() -> None:
+    """Test building a batch directly from decoded printer data."""
+    batch = SensorsBatch()
+
+    for host, fixture, printer_type in (
+        ("printer-1", "hl-l2340dw", "laser"),
+        ("printer-2", "mfc-t910dw", "ink"),
+    ):
+        with open(f"tests/fixtures/{fixture}.json", encoding="utf-8") as file:
+            data = json.load(file)
+        brother = Brother(host, printer_type=printer_type)
+        with (
+            patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+            freeze_time(TEST_TIME),
+        ):
+            batch.append(host, await brother.async_update_data())
+
+    assert len(batch) == 2
+    assert batch.hosts == ["printer-1", "printer-2"]
+    assert batch.status == ["oczekiwanie", "oczekiwanie"]
+
+    values, mask = batch.column("black_toner")
+    assert list(mask) == [1, 0]
+    assert values[0] == 80
+
+    values, mask = batch.column("color_counter")
+    assert list(mask) == [0, 1]
+    assert values[1] == 3199
+
+    values, mask = batch.column("uptime")
+    assert list(mask) == [1, 1]
+
+
+def test_batch_column_invalid() -> None:
+    """Test getting a column that does not exist."""
+    batch = SensorsBatch()
+
+    with pytest.raises(KeyError):
+        batch.column("status")
+
+
+def test_batch_write_csv() -> None:
+    """Test writing the batch as CSV."""
+    batch = SensorsBatch()
+    batch.append_sensors("printer-1", BrotherSensors(page_counter=10, status="ready"))
+    batch.append_sensors("printer-2", BrotherSensors(drum_remaining_life=40))
+
+    file = io.StringIO()
+    batch.write_csv(file)
+    lines = file.getvalue().splitlines()
+
+    assert lines[0].split(",") == ["host", *SENSOR_FIELDS]
+    assert lines[1].startswith("printer-1,")
+    assert ",10," in lines[1]
+    assert ",ready," in lines[1]
+    assert ",40," in lines[2]
+    assert len(lines) == 3
+
+
+def test_batch_write_ndjson() -> None:
+    """Test writing the batch as NDJSON."""
+    batch = SensorsBatch()
+    batch.append(
+        "printer-1",
+        {"page_counter": 10, "uptime": TEST_TIME, "unknown": 1, "drum_status": None},
+    )
+    batch.append("printer-2", {"status": "sleep"})
+
+    file = io.StringIO()
+    batch.write_ndjson(file)
+    rows = [json.loads(line) for line in file.getvalue().splitlines()]
+
+    assert rows == [
+        {
+            "host": "printer-1",
+            "page_counter": 10,
+            "uptime": "2019-11-11T09:10:32+00:00",
+        },
+        {"host": "printer-2", "status": "sleep"},
+    ]
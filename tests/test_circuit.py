@@ -0,0 +1,86 @@
+"""Tests for brother circuit breaker."""
+
+import pytest
+from freezegun import freeze_time
+
+from brother import (
+    CircuitOpenError,
+    SnmpError,
+    SnmpTransportError,
+    UnsupportedModelError,
+)
+from brother.circuit import CircuitBreaker, CircuitState
+
+
+def fail(breaker: CircuitBreaker) -> None:
+    """Make a failing call through the circuit breaker."""
+    with pytest.raises(TimeoutError), breaker:
+        raise TimeoutError
+
+
+def test_circuit_opens_after_failures() -> None:
+    """Test that the circuit opens after consecutive failures."""
+    breaker = CircuitBreaker(failure_threshold=2, backoff=10)
+
+    with freeze_time("2026-01-01 00:00:00"):
+        fail(breaker)
+        assert breaker.state is CircuitState.CLOSED
+        fail(breaker)
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.allow_request() is False
+        assert breaker.retry_in == 10
+
+        with pytest.raises(CircuitOpenError, match="retry in 10 seconds"), breaker:
+            pass
+
+
+def test_circuit_half_open_trial() -> None:
+    """Test a trial call in half-open state and exponential backoff."""
+    breaker = CircuitBreaker(failure_threshold=1, backoff=10, max_backoff=30)
+
+    with freeze_time("2026-01-01 00:00:00") as frozen:
+        fail(breaker)
+        frozen.tick(10)
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+
+        # failed trial doubles backoff
+        fail(breaker)
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_in == 20
+
+        frozen.tick(20)
+        fail(breaker)
+        # backoff is capped
+        assert breaker.retry_in == 30
+
+        frozen.tick(30)
+        with breaker:
+            # only one trial call at a time
+            assert breaker.allow_request() is False
+            assert breaker.state is CircuitState.HALF_OPEN
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.retry_in == 0
+
+
+def test_circuit_ignores_other_errors() -> None:
+    """Test that errors other than connection errors do not open the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    with pytest.raises(UnsupportedModelError), breaker:
+        raise UnsupportedModelError("Unsupported")
+
+    assert breaker.state is CircuitState.CLOSED
+
+    # an error status is a reply of the printer
+    with pytest.raises(SnmpError), breaker:
+        raise SnmpError("genErr, 1")
+
+    assert breaker.state is CircuitState.CLOSED
+
+    with pytest.raises(SnmpError), breaker:
+        raise SnmpTransportError("requestTimedOut")
+
+    assert breaker.state is CircuitState.OPEN
@@ -0,0 +1,100 @@
+"""Tests for brother record codecs."""
+
+import pytest
+
+from brother.codecs import (
+    CODECS,
+    LEGACY_CODEC,
+    MODERN_CODEC,
+    RecordCodec,
+    detect_codec,
+    register_codec,
+    split_records,
+)
+from brother.const import PERCENT_VALUES, VALUES_LASER_MAINTENANCE
+
+
+@pytest.mark.parametrize(
+    ("data", "codec"),
+    [
+        ("a101020414a201020c14a301020614", LEGACY_CODEC),
+        # denominator of the last record is not checked
+        ("a101020414a201020c13", LEGACY_CODEC),
+        ("a101020413a201020c13a301020613", MODERN_CODEC),
+        ("a1010204", MODERN_CODEC),
+        ("a101020414", MODERN_CODEC),
+        ("", MODERN_CODEC),
+        ("630104000000011101040000052c", MODERN_CODEC),
+    ],
+)
+def test_detect_codec(data: str, codec: RecordCodec) -> None:
+    """Test detecting codec of records."""
+    assert detect_codec(bytes.fromhex(data)) is codec
+
+
+def test_modern_codec() -> None:
+    """Test parsing records with 4-byte values."""
+    parser = MODERN_CODEC.compile({"63": "test_sensor_1", "11": "test_sensor_2"})
+    data = bytes.fromhex("6301040000000a1101040000000fff01040000001e")
+
+    assert list(parser(data)) == [("test_sensor_1", 10), ("test_sensor_2", 15)]
+
+
+def test_modern_codec_percent_values() -> None:
+    """Test parsing percent values with 4-byte values."""
+    code, name = next(
+        (code, name)
+        for code, name in VALUES_LASER_MAINTENANCE.items()
+        if name in PERCENT_VALUES
+    )
+    parser = MODERN_CODEC.compile({code: name})
+
+    assert list(parser(bytes.fromhex(f"{code}01040000157c"))) == [(name, 55)]
+
+
+def test_modern_codec_incomplete_record() -> None:
+    """Test that an incomplete last record is skipped."""
+    parser = MODERN_CODEC.compile({"63": "test_sensor_1", "62": "test_sensor_2"})
+
+    assert list(parser(bytes.fromhex("6301040000000a62010101"))) == [
+        ("test_sensor_1", 10)
+    ]
+
+
+def test_legacy_codec() -> None:
+    """Test parsing percentage records of legacy printers."""
+    parser = LEGACY_CODEC.compile({"a1": "legacy_sensor_1", "a2": "legacy_sensor_2"})
+    data = bytes.fromhex("a101020414a201020c14ff01020414")
+
+    assert list(parser(data)) == [("legacy_sensor_1", 20), ("legacy_sensor_2", 60)]
+
+
+def test_register_codec() -> None:
+    """Test that registered codecs are detected first."""
+    codec = RecordCodec(
+        name="test",
+        record_format=">BH",
+        value=lambda record, _: record[1],
+        detect=lambda data: data[:1] == b"\xee",
+    )
+    register_codec(codec)
+    try:
+        assert detect_codec(bytes.fromhex("ee0001")) is codec
+        assert list(codec.compile({"ee": "test_sensor"})(b"\xee\x00\x05")) == [
+            ("test_sensor", 5)
+        ]
+    finally:
+        CODECS.remove(codec)
+
+
+def test_split_records() -> None:
+    """Test splitting records to hex strings."""
+    assert split_records(bytes.fromhex("a101020414a201020c14")) == [
+        "a101020414",
+        "a201020c14",
+    ]
+    assert split_records(bytes.fromhex("630104000000011101040000052c62")) == [
+        "63010400000001",
+        "1101040000052c",
+        "62",
+    ]
@@ -0,0 +1,89 @@
+"""Tests for brother vectorized decoder."""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from brother import DECODED_SLOTS
+from brother.codecs import MODERN_CODEC, detect_codec
+from brother.const import (
+    PERCENT_VALUES,
+    SLOT_COUNTERS,
+    VALUES_LASER_MAINTENANCE,
+)
+from brother.decoder import decode_blobs
+from brother.utils import raw_data_from_dict
+
+FIXTURES = Path("tests/fixtures")
+
+
+@pytest.mark.parametrize("printer_type", ["laser", "ink"])
+def test_decode_blobs_fixtures(printer_type: str) -> None:
+    """Test that decoded fixtures are equal to parser of the modern codec."""
+    raw_data = []
+    for path in sorted(FIXTURES.glob("*.json")):
+        with path.open(encoding="utf-8") as file:
+            raw_data.append(raw_data_from_dict(json.load(file)))
+
+    for slot, values_map in DECODED_SLOTS[printer_type].items():
+        blobs = [
+            blob
+            for item in raw_data
+            if (blob := item[slot]) and detect_codec(blob) is MODERN_CODEC
+        ]
+        parser = MODERN_CODEC.compile(values_map)
+
+        result = decode_blobs(blobs, values_map).to_dicts()
+
+        assert result == [dict(parser(blob)) for blob in blobs]
+
+
+def test_decode_blobs_random() -> None:
+    """Test decoding random blobs with percent values and incomplete records."""
+    rng = np.random.default_rng(0)
+    values_map = VALUES_LASER_MAINTENANCE
+    codes = [int(code, 16) for code in values_map] + [0x62, 0xFF]
+    blobs = []
+    for _ in range(200):
+        count = int(rng.integers(0, 20))
+        blob = b"".join(
+            bytes([int(rng.choice(codes)), 1, 4])
+            + int(rng.integers(0, 2**32)).to_bytes(4, "big")
+            for _ in range(count)
+        )
+        blobs.append(blob + bytes(int(rng.integers(0, 7))))
+    # half to even rounding of percent values
+    blobs.append(bytes.fromhex("6f0104000000966f010400000032"))
+    parser = MODERN_CODEC.compile(values_map)
+
+    result = decode_blobs(blobs, values_map).to_dicts()
+
+    assert result == [dict(parser(blob)) for blob in blobs]
+    assert values_map["6f"] in PERCENT_VALUES
+    assert result[-1] == {values_map["6f"]: 0}
+
+
+def test_decode_blobs_columns() -> None:
+    """Test columns of decoded blobs."""
+    values_map = {"00": "page_counter", "01": "bw_counter"}
+    blobs = [
+        bytes.fromhex("0001040000000a0101040000000b"),
+        b"",
+        # the last record of the same sensor is used
+        bytes.fromhex("0001040000000c0001040000000d"),
+    ]
+
+    columns = decode_blobs(blobs, values_map).columns()
+
+    np.testing.assert_array_equal(columns["page_counter"], [10, np.nan, 13])
+    np.testing.assert_array_equal(columns["bw_counter"], [11, np.nan, np.nan])
+
+
+def test_decode_blobs_empty() -> None:
+    """Test decoding no blobs."""
+    result = decode_blobs([], DECODED_SLOTS["laser"][SLOT_COUNTERS])
+
+    assert result.to_dicts() == []
+    assert all(len(column) == 0 for column in result.columns().values())
@@ -2,7 +2,12 @@
 
 import pytest
 
-from brother.exceptions import BrotherError, SnmpError, UnsupportedModelError
+from brother.exceptions import (
+    BrotherError,
+    SnmpError,
+    SnmpSetError,
+    UnsupportedModelError,
+)
 
 
 def test_brother_error() -> None:
@@ -26,6 +31,17 @@ def test_snmp_error() -> None:
     assert isinstance(error, Exception)
 
 
+def test_snmp_set_error() -> None:
+    """Test SnmpSetError exception."""
+    error_msg = "SNMP SET failed: notWritable at index 1"
+    error = SnmpSetError(error_msg, "1.3.6.1.2.1.1.6.0")
+
+    assert str(error) == error_msg
+    assert error.status == error_msg
+    assert error.oid == "1.3.6.1.2.1.1.6.0"
+    assert isinstance(error, SnmpError)
+
+
 def test_unsupported_model_error() -> None:
     """Test UnsupportedModelError exception."""
     error_msg = "Printer model not supported"
@@ -0,0 +1,68 @@
+"""Tests for brother fleet operations."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pysnmp.proto.rfc1902 import OctetString
+
+from brother import SnmpError, SnmpSetError
+from brother.fleet import async_set_fleet, async_update_fleet
+from brother.model import BrotherSensors
+from brother.pipeline import PipelineItem, ResultPipeline
+
+VALUES = {"1.3.6.1.2.1.1.6.0": OctetString("Office")}
+
+
+def mock_printer(host: str, error: Exception | None = None) -> Mock:
+    """Return mocked Brother instance."""
+    printer = Mock(host=host)
+    printer.async_set = AsyncMock(side_effect=error)
+    return printer
+
+
+@pytest.mark.asyncio
+async def test_set_fleet() -> None:
+    """Test setting values on many printers."""
+    error = SnmpSetError("SNMP SET failed", "1.3.6.1.2.1.1.6.0")
+    printers = [
+        mock_printer("printer-1"),
+        mock_printer("printer-2", error),
+        mock_printer("printer-3", ConnectionError("Connection refused")),
+    ]
+
+    result = await async_set_fleet(printers, VALUES, concurrency=2)
+
+    assert result["printer-1"] is None
+    assert result["printer-2"] is error
+    assert isinstance(result["printer-3"], ConnectionError)
+    for printer in printers:
+        printer.async_set.assert_awaited_once_with(VALUES)
+
+
+@pytest.mark.asyncio
+async def test_set_fleet_invalid_values() -> None:
+    """Test that invalid values are not sent to any printer."""
+    printer = mock_printer("printer-1")
+
+    with pytest.raises(ValueError, match="is not an SNMP value"):
+        await async_set_fleet([printer], {"1.3.6.1.2.1.1.6.0": "Office"})
+
+    printer.async_set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_fleet() -> None:
+    """Test publishing results of many printers to a pipeline."""
+    printers = [mock_printer("printer-1"), mock_printer("printer-2")]
+    printers[0].async_update = AsyncMock(return_value=BrotherSensors(page_counter=1))
+    printers[1].async_update = AsyncMock(side_effect=SnmpError("SNMP error"))
+    pipeline = ResultPipeline()
+
+    result = await async_update_fleet(printers, pipeline)
+
+    assert result["printer-1"] is None
+    assert isinstance(result["printer-2"], SnmpError)
+    assert await pipeline.async_get() == PipelineItem(
+        "printer-1", BrotherSensors(page_counter=1)
+    )
+    assert pipeline.depth == 0
@@ -0,0 +1,93 @@
+"""Tests for brother forecast."""
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from brother.forecast import FORECAST_FIELDS, forecast_arrays, forecast_fleet
+from brother.model import BrotherSensors
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def test_forecast_fields() -> None:
+    """Test that forecast fields cover remaining consumables only."""
+    assert "black_toner_remaining" in FORECAST_FIELDS
+    assert "drum_remaining_life" in FORECAST_FIELDS
+    assert "drum_remaining_pages" in FORECAST_FIELDS
+    assert "page_counter" not in FORECAST_FIELDS
+    assert "black_toner" not in FORECAST_FIELDS
+
+
+def test_forecast_arrays_linear() -> None:
+    """Test forecast for a linearly depleting series."""
+    timestamps = np.array([[0.0, 86400.0, 172800.0, 259200.0]])
+    values = np.array([[80.0, 70.0, 60.0, 50.0]])
+    pages = np.array([[1000.0, 1100.0, 1200.0, 1300.0]])
+
+    result = forecast_arrays(timestamps, values, pages)
+
+    assert result.rate_per_second[0] * 86400 == pytest.approx(10)
+    assert result.run_out[0] == pytest.approx(8 * 86400)
+    assert result.rate_per_page[0] == pytest.approx(0.1)
+    assert result.pages_left[0] == pytest.approx(500)
+
+
+def test_forecast_arrays_not_depleting() -> None:
+    """Test forecast for constant series and series with too few samples."""
+    timestamps = np.array([[0.0, 100.0, 200.0], [0.0, np.nan, np.nan]])
+    values = np.array([[50.0, 50.0, 50.0], [50.0, np.nan, np.nan]])
+
+    result = forecast_arrays(timestamps, values)
+
+    assert np.isnan(result.run_out).all()
+    assert np.isnan(result.pages_left).all()
+    assert np.isnan(result.rate_per_second[1])
+
+
+def test_forecast_arrays_replacement() -> None:
+    """Test that samples before a consumable replacement are ignored."""
+    timestamps = np.array([[0.0, 100.0, 200.0, 300.0, 400.0, 500.0]])
+    values = np.array([[20.0, 10.0, np.nan, 100.0, 90.0, 80.0]])
+
+    result = forecast_arrays(timestamps, values)
+
+    assert result.rate_per_second[0] == pytest.approx(0.1)
+    assert result.run_out[0] == pytest.approx(1300)
+
+
+def test_forecast_fleet() -> None:
+    """Test forecast for printers history."""
+    history = [
+        (
+            START + timedelta(days=day),
+            BrotherSensors(
+                black_toner_remaining=90 - day * 5,
+                drum_remaining_life=None if day == 1 else 50,
+                page_counter=100 + day * 50,
+            ),
+        )
+        for day in range(4)
+    ]
+
+    result = forecast_fleet({"printer": history, "empty": []})
+
+    assert set(result) == {"printer"}
+    assert set(result["printer"]) == {"black_toner_remaining", "drum_remaining_life"}
+
+    toner = result["printer"]["black_toner_remaining"]
+    assert toner.rate_per_day == pytest.approx(5)
+    assert toner.rate_per_page == pytest.approx(0.1)
+    assert toner.run_out == START + timedelta(days=18)
+    assert toner.pages_left == 750
+
+    drum = result["printer"]["drum_remaining_life"]
+    assert drum.rate_per_day == 0
+    assert drum.run_out is None
+    assert drum.pages_left is None
+
+
+def test_forecast_fleet_empty() -> None:
+    """Test forecast without any data."""
+    assert forecast_fleet({}) == {}
@@ -0,0 +1,178 @@
+"""Tests for brother hedged requests."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from brother import Brother, SnmpError
+from brother.hedging import Hedger
+
+HOST = "localhost"
+
+
+def warmed_up(latency: float = 0.01, **kwargs: float) -> Hedger:
+    """Return hedger with latency samples."""
+    hedger = Hedger(min_samples=1, **kwargs)  # ty:ignore[invalid-argument-type]
+    hedger._samples.extend([latency] * 100)
+    return hedger
+
+
+def test_delay() -> None:
+    """Test hedging delay from latency samples."""
+    hedger = Hedger(min_samples=10)
+    hedger._samples.extend([0.01 * ind for ind in range(1, 10)])
+    assert hedger.delay is None
+
+    hedger._samples.append(1.0)
+    assert hedger.delay == pytest.approx(0.09)
+
+
+@pytest.mark.asyncio
+async def test_fast_request_not_hedged() -> None:
+    """Test that a request faster than the delay is sent once."""
+    hedger = warmed_up(latency=1.0, budget=1)
+    request = AsyncMock(return_value="result")
+
+    assert await hedger.async_run(request) == "result"
+
+    request.assert_awaited_once()
+    assert hedger.hedged == 0
+    assert hedger.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_request_hedged() -> None:
+    """Test that the duplicate wins when the first request is slow."""
+    hedger = warmed_up(budget=1)
+    first = asyncio.Event()
+    cancelled = []
+
+    async def request() -> str:
+        if not first.is_set():
+            first.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        return "hedged"
+
+    assert await hedger.async_run(request) == "hedged"
+    await asyncio.sleep(0)
+
+    assert hedger.hedged == 1
+    assert hedger.hedge_wins == 1
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_single_try_requests() -> None:
+    """Test that requests which may be duplicated are sent once."""
+    hedger = warmed_up(budget=0.5)
+    request = AsyncMock(return_value="retried")
+    single_try = AsyncMock(return_value="single try")
+
+    # half a token, no duplicate can be sent
+    assert await hedger.async_run(request, single_try=single_try) == "retried"
+    # a fast request returns the reserved token
+    assert await hedger.async_run(request, single_try=single_try) == "single try"
+    assert await hedger.async_run(request, single_try=single_try) == "single try"
+
+    assert request.await_count == 1
+    assert single_try.await_count == 2
+    assert hedger.hedged == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget() -> None:
+    """Test that duplicates are limited by the budget."""
+    hedger = warmed_up(budget=0.5)
+
+    async def request() -> str:
+        await asyncio.sleep(0.03)
+        return "result"
+
+    for _ in range(4):
+        await hedger.async_run(request)
+
+    # every request earns half a token, a duplicate costs one token
+    assert hedger.requests == 4
+    assert hedger.hedged == 2
+
+
+@pytest.mark.asyncio
+async def test_request_error() -> None:
+    """Test that an error of the winning request is raised."""
+    hedger = warmed_up(budget=1)
+    request = AsyncMock(side_effect=ConnectionError("Connection refused"))
+
+    with pytest.raises(ConnectionError):
+        await hedger.async_run(request)
+
+    # failed requests are not latency samples
+    assert list(hedger._samples) == [0.01] * 100
+
+
+@pytest.mark.asyncio
+async def test_failed_request_hedge_wins() -> None:
+    """Test that an error reply of the first request waits for the duplicate."""
+    hedger = Hedger(min_samples=1, budget=1)
+    hedger._samples.extend([0.01] * 50)
+    release = asyncio.Event()
+    calls = 0
+
+    async def request() -> tuple[str | None, str]:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            # the first request times out after the duplicate was sent
+            await release.wait()
+            return ("requestTimedOut", "")
+        release.set()
+        await asyncio.sleep(0)
+        return (None, "hedged")
+
+    result = await hedger.async_run(request, failed=lambda result: bool(result[0]))
+
+    assert result == (None, "hedged")
+    assert hedger.hedge_wins == 1
+    # the error reply is not a latency sample, the duplicate is
+    assert len(hedger._samples) == 51
+
+
+@pytest.mark.asyncio
+async def test_all_requests_failed() -> None:
+    """Test that the first error reply is returned when all requests fail."""
+    hedger = warmed_up(budget=1)
+    calls = 0
+
+    async def request() -> str:
+        nonlocal calls
+        calls += 1
+        call = calls
+        await asyncio.sleep(0.02 if call == 1 else 0.03)
+        return f"error {call}"
+
+    result = await hedger.async_run(request, failed=lambda _: True)
+
+    assert result == "error 1"
+    assert hedger.hedged == 1
+    assert hedger.hedge_wins == 0
+    assert list(hedger._samples) == [0.01] * 100
+
+
+@pytest.mark.asyncio
+async def test_brother_hedged_get(brother_with_request_args: Brother) -> None:
+    """Test that GET requests of the printer are hedged."""
+    hedger = warmed_up(budget=1)
+    brother_with_request_args._hedger = hedger
+    mock_get = AsyncMock(return_value=("requestTimedOut", 0, 0, []))
+
+    with patch("brother.get_cmd", mock_get), pytest.raises(SnmpError):
+        await brother_with_request_args.async_get_datetime()
+
+    assert hedger.requests == 1
+    # a request that may be duplicated is sent without retransmits
+    assert mock_get.call_args.args[2].retries == 0
+    assert Brother(HOST, hedger=hedger).hedger is hedger
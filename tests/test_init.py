@@ -1,27 +1,54 @@
 """Tests for brother package."""
 
+import asyncio
 import json
 from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from freezegun import freeze_time
 from pysnmp.error import PySnmpError
+from pysnmp.proto.errind import RequestTimedOut
+from pysnmp.proto.rfc1902 import Integer32, OctetString
+from pysnmp.proto.rfc1905 import EndOfMibView
 from pysnmp.smi.rfc1902 import ObjectType
+from pysnmp.smi.view import MibViewController
 from syrupy import SnapshotAssertion
 
-from brother import Brother, MethodNotSupportedError, SnmpError, UnsupportedModelError
+from brother import (
+    OID_BITS,
+    Brother,
+    CircuitOpenError,
+    MethodNotSupportedError,
+    SnmpError,
+    SnmpSetError,
+    UnsupportedModelError,
+    _get_parser,
+)
+from brother.circuit import CircuitBreaker, CircuitState
+from brother.codecs import LEGACY_CODEC, MODERN_CODEC, detect_codec
 from brother.const import (
     ATTR_CHARSET,
+    ATTR_COUNTERS,
     ATTR_MAC,
     ATTR_MODEL,
+    ATTR_SERIAL,
     ATTR_STATUS,
+    OID_DATETIME,
     OIDS,
-    OIDS_HEX,
-    PERCENT_VALUES,
-    VALUES_LASER_MAINTENANCE,
+    SLOT_CHARSET,
+    SLOT_COUNTERS,
+    SLOT_MAC,
+    SLOT_MAINTENANCE,
+    SLOT_MODEL,
+    SLOT_NEXTCARE,
+    SLOT_STATUS,
 )
-from brother.utils import build_dateandtime, parse_dateandtime
+from brother.model import BrotherSupply
+from brother.profiling import Profiler
+from brother.recorder import Recorder
+from brother.utils import build_dateandtime, parse_dateandtime, raw_data_from_dict
 
 HOST = "localhost"
 INVALID_HOST = "foo.local"
@@ -35,7 +62,9 @@ async def test_hl_l2340dw_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
 
     with (
-        patch("brother.Brother._get_data", return_value=data) as mock_update,
+        patch(
+            "brother.Brother._get_data", return_value=raw_data_from_dict(data)
+        ) as mock_update,
         patch("brother.Brother.initialize"),
         freeze_time(TEST_TIME),
     ):
@@ -60,7 +89,10 @@ async def test_dcp_l3550cdw_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
     brother = Brother(HOST)
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -76,7 +108,10 @@ async def test_dcp_j132w_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
     brother = Brother(HOST, printer_type="ink")
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -91,9 +126,11 @@ async def test_mfc_5490cn_model(snapshot: SnapshotAssertion) -> None:
     with open("tests/fixtures/mfc-5490cn.json", encoding="utf-8") as file:
         data = json.load(file)
     brother = Brother(HOST, printer_type="ink")
-    brother._legacy = True
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -109,7 +146,10 @@ async def test_dcp_l2540dw_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
     brother = Brother(HOST, printer_type="laser")
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -125,7 +165,10 @@ async def test_dcp_7070dw_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
     brother = Brother(HOST, printer_type="laser")
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     assert brother == snapshot
@@ -133,7 +176,10 @@ async def test_dcp_7070dw_model(snapshot: SnapshotAssertion) -> None:
 
     # test uptime logic, uptime increased by 10 minutes
     data["1.3.6.1.2.1.1.3.0"] = "2987742561"
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -149,7 +195,10 @@ async def test_mfc_j680dw_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
     brother = Brother(HOST, printer_type="ink")
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -165,7 +214,10 @@ async def test_dcp_9020cdw_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
     brother = Brother(HOST, printer_type="laser")
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -181,7 +233,10 @@ async def test_hl_2270dw_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
     brother = Brother(HOST, printer_type="laser")
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -197,7 +252,10 @@ async def test_mfc_t910dw_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
     brother = Brother(HOST, printer_type="ink")
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -213,7 +271,10 @@ async def test_hl_5350dn_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
     brother = Brother(HOST, printer_type="laser")
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -230,7 +291,7 @@ async def test_invalid_data() -> None:
     brother = Brother(HOST)
 
     with (
-        patch("brother.Brother._get_data", return_value=data),
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
         pytest.raises(UnsupportedModelError),
     ):
         await brother.async_update()
@@ -245,7 +306,7 @@ async def test_incomplete_data() -> None:
         data = json.load(file)
     brother = Brother(HOST)
 
-    with patch("brother.Brother._get_data", return_value=data):
+    with patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)):
         await brother.async_update()
 
     brother.shutdown()
@@ -313,7 +374,10 @@ async def test_dcp_1618w_model(snapshot: SnapshotAssertion) -> None:
         data = json.load(file)
     brother = Brother(HOST, printer_type="laser")
 
-    with patch("brother.Brother._get_data", return_value=data), freeze_time(TEST_TIME):
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        freeze_time(TEST_TIME),
+    ):
         sensors = await brother.async_update()
 
     brother.shutdown()
@@ -322,83 +386,6 @@ async def test_dcp_1618w_model(snapshot: SnapshotAssertion) -> None:
     assert sensors == snapshot
 
 
-@pytest.mark.parametrize(
-    ("status", "encoding", "expected"),
-    [
-        (b"TRYB U\xa6PIENIA", "latin2", "TRYB UŚPIENIA"),
-        (b"PROSZ\xca CZEKA\xc6", "latin2", "PROSZĘ CZEKAĆ"),
-        (b"MA\xa3O TONERU (Y)", "latin2", "MAŁO TONERU (Y)"),
-        (b"\xe8\xaf\xb7\xe7\xad\x89\xe5\xbe\x85", "utf-8", "请等待"),
-        (b"Stap. Kopie\xcdn:01", "roman8", "Stap. Kopieën:01"),
-        (b"\xc1\xdf\xef\xe9\xd8\xd9 \xe0\xd5\xd6\xd8\xdc", "cyrillic", "Спящий режим"),
-    ],
-)
-def test_decode_status(status: bytes, encoding: str, expected: str) -> None:
-    """Test decoding status."""
-    brother = Brother(HOST, printer_type="laser")
-
-    result = brother._decode_status(status, encoding)
-
-    assert result == expected
-
-
-def test_decode_status_unicode_error() -> None:
-    """Test decoding status with UnicodeDecodeError."""
-    brother = Brother(HOST, printer_type="laser")
-
-    # Invalid bytes that can't be decoded with the specified encoding
-    invalid_status = b"\xff\xfe\xfd"
-
-    result = brother._decode_status(invalid_status, "utf-8")
-
-    assert result is None
-
-
-def test_cleanse_status() -> None:
-    """Test cleansing status strings."""
-    brother = Brother(HOST, printer_type="laser")
-
-    # Test with extra whitespace
-    result = brother._cleanse_status("  ready   to   print  ")
-    assert result == "ready to print"
-
-    # Test with newlines and tabs
-    result = brother._cleanse_status("ready\t\nto\n\tprint")
-    assert result == "ready to print"
-
-    # Test empty string
-    result = brother._cleanse_status("")
-    assert result == ""
-
-    # Test string with only whitespace
-    result = brother._cleanse_status("   \t\n  ")
-    assert result == ""
-
-
-def test_legacy_printer() -> None:
-    """Test legacy printer detection."""
-    brother = Brother(HOST, printer_type="laser")
-
-    # Valid legacy printer data (chunks of 10 ending with "14")
-    valid_legacy = "a101020414a201020c14a301020614"
-    assert brother._legacy_printer(valid_legacy) is True
-
-    # Invalid legacy printer data (chunks don't end with "14")
-    invalid_legacy = "a101020413a201020c13a301020613"
-    assert brother._legacy_printer(invalid_legacy) is False
-
-    # Too short string
-    too_short = "a1010204"
-    assert brother._legacy_printer(too_short) is False
-
-    # Wrong length (not divisible by 10)
-    wrong_length = "a101020414a"
-    assert brother._legacy_printer(wrong_length) is False
-
-    # Empty string
-    assert brother._legacy_printer("") is False
-
-
 def test_property_methods() -> None:
     """Test property methods."""
     host = "192.168.1.100"
@@ -414,77 +401,6 @@ def test_property_methods() -> None:
     assert brother.firmware == "1.23"
 
 
-def test_iterate_data() -> None:
-    """Test iterating data from hex words."""
-    brother = Brother(HOST, printer_type="laser")
-
-    # Sample hex data with known values
-    hex_data = [
-        "6301040000000a",  # Should match "63" in values_map -> value 10
-        "1101040000000f",  # Should match "11" in values_map -> value 15
-        "ff01040000001e",  # Should not match (not in values_map)
-    ]
-
-    # Create a simple values map for testing
-    values_map = {
-        "63": "test_sensor_1",
-        "11": "test_sensor_2",
-    }
-
-    result = list(brother._iterate_data(hex_data, values_map))
-
-    assert len(result) == 2
-    assert result[0] == ("test_sensor_1", 10)
-    assert result[1] == ("test_sensor_2", 15)
-
-
-def test_iterate_data_percent_values() -> None:
-    """Test iterating data with percent values."""
-    brother = Brother(HOST, printer_type="laser")
-
-    # Use actual percent value sensors from the constants
-
-    hex_data = []
-    values_map = {}
-
-    # Find a percent value sensor from the actual constants
-    for key, value in VALUES_LASER_MAINTENANCE.items():
-        if value in PERCENT_VALUES:
-            hex_data.append(f"{key}01040000157c")  # 5500 in hex, becomes 55
-            # when divided by 100
-            values_map[key] = value
-            break
-
-    if hex_data:  # Only run if we found a percent value sensor
-        result = list(brother._iterate_data(hex_data, values_map))
-        assert len(result) == 1
-        assert result[0][1] == 55  # 5500 / 100 = 55
-
-
-def test_iterate_data_legacy() -> None:
-    """Test iterating data from hex words for legacy printers."""
-    brother = Brother(HOST, printer_type="laser")
-
-    # Legacy format: 10 characters, with calculation based on positions 6-8 and 8-10
-    hex_data = [
-        "a101020414",  # positions 6-8: "04", positions 8-10: "14" -> (4/20)*100 = 20
-        "a201020c14",  # positions 6-8: "0c", positions 8-10: "14" -> (12/20)*100 = 60
-        "ff01020414",  # Should not match (not in values_map)
-    ]
-
-    # Create a simple values map for testing
-    values_map = {
-        "a1": "legacy_sensor_1",
-        "a2": "legacy_sensor_2",
-    }
-
-    result = list(brother._iterate_data_legacy(hex_data, values_map))
-
-    assert len(result) == 2
-    assert result[0] == ("legacy_sensor_1", 20)
-    assert result[1] == ("legacy_sensor_2", 60)
-
-
 @pytest.mark.asyncio
 async def test_get_data_pysnmp_error() -> None:
     """Test _get_data method with PySnmpError."""
@@ -492,7 +408,7 @@ async def test_get_data_pysnmp_error() -> None:
 
     # Mock the request args to avoid initialization
     brother._request_args = (Mock(), Mock(), Mock(), Mock())
-    brother._oids = []
+    brother._oids = 0
 
     with (
         patch("brother.get_cmd", side_effect=PySnmpError("PySnmp error")),
@@ -508,7 +424,7 @@ async def test_get_data_snmp_errindication() -> None:
 
     # Mock the request args to avoid initialization
     brother._request_args = (Mock(), Mock(), Mock(), Mock())
-    brother._oids = []
+    brother._oids = 0
 
     with (
         patch("brother.get_cmd", return_value=("timeout", None, None, None)),
@@ -524,7 +440,7 @@ async def test_get_data_snmp_errstatus() -> None:
 
     # Mock the request args to avoid initialization
     brother._request_args = (Mock(), Mock(), Mock(), Mock())
-    brother._oids = []
+    brother._oids = 0
 
     with (
         patch("brother.get_cmd", return_value=(None, "noSuchObject", 1, None)),
@@ -540,15 +456,13 @@ async def test_initialize_unsupported_model_by_oid() -> None:
 
     # Mock async_get_snmp_engine to avoid actual SNMP setup
     with (
-        patch("brother.Brother._iterate_oids") as mock_iterate_oids,
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
         patch("brother.async_get_snmp_engine"),
         patch("brother.UdpTransportTarget.create"),
         patch("brother.get_cmd") as mock_get_cmd,
     ):
-        mock_iterate_oids.return_value = ["oid1", "oid2"]
-
-        # Mock errstatus "noSuchName" with errindex 5 (model OID)
-        mock_get_cmd.return_value = (None, "noSuchName", 5, None)
+        # Mock errstatus "noSuchName" with errindex 6 (model OID)
+        mock_get_cmd.return_value = (None, "noSuchName", 6, None)
 
         with pytest.raises(UnsupportedModelError, match="not supported"):
             await brother.initialize()
@@ -583,6 +497,7 @@ async def test_initialize_pysnmp_error() -> None:
 
     with (
         patch("brother.async_get_snmp_engine"),
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
         patch(
             "brother.UdpTransportTarget.create",
             side_effect=PySnmpError("Transport error"),
@@ -601,17 +516,13 @@ async def test_initialize_oid_removal() -> None:
         patch("brother.async_get_snmp_engine"),
         patch("brother.UdpTransportTarget.create"),
         patch("brother.get_cmd") as mock_get_cmd,
-        patch("brother.Brother._iterate_oids") as mock_iterate_oids,
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
     ):
-        # Mock initial OIDs list
-        mock_oids = ["oid1", "oid2", "oid3"]
-        mock_iterate_oids.return_value = mock_oids
-
-        # First call: remove OID at index 2 (errindex=2, oid index=1)
+        # First call: remove OID at index 2 (errindex=2, counters OID)
         # Second call: success
         mock_get_cmd.side_effect = [
-            (None, "noSuchName", 2, None),  # Remove oid2
-            (Mock(), Mock(), Mock(), Mock()),  # Success
+            (None, "noSuchName", 2, None),  # Remove counters
+            (None, 0, 0, []),  # Success
         ]
 
         await brother.initialize()
@@ -619,7 +530,80 @@ async def test_initialize_oid_removal() -> None:
         # Should have made 2 calls to get_cmd
         assert mock_get_cmd.call_count == 2
         # Should have removed one OID
-        assert len(brother._oids) == 2
+        assert brother._oids.bit_count() == len(OIDS) - 1
+        assert OIDS[ATTR_COUNTERS] not in brother._selected_oids()
+        assert mock_get_cmd.call_args.args[4:] == tuple(
+            oid for attr, oid in OIDS.items() if attr != ATTR_COUNTERS
+        )
+
+
+@pytest.mark.asyncio
+async def test_initialize_probe_split() -> None:
+    """Test that the probe is split when the printer drops the full request."""
+    brother = Brother(HOST, printer_type="laser")
+
+    async def fake_get_cmd(*args: object) -> tuple:
+        varbinds = args[4:]
+        if len(varbinds) == len(OIDS):
+            return (RequestTimedOut(), 0, 0, [])
+        if OIDS[ATTR_COUNTERS] in varbinds:
+            index = varbinds.index(OIDS[ATTR_COUNTERS]) + 1
+            return (None, "noSuchName", index, [])
+        return (None, 0, 0, [(oid, "value") for oid in varbinds])
+
+    with (
+        patch("brother.async_get_snmp_engine"),
+        patch("brother.UdpTransportTarget.create"),
+        patch("brother.get_cmd", side_effect=fake_get_cmd),
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
+    ):
+        await brother.initialize()
+
+    assert brother._max_varbinds == (len(OIDS) + 1) // 2
+    assert brother._max_answered == brother._max_varbinds
+    # unknown OID of a split request is removed as of a full one
+    assert brother._oids.bit_count() == len(OIDS) - 1
+    assert OIDS[ATTR_COUNTERS] not in brother._selected_oids()
+
+
+@pytest.mark.asyncio
+async def test_initialize_probe_timeout() -> None:
+    """Test that the probe is capped without a timeout given by the caller."""
+    brother = Brother(HOST, printer_type="laser")
+
+    async def fake_get_cmd(*_: object) -> tuple:
+        await asyncio.sleep(1)
+        return (None, 0, 0, [])
+
+    with (
+        patch("brother.async_get_snmp_engine"),
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
+        patch("brother.UdpTransportTarget.create"),
+        patch("brother.get_cmd", side_effect=fake_get_cmd),
+        patch("brother.PROBE_TIMEOUT", 0.01),
+        pytest.raises(TimeoutError),
+    ):
+        await brother.initialize()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response", [("authorizationError", 0, 0, []), (None, "genErr", 1, [])]
+)
+async def test_initialize_probe_error(response: tuple) -> None:
+    """Test that an error reply to the probe is not a learned request size."""
+    brother = Brother(HOST, printer_type="laser")
+
+    with (
+        patch("brother.async_get_snmp_engine"),
+        patch("brother.UdpTransportTarget.create"),
+        patch("brother.get_cmd", AsyncMock(return_value=response)),
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
+        pytest.raises(SnmpError),
+    ):
+        await brother.initialize()
+
+    assert brother._max_answered == 0
 
 
 def test_shutdown_with_engine() -> None:
@@ -652,13 +636,13 @@ async def test_async_update_legacy_laser() -> None:
         data = json.load(file)
 
     brother = Brother(HOST, printer_type="laser")
-    brother._legacy = True  # Force legacy mode
+    brother._codecs[SLOT_MAINTENANCE] = LEGACY_CODEC  # Force legacy mode
 
-    with patch("brother.Brother._get_data", return_value=data):
+    with patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)):
         sensors = await brother.async_update()
 
-    # Should have called _iterate_data_legacy
-    assert brother._legacy is True
+    assert brother._codecs[SLOT_MAINTENANCE] is LEGACY_CODEC
+    assert brother._codecs[SLOT_NEXTCARE] is MODERN_CODEC
     assert sensors is not None
 
 
@@ -667,35 +651,46 @@ async def test_get_data_oids_hex_processing() -> None:
     """Test _get_data method processing OIDS_HEX data."""
     brother = Brother(HOST, printer_type="laser")
     brother._request_args = (Mock(), Mock(), Mock(), Mock())
-    brother._oids = []
+    brother._oids = OID_BITS[ATTR_COUNTERS]
+    brother._oid_table = tuple(OIDS.values())  # ty:ignore[invalid-assignment]
 
-    # Mock response data for hex OIDs
-    mock_resrow = [
-        [OIDS[next(iter(OIDS.keys()))], None],  # Use first OID that's in OIDS_HEX
-    ]
+    # Mock the response object
+    class MockResponse:
+        def asOctets(self) -> bytes:  # noqa: N802
+            return b"\x63\x01\x04\x00\x00\x00\x01\x11\x01\x04\x00\x00\x05\x2c\xff"
 
-    # Find an OID that's in OIDS_HEX
-    hex_oid = None
-    for oid in OIDS.values():
-        if oid in OIDS_HEX:
-            hex_oid = oid
-            break
+    mock_resrow = [[OIDS[ATTR_COUNTERS], None, MockResponse()]]
 
-    if hex_oid:
-        # Mock the response object
-        class MockResponse:
-            def asOctets(self) -> bytes:  # noqa: N802
-                return b"\x63\x01\x04\x00\x00\x00\x01\xff"
+    with patch("brother.get_cmd", return_value=(None, None, None, mock_resrow)):
+        result = await brother._get_data()
 
-        mock_response = MockResponse()
+    assert result is not None
+    assert result[SLOT_COUNTERS] == bytes.fromhex("630104000000011101040000052c")
 
-        mock_resrow = [[hex_oid, None, mock_response]]
 
-        with patch("brother.get_cmd", return_value=(None, None, None, mock_resrow)):
-            result = await brother._get_data()
+@pytest.mark.asyncio
+async def test_codec_detected_once() -> None:
+    """Test that codecs of records are detected on the first update only."""
+    with open("tests/fixtures/mfc-5490cn.json", encoding="utf-8") as file:
+        data = json.load(file)
+    brother = Brother(HOST, printer_type="ink")
+
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        patch("brother.detect_codec", wraps=detect_codec) as mock_detect_codec,
+        patch("brother._get_parser", wraps=_get_parser) as mock_get_parser,
+    ):
+        await brother.async_update_data()
+        result = await brother.async_update_data()
 
-        assert hex_oid in result
-        assert isinstance(result[hex_oid], list)
+    # counters are empty, only maintenance records are detected
+    mock_detect_codec.assert_called_once_with(
+        bytes.fromhex("a101020414a201020c14a301020614a401020b14")
+    )
+    assert brother._codecs == {SLOT_MAINTENANCE: LEGACY_CODEC}
+    assert result["black_ink_remaining"] == 20
+    # the parser is resolved with the codec, not on every poll
+    mock_get_parser.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -703,7 +698,8 @@ async def test_get_data_mac_address_processing() -> None:
     """Test _get_data method processing MAC address."""
     brother = Brother(HOST, printer_type="laser")
     brother._request_args = (Mock(), Mock(), Mock(), Mock())
-    brother._oids = []
+    brother._oids = OID_BITS[ATTR_MAC]
+    brother._oid_table = tuple(OIDS.values())  # ty:ignore[invalid-assignment]
 
     # Mock the response object for MAC address
     class MockResponse:
@@ -717,8 +713,8 @@ async def test_get_data_mac_address_processing() -> None:
     with patch("brother.get_cmd", return_value=(None, None, None, mock_resrow)):
         result = await brother._get_data()
 
-    assert OIDS[ATTR_MAC] in result
-    assert result[OIDS[ATTR_MAC]] == "00:1b:8c:12:34:56"
+    assert result is not None
+    assert result[SLOT_MAC] == "00:1b:8c:12:34:56"
 
 
 @pytest.mark.asyncio
@@ -726,23 +722,25 @@ async def test_get_data_status_processing() -> None:
     """Test _get_data method processing status data."""
     brother = Brother(HOST, printer_type="laser")
     brother._request_args = (Mock(), Mock(), Mock(), Mock())
-    brother._oids = []
+    brother._oids = OID_BITS[ATTR_STATUS] | OID_BITS[ATTR_CHARSET]
+    brother._oid_table = tuple(OIDS.values())  # ty:ignore[invalid-assignment]
 
     # Mock the response objects
     mock_status_response = type("MockResponse", (), {})()
     mock_status_response._value = b"Ready"  # ty:ignore[unresolved-attribute]
 
+    # varbinds are in the order of OIDS
     mock_resrow = [
-        [OIDS[ATTR_STATUS], None, mock_status_response],
         [OIDS[ATTR_CHARSET], None, "utf-8"],  # Charset for decoding
+        [OIDS[ATTR_STATUS], None, mock_status_response],
     ]
 
     with patch("brother.get_cmd", return_value=(None, None, None, mock_resrow)):
         result = await brother._get_data()
 
-    assert OIDS[ATTR_STATUS] in result
-    assert result[OIDS[ATTR_STATUS]] == "Ready"
-    assert OIDS[ATTR_CHARSET] in result
+    assert result is not None
+    assert result[SLOT_STATUS] == "ready"
+    assert result[SLOT_CHARSET] == "utf-8"
 
 
 @pytest.mark.asyncio
@@ -750,7 +748,8 @@ async def test_get_data_other_oid() -> None:
     """Test _get_data method processing other OIDs."""
     brother = Brother(HOST, printer_type="laser")
     brother._request_args = (Mock(), Mock(), Mock(), Mock())
-    brother._oids = []
+    brother._oids = OID_BITS[ATTR_MODEL]
+    brother._oid_table = tuple(OIDS.values())  # ty:ignore[invalid-assignment]
 
     # Mock the response object for regular string data
     class MockResponse:
@@ -764,40 +763,42 @@ async def test_get_data_other_oid() -> None:
     with patch("brother.get_cmd", return_value=(None, None, None, mock_resrow)):
         result = await brother._get_data()
 
-    assert OIDS[ATTR_MODEL] in result
-    assert result[OIDS[ATTR_MODEL]] == "Brother HL-2270DW series"
+    assert result is not None
+    assert result[SLOT_MODEL] == "Brother HL-2270DW series"
+    assert result.count(None) == len(OIDS) - 1
 
 
 @pytest.mark.asyncio
-async def test_set_datetime(brother_with_request_args: Brother) -> None:
+async def test_set_datetime(
+    brother_with_request_args: Brother, mib_view_controller: MibViewController
+) -> None:
     """Test setting printer datetime via SNMP."""
     mock_set = AsyncMock(return_value=(None, 0, 0, []))
     dt = datetime(2026, 3, 26, 14, 30, 0, tzinfo=UTC)
     expected = b"\x07\xea\x03\x1a\x0e\x1e\x00\x00"
-    with patch("brother.set_cmd", mock_set), patch("brother.OctetString") as mock_octet:
+    with patch("brother.set_cmd", mock_set):
         await brother_with_request_args.async_set_datetime(dt)
-    mock_octet.assert_called_once_with(expected)
     mock_set.assert_called_once()
+    varbind = mock_set.call_args.args[4].resolve_with_mib(mib_view_controller)
+    assert varbind[1].asOctets() == expected
 
 
 @pytest.mark.asyncio
 async def test_set_datetime_default_uses_now(
     brother_with_request_args: Brother,
+    mib_view_controller: MibViewController,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that async_set_datetime(None) encodes the same instant as now(local)."""
     monkeypatch.setenv("TZ", "UTC")
     mock_set = AsyncMock(return_value=(None, 0, 0, []))
     frozen = datetime(2026, 3, 26, 14, 30, 0, tzinfo=UTC)
-    with (
-        patch("brother.set_cmd", mock_set),
-        patch("brother.OctetString") as mock_octet,
-        freeze_time(frozen),
-    ):
+    with patch("brother.set_cmd", mock_set), freeze_time(frozen):
         expected = build_dateandtime(datetime.now(tz=UTC).astimezone())
         await brother_with_request_args.async_set_datetime()
-    mock_octet.assert_called_once_with(expected)
     mock_set.assert_called_once()
+    varbind = mock_set.call_args.args[4].resolve_with_mib(mib_view_controller)
+    assert varbind[1].asOctets() == expected
 
 
 @pytest.mark.asyncio
@@ -852,6 +853,67 @@ async def test_set_datetime_connection_error(
         )
 
 
+@pytest.mark.asyncio
+async def test_set_many_values(
+    brother_with_request_args: Brother, mib_view_controller: MibViewController
+) -> None:
+    """Test setting many values with one SNMP SET request."""
+    mock_set = AsyncMock(return_value=(None, 0, 0, []))
+    values = {
+        OID_DATETIME: OctetString(build_dateandtime(datetime(2026, 1, 1))),  # noqa: DTZ001
+        "1.3.6.1.2.1.1.6.0": OctetString("Office"),
+        "1.3.6.1.4.1.2435.2.3.9.4.2.1.5.5.2.0": Integer32(5),
+    }
+
+    with patch("brother.set_cmd", mock_set):
+        await brother_with_request_args.async_set(values)
+
+    mock_set.assert_called_once()
+    varbinds = [
+        varbind.resolve_with_mib(mib_view_controller)
+        for varbind in mock_set.call_args.args[4:]
+    ]
+    assert [str(varbind[0]) for varbind in varbinds] == list(values)
+    assert [varbind[1] for varbind in varbinds] == list(values.values())
+
+
+@pytest.mark.asyncio
+async def test_set_invalid_values(brother_with_request_args: Brother) -> None:
+    """Test that all values are validated before SNMP SET request is sent."""
+    mock_set = AsyncMock(return_value=(None, 0, 0, []))
+    values = {
+        "1.3.6.1.2.1.1.6.0": OctetString("Office"),
+        "sysLocation": OctetString("Office"),
+        "1.3.6.1.2.1.1.5.0": "printer",
+    }
+
+    with (
+        patch("brother.set_cmd", mock_set),
+        pytest.raises(ValueError, match=r"sysLocation.*'printer'"),
+    ):
+        await brother_with_request_args.async_set(values)
+
+    mock_set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_set_rejected_varbind(brother_with_request_args: Brother) -> None:
+    """Test that the OID rejected by the printer is reported."""
+    mock_set = AsyncMock(return_value=(None, "notWritable", 2, []))
+    values = {
+        "1.3.6.1.2.1.1.6.0": OctetString("Office"),
+        "1.3.6.1.2.1.1.5.0": OctetString("printer"),
+    }
+
+    with (
+        patch("brother.set_cmd", mock_set),
+        pytest.raises(SnmpSetError, match=r"notWritable at index 2") as exc_info,
+    ):
+        await brother_with_request_args.async_set(values)
+
+    assert exc_info.value.oid == "1.3.6.1.2.1.1.5.0"
+
+
 @pytest.mark.asyncio
 async def test_set_datetime_unsupported_model() -> None:
     """Test MethodNotSupportedError for model not in DATETIME_SET_SUPPORTED_MODELS."""
@@ -977,3 +1039,418 @@ def test_custom_write_community() -> None:
     """Test custom write community."""
     brother = Brother(HOST, write_community="private")
     assert brother._write_community == "private"
+
+
+@pytest.mark.asyncio
+async def test_initialize_known_model_skips_probing() -> None:
+    """Test that initialize uses the model profile instead of probing OIDs."""
+    brother = Brother(HOST, model="MFC-J680DW")
+
+    with (
+        patch("brother.async_get_snmp_engine"),
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
+        patch("brother.UdpTransportTarget.create"),
+        patch("brother.get_cmd") as mock_get_cmd,
+    ):
+        await brother.initialize()
+
+    mock_get_cmd.assert_not_called()
+    assert brother._printer_type == "ink"
+    assert brother._codecs == {SLOT_MAINTENANCE: MODERN_CODEC}
+    assert brother._oids.bit_count() == len(OIDS)
+
+
+@pytest.mark.asyncio
+async def test_get_data_known_model_unsupported_oid() -> None:
+    """Test that an OID of the profile the printer lacks is removed."""
+    brother = Brother(HOST, model="MFC-J680DW")
+    brother._request_args = (Mock(), Mock(), Mock(), Mock())
+    brother._oid_table = tuple(OIDS.values())  # ty:ignore[invalid-assignment]
+    brother._oids = OID_BITS[ATTR_MODEL] | OID_BITS[ATTR_STATUS]
+
+    async def fake_get_cmd(*args: object) -> tuple:
+        oids = list(args[4:])
+        if OIDS[ATTR_STATUS] in oids:
+            return (None, "noSuchName", oids.index(OIDS[ATTR_STATUS]) + 1, [])
+        return (None, 0, 0, [(oid, OctetString("MDL:MFC-J680DW")) for oid in oids])
+
+    with patch("brother.get_cmd", side_effect=fake_get_cmd) as mock_get_cmd:
+        await brother._get_data()
+        await brother._get_data()
+
+    assert brother._oids == OID_BITS[ATTR_MODEL]
+    assert mock_get_cmd.await_count == 3
+
+
+def test_known_model_profile() -> None:
+    """Test model profile of a known legacy printer."""
+    brother = Brother(HOST, model="MFC-5490CN")
+
+    assert brother._printer_type == "ink"
+    assert brother._codecs == {SLOT_MAINTENANCE: LEGACY_CODEC}
+    assert brother.is_datetime_set_supported is False
+
+
+def test_known_model_explicit_printer_type() -> None:
+    """Test that the profile does not override a given printer type."""
+    brother = Brother(HOST, printer_type="laser", model="MFC-5490CN")
+
+    assert brother._printer_type == "laser"
+    assert brother._codecs == {SLOT_MAINTENANCE: LEGACY_CODEC}
+
+
+def test_unknown_model_profile() -> None:
+    """Test that unknown models are probed."""
+    brother = Brother(HOST, printer_type="ink", model="MFC-J1234DW")
+
+    assert brother._profile is None
+    assert brother._printer_type == "ink"
+    assert not brother._codecs
+
+
+@pytest.mark.asyncio
+async def test_get_data_circuit_breaker() -> None:
+    """Test that updates fail fast when the circuit is open."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    brother = Brother(HOST, circuit_breaker=breaker)
+    brother._request_args = (Mock(), Mock(), Mock(), Mock())
+    brother._oids = 0
+
+    assert brother.circuit_breaker is breaker
+
+    with (
+        patch("brother.get_cmd", return_value=("timeout", None, None, None)),
+        pytest.raises(SnmpError),
+    ):
+        await brother.async_update_data()
+
+    with (
+        patch("brother.get_cmd") as mock_get_cmd,
+        pytest.raises(CircuitOpenError),
+    ):
+        await brother.async_update_data()
+
+    mock_get_cmd.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_data_error_status_keeps_circuit_closed() -> None:
+    """Test that an error status reply does not open the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    brother = Brother(HOST, circuit_breaker=breaker)
+    brother._request_args = (Mock(), Mock(), Mock(), Mock())
+    brother._oids = 0
+
+    with (
+        patch("brother.get_cmd", return_value=(None, "genErr", 1, None)),
+        pytest.raises(SnmpError, match="genErr"),
+    ):
+        await brother.async_update_data()
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_update_timeout_opens_circuit() -> None:
+    """Test that a passed deadline of an update is a failure of the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    brother = Brother(HOST, circuit_breaker=breaker)
+    brother._request_args = (Mock(), Mock(), Mock(), Mock())
+    brother._oids = OID_BITS[ATTR_MODEL]
+    brother._oid_table = tuple(OIDS.values())  # ty:ignore[invalid-assignment]
+
+    async def fake_get_cmd(*_: object) -> tuple:
+        await asyncio.sleep(1)
+        return (None, 0, 0, [])
+
+    with (
+        patch("brother.get_cmd", side_effect=fake_get_cmd),
+        pytest.raises(TimeoutError),
+    ):
+        await brother.async_update_data(timeout=0.01)
+
+    assert breaker.state is CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_initialize_circuit_breaker() -> None:
+    """Test that initialize records failures in the circuit breaker."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    brother = Brother(HOST, circuit_breaker=breaker)
+
+    # a plain engine, initialize is called again after the patches end
+    with (
+        patch("brother.async_get_snmp_engine", return_value=Mock()),
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
+        patch(
+            "brother.UdpTransportTarget.create",
+            side_effect=PySnmpError("Transport error"),
+        ),
+        pytest.raises(ConnectionError),
+    ):
+        await brother.initialize()
+
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        await brother.initialize()
+
+
+@pytest.mark.asyncio
+async def test_initialize_reuses_transport() -> None:
+    """Test that re-initialization keeps the transport target."""
+    brother = Brother(HOST, model="HL-L2340DW")
+
+    with (
+        patch("brother.async_get_snmp_engine"),
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
+        patch("brother.async_resolve_host", return_value="127.0.0.1") as mock_resolve,
+        patch("brother.UdpTransportTarget.create") as mock_create,
+    ):
+        await brother.initialize()
+        await brother.initialize()
+
+    mock_resolve.assert_called_once_with(HOST)
+    mock_create.assert_called_once()
+    assert mock_create.call_args[0][0] == ("127.0.0.1", 161)
+    assert brother._request_args[2] is mock_create.return_value
+
+
+@pytest.mark.asyncio
+async def test_get_supplies(brother_with_request_args: Brother) -> None:
+    """Test walking the Printer-MIB supplies table."""
+    varbinds = [
+        ("1.3.6.1.2.1.43.11.1.1.6.1.1", "Black Toner Cartridge"),
+        ("1.3.6.1.2.1.43.11.1.1.8.1.1", 3000),
+        ("1.3.6.1.2.1.43.11.1.1.9.1.1", 750),
+        ("1.3.6.1.2.1.43.11.1.1.6.1.2", "Drum Unit"),
+        ("1.3.6.1.2.1.43.11.1.1.8.1.2", 12000),
+        ("1.3.6.1.2.1.43.11.1.1.9.1.2", -3),
+        # end of the table, next columns
+        ("1.3.6.1.2.1.43.11.1.1.7.1.1", 3),
+        ("1.3.6.1.2.1.43.11.1.1.9.1.1", 750),
+        ("1.3.6.1.2.1.43.12.1.1.2.1.1", 1),
+    ]
+    mock_bulk = AsyncMock(return_value=(None, 0, 0, varbinds))
+
+    with patch("brother.bulk_cmd", mock_bulk):
+        supplies = await brother_with_request_args.async_get_supplies()
+
+    assert supplies == [
+        BrotherSupply("1.1", "Black Toner Cartridge", 750, 3000, 25),
+        BrotherSupply("1.2", "Drum Unit", -3, 12000, None),
+    ]
+    call_args = mock_bulk.call_args[0]
+    assert call_args[1].message_processing_model == 1
+    assert call_args[4:6] == (0, 16)
+    assert len(call_args[6:]) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_supplies_end_of_mib_view(
+    brother_with_request_args: Brother,
+) -> None:
+    """Test walking the supplies table until the end of MIB view."""
+    varbinds = [
+        ("1.3.6.1.2.1.43.11.1.1.6.1.1", "Black Toner Cartridge"),
+        ("1.3.6.1.2.1.43.11.1.1.8.1.1", 3000),
+        ("1.3.6.1.2.1.43.11.1.1.9.1.1", EndOfMibView()),
+    ]
+    mock_bulk = AsyncMock(return_value=(None, 0, 0, varbinds))
+
+    with patch("brother.bulk_cmd", mock_bulk):
+        supplies = await brother_with_request_args.async_get_supplies(max_supplies=1)
+
+    assert supplies == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("bulk_kwargs", "expected"),
+    [
+        ({"side_effect": PySnmpError("error")}, ConnectionError),
+        ({"return_value": ("requestTimedOut", 0, 0, [])}, SnmpError),
+        ({"return_value": (None, "genErr", 1, [])}, SnmpError),
+    ],
+)
+async def test_get_supplies_errors(
+    brother_with_request_args: Brother,
+    bulk_kwargs: dict[str, Any],
+    expected: type[Exception],
+) -> None:
+    """Test errors while walking the supplies table."""
+    with patch("brother.bulk_cmd", AsyncMock(**bulk_kwargs)), pytest.raises(expected):
+        await brother_with_request_args.async_get_supplies()
+
+
+@pytest.mark.asyncio
+async def test_get_varbinds_too_big(brother_with_request_args: Brother) -> None:
+    """Test splitting requests when the printer replies tooBig."""
+    oids = ["oid1", "oid2", "oid3", "oid4", "oid5"]
+
+    async def fake_get_cmd(*args: object) -> tuple:
+        varbinds = args[4:]
+        if len(varbinds) > 2:
+            return (None, "tooBig", 0, [])
+        return (None, 0, 0, [(oid, "value") for oid in varbinds])
+
+    mock_get = AsyncMock(side_effect=fake_get_cmd)
+    with patch("brother.get_cmd", mock_get):
+        result = await brother_with_request_args._get_varbinds(oids)  # ty:ignore[invalid-argument-type]
+
+        # 5 -> 3 + 2 -> 2 + 2 + 1
+        assert brother_with_request_args._max_varbinds == 2
+        assert [row[0] for row in result] == oids
+        assert mock_get.call_count == 6
+
+        # the learned size is used for next requests
+        mock_get.reset_mock()
+        await brother_with_request_args._get_varbinds(oids)  # ty:ignore[invalid-argument-type]
+        assert mock_get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_varbinds_timeout(brother_with_request_args: Brother) -> None:
+    """Test splitting requests when the printer does not reply to big requests."""
+    oids = ["oid1", "oid2", "oid3"]
+
+    async def fake_get_cmd(*args: object) -> tuple:
+        varbinds = args[4:]
+        if len(varbinds) > 1:
+            return (RequestTimedOut(), 0, 0, [])
+        return (None, 0, 0, [(oid, "value") for oid in varbinds])
+
+    with patch("brother.get_cmd", AsyncMock(side_effect=fake_get_cmd)):
+        result = await brother_with_request_args._get_varbinds(oids)  # ty:ignore[invalid-argument-type]
+
+    assert brother_with_request_args._max_varbinds == 1
+    assert [row[0] for row in result] == oids
+
+
+@pytest.mark.asyncio
+async def test_get_varbinds_timeout_not_responding(
+    brother_with_request_args: Brother,
+) -> None:
+    """Test that requests are not split when the printer does not respond."""
+    mock_get = AsyncMock(return_value=(RequestTimedOut(), 0, 0, []))
+
+    with (
+        patch("brother.get_cmd", mock_get),
+        pytest.raises(SnmpError, match="requestTimedOut"),
+    ):
+        await brother_with_request_args._get_varbinds(["oid1", "oid2"])  # ty:ignore[invalid-argument-type]
+
+    # one request with all OIDs and one with a single OID, sent once
+    assert mock_get.call_count == 2
+    assert mock_get.call_args_list[1].args[2].retries == 0
+    assert (
+        mock_get.call_args_list[0].args[2] is brother_with_request_args._request_args[2]
+    )
+    assert brother_with_request_args._max_varbinds is None
+
+
+@pytest.mark.asyncio
+async def test_get_varbinds_timeout_known_size(
+    brother_with_request_args: Brother,
+) -> None:
+    """Test that timeouts are errors when the printer accepted the request size."""
+    brother_with_request_args._max_answered = 2
+    mock_get = AsyncMock(return_value=(RequestTimedOut(), 0, 0, []))
+
+    with patch("brother.get_cmd", mock_get), pytest.raises(SnmpError):
+        await brother_with_request_args._get_varbinds(["oid1", "oid2"])  # ty:ignore[invalid-argument-type]
+
+    assert mock_get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_data_recorder() -> None:
+    """Test that _get_data passes responses to the recorder."""
+    recorder = Mock(spec=Recorder)
+    brother = Brother(HOST, recorder=recorder)
+    brother._request_args = (Mock(), Mock(), Mock(), Mock())
+    brother._oids = 0
+
+    class MockResponse:
+        def __str__(self) -> str:
+            return "serial_number"
+
+    mock_resrow = [[OIDS[ATTR_SERIAL], None, MockResponse()]]
+    brother._oids = OID_BITS[ATTR_SERIAL]
+    brother._oid_table = tuple(OIDS.values())  # ty:ignore[invalid-assignment]
+
+    with patch("brother.get_cmd", return_value=(None, None, None, mock_resrow)):
+        result = await brother._get_data()
+
+    recorder.record.assert_called_once_with(HOST, result, mock_resrow)
+
+
+@pytest.mark.asyncio
+async def test_async_update_profiler() -> None:
+    """Test that phases of a poll are measured by the profiler."""
+    with open("tests/fixtures/hl-l2340dw.json", encoding="utf-8") as file:
+        data = json.load(file)
+    profiler = Profiler()
+    brother = Brother(HOST, profiler=profiler)
+
+    with (
+        patch("brother.Brother._get_data", return_value=raw_data_from_dict(data)),
+        patch("brother.Brother._initialize"),
+    ):
+        await brother.initialize()
+        await brother.async_update()
+
+    assert set(profiler.summary()) == {
+        "initialize",
+        "poll",
+        "get_data",
+        "decode",
+        "from_dict",
+    }
+
+
+async def hang(*_args: object, **_kwargs: object) -> None:
+    """Wait forever, like a printer that does not answer."""
+    await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_create_timeout() -> None:
+    """Test that initialization is cancelled when the timeout passes."""
+    with (
+        patch("brother.async_get_snmp_engine"),
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
+        patch("brother.UdpTransportTarget.create"),
+        patch("brother.get_cmd", side_effect=hang),
+        pytest.raises(TimeoutError),
+    ):
+        await Brother.create(HOST, timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_async_update_timeout() -> None:
+    """Test that update is cancelled when the timeout passes."""
+    brother = Brother(HOST)
+
+    with (
+        patch("brother.Brother._get_data", side_effect=hang),
+        pytest.raises(TimeoutError),
+    ):
+        await brother.async_update(timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_datetime_timeout(brother_with_request_args: Brother) -> None:
+    """Test that datetime operations are cancelled when the timeout passes."""
+    with patch("brother.get_cmd", side_effect=hang), pytest.raises(TimeoutError):
+        await brother_with_request_args.async_get_datetime(timeout=0.01)
+
+    with patch("brother.set_cmd", side_effect=hang), pytest.raises(TimeoutError):
+        await brother_with_request_args.async_set_datetime(timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_get_supplies_timeout(brother_with_request_args: Brother) -> None:
+    """Test that supplies request is cancelled when the timeout passes."""
+    with patch("brother.bulk_cmd", side_effect=hang), pytest.raises(TimeoutError):
+        await brother_with_request_args.async_get_supplies(timeout=0.01)
@@ -0,0 +1,168 @@
+"""Tests for brother command line interface."""
+
+import asyncio
+import io
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from brother import SnmpError
+from brother.__main__ import async_main, main, parse_args, read_hosts
+from brother.model import BrotherSensors
+from brother.ratelimit import SubnetRateLimiter, TokenBucket
+
+SENSORS = BrotherSensors(
+    page_counter=986, status="ready", uptime=datetime(2026, 1, 1, tzinfo=UTC)
+)
+
+
+def mock_printer(host: str) -> Mock:
+    """Return mocked Brother instance."""
+    printer = Mock(host=host, model="HL-L2340DW", serial="serial", firmware="1.17")
+    printer.async_update = AsyncMock(return_value=SENSORS)
+    return printer
+
+
+async def mock_create(host: str, **_kwargs: object) -> Mock:
+    """Return mocked Brother instance or raise for an unreachable host."""
+    if host == "unreachable":
+        raise ConnectionError("Could not resolve host unreachable")
+    return mock_printer(host)
+
+
+def test_read_hosts(tmp_path: Path) -> None:
+    """Test reading hosts from arguments and file."""
+    path = tmp_path / "hosts.txt"
+    path.write_text("# office\nprinter-2\n\n  printer-3  \nprinter-1\n")
+
+    assert read_hosts(["printer-1"], str(path)) == [
+        "printer-1",
+        "printer-2",
+        "printer-3",
+    ]
+
+
+def test_read_hosts_stdin() -> None:
+    """Test reading hosts from standard input."""
+    with patch("sys.stdin", io.StringIO("printer-1\nprinter-2\n")):
+        assert read_hosts([], "-") == ["printer-1", "printer-2"]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["printer-1", "--concurrency", "0"],
+        ["printer-1", "--watch", "0"],
+        ["printer-1", "--rate", "0"],
+        ["printer-1", "--subnet-rate", "-1"],
+        ["printer-1", "--printer-type", "foo"],
+    ],
+)
+def test_parse_args_invalid(argv: list[str]) -> None:
+    """Test invalid arguments."""
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+
+@pytest.mark.asyncio
+async def test_async_main() -> None:
+    """Test polling hosts and writing JSON lines."""
+    args = parse_args(["printer-1", "unreachable", "--concurrency", "1"])
+    output = io.StringIO()
+
+    with (
+        patch("brother.__main__.async_get_snmp_engine"),
+        patch("brother.__main__.Brother.create", side_effect=mock_create),
+    ):
+        result = await async_main(args, output)
+
+    assert result == 1
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert lines == [
+        {
+            "host": "printer-1",
+            "model": "HL-L2340DW",
+            "serial": "serial",
+            "firmware": "1.17",
+            "data": {
+                "page_counter": 986,
+                "status": "ready",
+                "uptime": "2026-01-01T00:00:00+00:00",
+            },
+        },
+        {"host": "unreachable", "error": "Could not resolve host unreachable"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_main_rate_limits() -> None:
+    """Test that printers get own rate limiters and share the subnet one."""
+    args = parse_args(["printer-1", "printer-2", "--rate", "5", "--subnet-rate", "20"])
+
+    with (
+        patch("brother.__main__.async_get_snmp_engine"),
+        patch(
+            "brother.__main__.Brother.create", side_effect=mock_create
+        ) as mock_brother_create,
+    ):
+        await async_main(args, io.StringIO())
+
+    first, second = (call.kwargs for call in mock_brother_create.call_args_list)
+    assert isinstance(first["rate_limiter"], TokenBucket)
+    assert first["rate_limiter"].rate == 5
+    assert first["rate_limiter"] is not second["rate_limiter"]
+    assert isinstance(first["subnet_limiter"], SubnetRateLimiter)
+    assert first["subnet_limiter"] is second["subnet_limiter"]
+
+
+@pytest.mark.asyncio
+async def test_async_main_watch() -> None:
+    """Test that printers are created once and polled every interval."""
+    args = parse_args(["printer-1", "--watch", "10"])
+    output = io.StringIO()
+    printer = mock_printer("printer-1")
+    printer.async_update.side_effect = [SENSORS, SnmpError("SNMP error")]
+
+    with (
+        patch("brother.__main__.async_get_snmp_engine"),
+        patch(
+            "brother.__main__.Brother.create", return_value=printer
+        ) as mock_brother_create,
+        patch(
+            "brother.__main__.asyncio.sleep",
+            side_effect=[None, asyncio.CancelledError],
+        ) as mock_sleep,
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await async_main(args, output)
+
+    mock_brother_create.assert_awaited_once()
+    assert printer.async_update.await_count == 2
+    assert mock_sleep.call_args[0][0] == pytest.approx(10, abs=1)
+    printer.shutdown.assert_called_once()
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line.get("error") for line in lines] == [None, "SNMP error"]
+
+
+def test_main() -> None:
+    """Test command line entry point."""
+    with (
+        patch("brother.__main__.async_main", return_value=0) as mock_async_main,
+        patch("brother.__main__.logging.basicConfig"),
+    ):
+        assert main(["printer-1"]) == 0
+
+    assert mock_async_main.call_args[0][0].hosts == ["printer-1"]
+
+
+def test_main_interrupted() -> None:
+    """Test exit code after keyboard interrupt."""
+    with (
+        patch("brother.__main__.async_main", side_effect=KeyboardInterrupt),
+        patch("brother.__main__.logging.basicConfig"),
+    ):
+        assert main(["printer-1"]) == 130
@@ -0,0 +1,49 @@
+"""Tests for brother model."""
+
+import json
+from dataclasses import asdict
+from datetime import UTC, datetime
+
+from brother.model import BrotherSensors
+
+SENSORS = BrotherSensors(
+    black_toner_remaining=75,
+    page_counter=986,
+    status="oczekiwanie",
+    uptime=datetime(2019, 9, 24, 12, 14, 56, tzinfo=UTC),
+)
+
+
+def test_to_dict() -> None:
+    """Test that only present values are returned."""
+    assert SENSORS.to_dict() == {
+        key: value for key, value in asdict(SENSORS).items() if value is not None
+    }
+    assert BrotherSensors().to_dict() == {}
+
+
+def test_to_json() -> None:
+    """Test serializing to JSON."""
+    result = SENSORS.to_json()
+
+    assert isinstance(result, bytes)
+    assert json.loads(result) == {
+        "black_toner_remaining": 75,
+        "page_counter": 986,
+        "status": "oczekiwanie",
+        "uptime": "2019-09-24T12:14:56+00:00",
+    }
+    assert result.startswith(b'{"black_toner_remaining":75,"page_counter":986,')
+
+
+def test_from_json() -> None:
+    """Test that sensors are rebuilt from JSON."""
+    assert BrotherSensors.from_json(SENSORS.to_json()) == SENSORS
+    assert BrotherSensors.from_json(SENSORS.to_json().decode()) == SENSORS
+
+
+def test_from_dict() -> None:
+    """Test that unknown keys are ignored."""
+    result = BrotherSensors.from_dict({**SENSORS.to_dict(), "unknown": 1})
+
+    assert result == SENSORS
@@ -0,0 +1,115 @@
+"""Tests for brother result pipeline."""
+
+import asyncio
+
+import pytest
+
+from brother.model import BrotherSensors
+from brother.pipeline import OverflowPolicy, PipelineItem, ResultPipeline
+
+
+def sensors(page_counter: int) -> BrotherSensors:
+    """Return sensors with the page counter."""
+    return BrotherSensors(page_counter=page_counter)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_order() -> None:
+    """Test that results are delivered in the order of publishing."""
+    pipeline = ResultPipeline()
+    await pipeline.async_publish("printer-1", sensors(1))
+    await pipeline.async_publish("printer-2", sensors(2))
+    await pipeline.async_publish("printer-1", sensors(3))
+    await pipeline.async_close()
+
+    result = [item async for item in pipeline]
+
+    assert result == [
+        PipelineItem("printer-1", sensors(1)),
+        PipelineItem("printer-2", sensors(2)),
+        PipelineItem("printer-1", sensors(3)),
+    ]
+    stats = pipeline.stats
+    assert stats.published == 3
+    assert stats.delivered == 3
+    assert stats.depth == 0
+    assert stats.max_depth == 3
+
+
+@pytest.mark.asyncio
+async def test_pipeline_block() -> None:
+    """Test that publishing waits for a consumer when the pipeline is full."""
+    pipeline = ResultPipeline(max_size=1)
+    await pipeline.async_publish("printer-1", sensors(1))
+
+    task = asyncio.create_task(pipeline.async_publish("printer-2", sensors(2)))
+    await asyncio.sleep(0)
+    assert not task.done()
+    assert pipeline.stats.blocked == 1
+
+    assert await pipeline.async_get() == PipelineItem("printer-1", sensors(1))
+    await task
+    assert await pipeline.async_get() == PipelineItem("printer-2", sensors(2))
+    assert pipeline.stats.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_drop_oldest() -> None:
+    """Test that the oldest result is dropped when the pipeline is full."""
+    pipeline = ResultPipeline(max_size=2, policy=OverflowPolicy.DROP_OLDEST)
+    for page_counter in range(4):
+        await pipeline.async_publish(f"printer-{page_counter}", sensors(page_counter))
+    await pipeline.async_close()
+
+    result = [item.host async for item in pipeline]
+
+    assert result == ["printer-2", "printer-3"]
+    assert pipeline.stats.dropped == 2
+    assert pipeline.stats.max_depth == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_coalesce() -> None:
+    """Test that a queued result of a host is replaced by the latest one."""
+    pipeline = ResultPipeline(max_size=2, policy=OverflowPolicy.COALESCE)
+    await pipeline.async_publish("printer-1", sensors(1))
+    await pipeline.async_publish("printer-2", sensors(2))
+    await pipeline.async_publish("printer-1", sensors(3))
+
+    task = asyncio.create_task(pipeline.async_publish("printer-3", sensors(4)))
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    assert await pipeline.async_get() == PipelineItem("printer-1", sensors(3))
+    await task
+    await pipeline.async_close()
+
+    assert [item.host async for item in pipeline] == ["printer-2", "printer-3"]
+    assert pipeline.stats.coalesced == 1
+    assert pipeline.stats.blocked == 1
+
+
+@pytest.mark.asyncio
+async def test_pipeline_closed() -> None:
+    """Test publishing to and waiting on a closed pipeline."""
+    pipeline = ResultPipeline(max_size=1)
+    await pipeline.async_publish("printer-1", sensors(1))
+    task = asyncio.create_task(pipeline.async_publish("printer-2", sensors(2)))
+    await asyncio.sleep(0)
+
+    await pipeline.async_close()
+
+    assert pipeline.closed is True
+    with pytest.raises(RuntimeError, match="Pipeline is closed"):
+        await task
+    with pytest.raises(RuntimeError, match="Pipeline is closed"):
+        await pipeline.async_publish("printer-3", sensors(3))
+    assert await pipeline.async_get() == PipelineItem("printer-1", sensors(1))
+    with pytest.raises(RuntimeError, match="Pipeline is closed"):
+        await pipeline.async_get()
+
+
+def test_pipeline_invalid_max_size() -> None:
+    """Test that the pipeline needs room for at least one result."""
+    with pytest.raises(ValueError, match="max_size must be at least 1"):
+        ResultPipeline(max_size=0)
@@ -0,0 +1,30 @@
+"""Tests for brother profiles."""
+
+import pytest
+
+from brother.const import ATTR_MODEL, ATTR_SERIAL, OIDS
+from brother.profiles import MODEL_PROFILES, get_model_profile
+
+
+@pytest.mark.parametrize("model", ["HL-L2340DW", "hl-l2340dw", "HL-L2340DW series"])
+def test_get_model_profile(model: str) -> None:
+    """Test getting the profile of a known model."""
+    profile = get_model_profile(model)
+
+    assert profile is not None
+    assert profile.printer_type == "laser"
+    assert profile.legacy is False
+    assert profile.datetime_set_supported is False
+
+
+def test_get_model_profile_unknown() -> None:
+    """Test getting the profile of an unknown model."""
+    assert get_model_profile("HL-1234") is None
+
+
+def test_model_profiles_oids() -> None:
+    """Test that every profile contains known and obligatory OIDs."""
+    for profile in MODEL_PROFILES.values():
+        assert set(profile.oids) <= set(OIDS)
+        assert ATTR_MODEL in profile.oids
+        assert ATTR_SERIAL in profile.oids
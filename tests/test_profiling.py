@@ -0,0 +1,103 @@
+"""Tests for brother profiling."""
+
+import json
+import logging
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from freezegun import freeze_time
+
+from brother import profiling
+from brother.profiling import (
+    PHASE_DECODE,
+    PHASE_POLL,
+    Profiler,
+    get_default_profiler,
+)
+
+
+def test_profiler_summary() -> None:
+    """Test percentiles of phase durations."""
+    profiler = Profiler()
+
+    with patch("brother.profiling.time.perf_counter") as mock_perf_counter:
+        for duration in range(1, 101):
+            mock_perf_counter.side_effect = [0.0, duration / 1000]
+            with profiler.phase(PHASE_DECODE):
+                pass
+
+    assert profiler.summary() == {
+        PHASE_DECODE: {"count": 100, "p50": 50.0, "p95": 95.0, "p99": 99.0}
+    }
+
+
+def test_profiler_report_to_file(tmp_path: Path) -> None:
+    """Test writing summaries to a file when the report interval passes."""
+    output = tmp_path / "profiling.jsonl"
+
+    with freeze_time("2026-01-01 00:00:00") as frozen:
+        profiler = Profiler(output, report_interval=60)
+        with profiler.poll():
+            pass
+        assert not output.exists()
+
+        frozen.tick(60)
+        with profiler.poll():
+            pass
+
+    summary = json.loads(output.read_text(encoding="utf-8"))
+    assert summary[PHASE_POLL]["count"] == 2
+    assert profiler.summary() == {}
+
+
+def test_profiler_report_to_logger(caplog: pytest.LogCaptureFixture) -> None:
+    """Test logging summaries."""
+    profiler = Profiler(report_interval=0)
+
+    with caplog.at_level(logging.INFO), profiler.poll():
+        pass
+
+    assert "Profiling summary: {'poll': {'count': 1" in caplog.text
+
+
+def test_profiler_trace_memory() -> None:
+    """Test measuring peak memory of a poll."""
+    profiler = Profiler(trace_memory=True)
+
+    try:
+        with profiler.poll():
+            data = [bytes(1000) for _ in range(100)]
+            # memory freed before the end of the poll still counts
+            del data
+        summary = profiler.summary()
+    finally:
+        tracemalloc.stop()
+
+    assert summary["peak_bytes"]["p50"] >= 100000
+
+
+@pytest.mark.parametrize("value", [None, "0"])
+def test_default_profiler_disabled(
+    monkeypatch: pytest.MonkeyPatch, value: str | None
+) -> None:
+    """Test that profiling is disabled by default."""
+    monkeypatch.setattr(profiling, "_default_profiler", None)
+    if value is None:
+        monkeypatch.delenv(profiling.PROFILING_ENV, raising=False)
+    else:
+        monkeypatch.setenv(profiling.PROFILING_ENV, value)
+
+    assert get_default_profiler() is None
+
+
+def test_default_profiler_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test enabling profiling with environment variable."""
+    monkeypatch.setattr(profiling, "_default_profiler", None)
+    monkeypatch.setenv(profiling.PROFILING_ENV, "1")
+
+    profiler = get_default_profiler()
+
+    assert profiler is not None
+    assert get_default_profiler() is profiler
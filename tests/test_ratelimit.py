@@ -0,0 +1,194 @@
+"""Tests for brother rate limiting."""
+
+import asyncio
+from collections.abc import Generator
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from pysnmp.proto.rfc1902 import OctetString
+
+from brother import Brother
+from brother.const import OIDS
+from brother.hedging import Hedger
+from brother.ratelimit import SubnetRateLimiter, TokenBucket
+
+
+class FakeClock:
+    """Clock advanced by sleeping."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        """Return current time."""
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        """Advance time."""
+        self.now += delay
+
+
+@pytest.fixture
+def clock() -> Generator[FakeClock]:
+    """Patch time of rate limiting with a fake clock."""
+    fake_clock = FakeClock()
+    with (
+        patch("brother.ratelimit.time.monotonic", fake_clock.monotonic),
+        patch("brother.ratelimit.asyncio.sleep", fake_clock.sleep),
+    ):
+        yield fake_clock
+
+
+@pytest.mark.asyncio
+async def test_token_bucket(clock: FakeClock) -> None:
+    """Test that requests over the burst wait for tokens."""
+    bucket = TokenBucket(rate=2, burst=2)
+
+    for _ in range(5):
+        await bucket.async_acquire()
+
+    # two requests of the burst, then one request every 0.5 s
+    assert clock.now == pytest.approx(1.5)
+
+    clock.now += 10
+    await bucket.async_acquire()
+    await bucket.async_acquire()
+    # tokens are capped by the burst
+    assert clock.now == pytest.approx(11.5)
+
+
+def test_token_bucket_try_acquire(clock: FakeClock) -> None:
+    """Test taking tokens without waiting."""
+    bucket = TokenBucket(rate=1, burst=2)
+
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+
+    bucket.release()
+    assert bucket.try_acquire() is True
+
+    clock.now += 1
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+
+    limiter = SubnetRateLimiter(rate=1)
+    assert limiter.try_acquire("192.168.1.10") is True
+    assert limiter.try_acquire("192.168.1.11") is False
+    limiter.release("192.168.1.10")
+    assert limiter.try_acquire("192.168.1.11") is True
+
+
+@pytest.mark.parametrize(("rate", "burst"), [(0, 1), (-1, 1), (1, 0.5)])
+def test_invalid_limits(rate: float, burst: float) -> None:
+    """Test invalid rate and burst."""
+    with pytest.raises(ValueError, match="rate must be greater than 0"):
+        TokenBucket(rate, burst)
+    with pytest.raises(ValueError, match="rate must be greater than 0"):
+        SubnetRateLimiter(rate, burst)
+
+
+@pytest.mark.asyncio
+async def test_subnet_rate_limiter(clock: FakeClock) -> None:
+    """Test that printers in the same subnet share a bucket."""
+    limiter = SubnetRateLimiter(rate=1)
+
+    await limiter.async_acquire("192.168.1.10")
+    await limiter.async_acquire("192.168.2.10")
+    await limiter.async_acquire("printer.local")
+    assert clock.now == 0
+
+    await limiter.async_acquire("192.168.1.11")
+    assert clock.now == pytest.approx(1)
+
+    assert limiter.subnet("192.168.1.10") == "192.168.1.0/24"
+    assert SubnetRateLimiter(rate=1, prefix=16).subnet("10.1.2.3") == "10.1.0.0/16"
+    assert limiter.subnet("printer.local") == "printer.local"
+
+
+@pytest.mark.asyncio
+async def test_brother_rate_limits(brother_with_request_args: Brother) -> None:
+    """Test that all SNMP requests of the printer are limited."""
+    brother = brother_with_request_args
+    brother._rate_limiter = Mock(async_acquire=AsyncMock())
+    brother._subnet_limiter = Mock(async_acquire=AsyncMock())
+
+    with (
+        patch("brother.get_cmd", AsyncMock(return_value=(None, "noSuchName", 1, []))),
+        patch("brother.set_cmd", AsyncMock(return_value=(None, 0, 0, []))),
+        patch("brother.bulk_cmd", AsyncMock(return_value=(None, 0, 0, []))),
+    ):
+        await brother.async_get_datetime()
+        await brother.async_set({"1.3.6.1.2.1.1.6.0": OctetString("Office")})
+        await brother.async_get_supplies()
+
+    assert brother._rate_limiter.async_acquire.await_count == 3
+    assert brother._subnet_limiter.async_acquire.await_count == 3
+    brother._subnet_limiter.async_acquire.assert_awaited_with("localhost")
+
+
+@pytest.mark.asyncio
+async def test_brother_rate_limited_probe() -> None:
+    """Test that probing OIDs during initialization is limited."""
+    rate_limiter = Mock(async_acquire=AsyncMock())
+    brother = Brother("localhost", rate_limiter=rate_limiter)
+
+    with (
+        patch("brother.async_get_snmp_engine"),
+        patch("brother.get_oid_table", return_value=tuple(OIDS.values())),
+        patch("brother.async_resolve_host", return_value="127.0.0.1"),
+        patch("brother.UdpTransportTarget.create"),
+        patch("brother.get_cmd", AsyncMock(return_value=(None, 0, 0, []))),
+    ):
+        await brother.initialize()
+
+    rate_limiter.async_acquire.assert_awaited_once()
+    assert brother._address == "127.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_brother_throttle_not_hedger_sample(
+    brother_with_request_args: Brother,
+) -> None:
+    """Test that waiting for the rate limits is not a latency sample."""
+
+    async def async_acquire() -> None:
+        await asyncio.sleep(0.05)
+
+    brother = brother_with_request_args
+    brother._rate_limiter = Mock(async_acquire=async_acquire)
+    brother._hedger = Hedger()
+
+    with patch("brother.get_cmd", AsyncMock(return_value=(None, 0, 0, []))):
+        await brother._get_cmd([])
+
+    assert brother._hedger.requests == 1
+    assert max(brother._hedger._samples) < 0.05
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("burst", "hedged"), [(1, 0), (2, 1)])
+async def test_brother_hedge_rate_limited(
+    brother_with_request_args: Brother, burst: int, hedged: int
+) -> None:
+    """Test that a duplicate request is sent only with a token of the limits."""
+    brother = brother_with_request_args
+    # no tokens are earned during the test
+    brother._rate_limiter = TokenBucket(rate=0.001, burst=burst)
+    brother._subnet_limiter = SubnetRateLimiter(rate=0.001, burst=burst)
+    brother._hedger = Hedger(min_samples=1, budget=1)
+    brother._hedger._samples.extend([0.01] * 50)
+
+    async def fake_get_cmd(*_: object) -> tuple:
+        await asyncio.sleep(0.05)
+        return (None, 0, 0, [])
+
+    with patch("brother.get_cmd", side_effect=fake_get_cmd) as mock_get_cmd:
+        await brother._get_cmd([])
+
+    assert brother._hedger.hedged == hedged
+    assert mock_get_cmd.call_count == 1 + hedged
+    # the tokens of the duplicate are taken
+    assert brother._rate_limiter.try_acquire() is False
+    assert brother._subnet_limiter.try_acquire("localhost") is False
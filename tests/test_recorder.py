@@ -0,0 +1,85 @@
+"""Tests for brother recorder."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from freezegun import freeze_time
+from pysnmp.proto.rfc1902 import OctetString, TimeTicks
+
+from brother.const import (
+    ATTR_CHARSET,
+    ATTR_MAINTENANCE,
+    ATTR_STATUS,
+    ATTR_UPTIME,
+    OIDS,
+)
+from brother.recorder import Recorder
+from brother.utils import raw_data_from_dict
+
+RAW_DATA = {
+    OIDS[ATTR_MAINTENANCE]: ["63010400000001"],
+    OIDS[ATTR_STATUS]: "OCZEKIWANIE     ",
+    OIDS[ATTR_UPTIME]: "413613515",
+}
+VARBINDS = [
+    (OIDS[ATTR_MAINTENANCE], OctetString(b"\x63\x01\x04\x00\x00\x00\x01\xff")),
+    (OIDS[ATTR_UPTIME], TimeTicks(413613515)),
+    (OIDS[ATTR_STATUS], OctetString(b"OCZEKIWANIE     ")),
+]
+
+
+def test_recorder(tmp_path: Path) -> None:
+    """Test recording responses in fixture format and raw octets."""
+    with freeze_time("2026-01-01 12:00:00"), Recorder(tmp_path / "records") as recorder:
+        recorder.record("fe80::1%eth0", raw_data_from_dict(RAW_DATA), VARBINDS)
+
+    prefix = "fe80__1_eth0-20260101T120000000000"
+    # the status is recorded as reported, not cleansed
+    with open(tmp_path / "records" / f"{prefix}.json", encoding="utf-8") as file:
+        assert file.read() == json.dumps(RAW_DATA, indent=2) + "\n"
+    with open(tmp_path / "records" / f"{prefix}.raw.json", encoding="utf-8") as file:
+        assert json.load(file) == {
+            OIDS[ATTR_MAINTENANCE]: "63010400000001ff",
+            OIDS[ATTR_UPTIME]: "413613515",
+            OIDS[ATTR_STATUS]: b"OCZEKIWANIE     ".hex(),
+        }
+
+
+def test_recorder_close_without_records(tmp_path: Path) -> None:
+    """Test closing a recorder that did not record anything."""
+    recorder = Recorder(tmp_path)
+
+    recorder.close()
+
+    assert not list(tmp_path.iterdir())
+
+
+def test_recorder_write_error(tmp_path: Path) -> None:
+    """Test that write errors do not stop the writer thread."""
+    recorder = Recorder(tmp_path)
+
+    with patch("brother.recorder.json.dump", side_effect=[OSError, None, None]):
+        recorder.record("printer-1", raw_data_from_dict(RAW_DATA), VARBINDS)
+        recorder.record("printer-2", raw_data_from_dict(RAW_DATA), VARBINDS)
+        recorder.close()
+
+    assert sorted(path.name.split("-")[0] for path in tmp_path.iterdir()) == [
+        "printer",
+        "printer",
+        "printer",
+    ]
+
+
+def test_recorder_undecodable_status(tmp_path: Path) -> None:
+    """Test that a status which cannot be decoded is not recorded."""
+    varbinds = [(OIDS[ATTR_STATUS], OctetString(b"\xff\xfe"))]
+
+    with Recorder(tmp_path) as recorder:
+        recorder.record(
+            "printer", raw_data_from_dict({OIDS[ATTR_CHARSET]: "106"}), varbinds
+        )
+
+    [fixture] = tmp_path.glob("*[0-9].json")
+    with open(fixture, encoding="utf-8") as file:
+        assert json.load(file) == {OIDS[ATTR_CHARSET]: "106"}
@@ -0,0 +1,146 @@
+"""Tests for brother device registry."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from brother import SnmpError
+from brother.registry import DeviceRegistry
+
+HOST = "localhost"
+
+
+@pytest.mark.asyncio
+async def test_registry_shared_device() -> None:
+    """Test that handles of the same endpoint share one instance."""
+    brother = AsyncMock()
+    snmp_engine = Mock()
+    registry = DeviceRegistry()
+
+    with (
+        patch("brother.registry.async_get_snmp_engine", return_value=snmp_engine),
+        patch("brother.registry.Brother.create", return_value=brother) as mock_create,
+        patch("brother.registry.LCD.unconfigure") as mock_unconfigure,
+    ):
+        handles = await asyncio.gather(
+            registry.async_acquire(HOST), registry.async_acquire(HOST)
+        )
+        other = await registry.async_acquire(HOST, community="private")
+
+        assert mock_create.await_count == 2
+        assert handles[0].brother is handles[1].brother is brother
+        assert mock_create.call_args.kwargs["snmp_engine"] is snmp_engine
+        assert len(registry) == 2
+
+        handles[0].close()
+        handles[0].close()
+        assert handles[0].closed is True
+        assert len(registry) == 2
+
+        handles[1].close()
+        assert len(registry) == 1
+        snmp_engine.close_dispatcher.assert_not_called()
+        # the write community is still used by the other printer
+        mock_unconfigure.assert_called_once()
+        assert mock_unconfigure.call_args.args[0] is snmp_engine
+        assert mock_unconfigure.call_args.args[1].communityName == "public"
+
+        async with other:
+            pass
+
+    assert len(registry) == 0
+    mock_unconfigure.assert_called_with(snmp_engine, None)
+    assert mock_unconfigure.call_count == 2
+    snmp_engine.close_dispatcher.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_registry_shared_poll() -> None:
+    """Test that concurrent updates are joined into one poll."""
+    release = asyncio.Event()
+    brother = AsyncMock()
+
+    async def async_update(*, timeout: float | None = None) -> str:  # noqa: ARG001
+        await release.wait()
+        return "data"
+
+    brother.async_update.side_effect = async_update
+    registry = DeviceRegistry(snmp_engine=Mock())
+
+    with patch("brother.registry.Brother.create", return_value=brother):
+        first = await registry.async_acquire(HOST)
+        second = await registry.async_acquire(HOST)
+
+    tasks = [
+        asyncio.create_task(first.async_update()),
+        asyncio.create_task(second.async_update()),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["data", "data"]
+    brother.async_update.assert_awaited_once()
+
+    # a new update after the poll is done polls again
+    assert await first.async_update() == "data"
+    assert brother.async_update.await_count == 2
+
+    first.close()
+    with pytest.raises(RuntimeError, match="Device handle is closed"):
+        await first.async_update()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_registry_update_timeout() -> None:
+    """Test that the timeout caps the wait, not the poll of other handles."""
+    release = asyncio.Event()
+    brother = AsyncMock()
+
+    async def async_update(*, timeout: float | None = None) -> str:  # noqa: ARG001
+        await release.wait()
+        return "data"
+
+    brother.async_update.side_effect = async_update
+    registry = DeviceRegistry(snmp_engine=Mock())
+
+    with patch("brother.registry.Brother.create", return_value=brother):
+        first = await registry.async_acquire(HOST)
+        second = await registry.async_acquire(HOST)
+
+    task = asyncio.create_task(first.async_update(timeout=5))
+    await asyncio.sleep(0)
+    with pytest.raises(TimeoutError):
+        await second.async_update(timeout=0.01)
+
+    release.set()
+    assert await task == "data"
+    brother.async_update.assert_awaited_once_with(timeout=5)
+
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_registry_failed_initialization() -> None:
+    """Test that a failed initialization is retried by the next acquire."""
+    brother = AsyncMock()
+    snmp_engine = Mock()
+    registry = DeviceRegistry(snmp_engine=snmp_engine)
+
+    with patch(
+        "brother.registry.Brother.create",
+        side_effect=[SnmpError("SNMP error"), brother],
+    ) as mock_create:
+        with pytest.raises(SnmpError):
+            await registry.async_acquire(HOST)
+        assert len(registry) == 0
+
+        handle = await registry.async_acquire(HOST)
+
+    assert handle.brother is brother
+    assert mock_create.await_count == 2
+    handle.close()
+    # the engine given by the caller is not closed
+    snmp_engine.close_dispatcher.assert_not_called()
@@ -0,0 +1,101 @@
+"""Tests for brother sharding."""
+
+import os
+import queue
+from collections.abc import Sequence
+from multiprocessing.queues import Queue
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from brother import SnmpError
+from brother.sharding import (
+    PollOptions,
+    ShardedPoller,
+    ShardResult,
+    async_poll_shard,
+    split_hosts,
+)
+
+
+def fake_worker(
+    worker_id: int, hosts: Sequence[str], results: Queue, options: PollOptions
+) -> None:
+    """Report a result for every host, crash on the crash host."""
+    for host in hosts:
+        if host == "crash":
+            os._exit(1)
+        results.put((worker_id, ShardResult(host, data={"port": options.port})))
+    results.put((worker_id, None))
+
+
+def test_split_hosts() -> None:
+    """Test splitting hosts into shards."""
+    hosts = [f"printer-{index}" for index in range(5)]
+
+    assert split_hosts(hosts, 2) == [
+        ["printer-0", "printer-2", "printer-4"],
+        ["printer-1", "printer-3"],
+    ]
+    assert split_hosts(hosts[:1], 2) == [["printer-0"], []]
+
+
+@pytest.mark.asyncio
+async def test_async_poll_shard() -> None:
+    """Test polling a shard of printers."""
+    results: queue.Queue = queue.Queue()
+    brother = AsyncMock()
+    brother.async_update_data.return_value = {"page_counter": 10}
+
+    with (
+        patch("brother.sharding.async_get_snmp_engine") as mock_engine,
+        patch(
+            "brother.sharding.Brother.create",
+            side_effect=[brother, SnmpError("SNMP error")],
+        ) as mock_create,
+    ):
+        await async_poll_shard(3, ["printer-1", "printer-2"], results, PollOptions())  # ty:ignore[invalid-argument-type]
+
+    assert mock_create.call_args.kwargs["snmp_engine"] is mock_engine.return_value
+    assert results.get_nowait() == (
+        3,
+        ShardResult("printer-1", data={"page_counter": 10}),
+    )
+    assert results.get_nowait() == (
+        3,
+        ShardResult("printer-2", error="SnmpError('SNMP error')"),
+    )
+
+
+def test_sharded_poller() -> None:
+    """Test polling hosts with many worker processes."""
+    hosts = [f"printer-{index}" for index in range(10)]
+    poller = ShardedPoller(
+        hosts, workers=4, options=PollOptions(port=1161), worker_target=fake_worker
+    )
+
+    results = list(poller.poll())
+
+    assert sorted(result.host for result in results) == sorted(hosts)
+    assert all(result.data == {"port": 1161} for result in results)
+    assert poller.restarts == 0
+
+
+def test_sharded_poller_worker_failure() -> None:
+    """Test restarting a worker that keeps failing."""
+    poller = ShardedPoller(
+        ["printer-1", "crash", "printer-2", "printer-3"],
+        workers=2,
+        max_restarts=1,
+        worker_target=fake_worker,
+    )
+
+    results = list(poller.poll())
+
+    assert poller.restarts == 1
+    assert sorted(result.host for result in results if result.error is None) == [
+        "printer-1",
+        "printer-2",
+    ]
+    failed = [result for result in results if result.error is not None]
+    assert [result.host for result in failed] == ["crash", "printer-3"]
@@ -0,0 +1,125 @@
+"""Tests for brother sync client."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from brother import SnmpError
+from brother.sync import BrotherClient
+
+HOST = "localhost"
+
+
+def test_client_update() -> None:
+    """Test updating printers from many threads."""
+    brother = AsyncMock()
+    brother.async_update.return_value = "data"
+
+    with (
+        patch("brother.sync.Brother.create", return_value=brother) as mock_create,
+        BrotherClient(port=1161, community="private") as client,
+        ThreadPoolExecutor(max_workers=8) as executor,
+    ):
+        results = list(executor.map(client.update, [HOST] * 16))
+
+    assert results == ["data"] * 16
+    assert brother.async_update.call_count == 16
+    mock_create.assert_called_once()
+    assert mock_create.call_args.args == (HOST,)
+    assert mock_create.call_args.kwargs["port"] == 1161
+    assert mock_create.call_args.kwargs["community"] == "private"
+    assert mock_create.call_args.kwargs["snmp_engine"] is client._snmp_engine
+
+
+def test_client_datetime() -> None:
+    """Test getting and setting date and time."""
+    brother = AsyncMock()
+    brother.async_get_datetime.return_value = datetime(2025, 1, 1, tzinfo=UTC)
+    dt = datetime(2025, 1, 2, tzinfo=UTC)
+
+    with (
+        patch("brother.sync.Brother.create", return_value=brother),
+        BrotherClient() as client,
+    ):
+        assert client.get_datetime(HOST) == datetime(2025, 1, 1, tzinfo=UTC)
+        client.set_datetime(HOST, dt)
+
+    brother.async_set_datetime.assert_awaited_once_with(dt)
+
+
+def test_client_failed_initialization() -> None:
+    """Test that failed initialization is retried on the next call."""
+    brother = AsyncMock()
+    brother.async_update.return_value = "data"
+
+    with (
+        patch(
+            "brother.sync.Brother.create",
+            side_effect=[SnmpError("SNMP error"), brother],
+        ) as mock_create,
+        BrotherClient() as client,
+    ):
+        with pytest.raises(SnmpError, match="SNMP error"):
+            client.update(HOST)
+
+        assert client.update(HOST) == "data"
+
+    assert mock_create.call_count == 2
+
+
+def test_client_closed() -> None:
+    """Test calling a closed client."""
+    client = BrotherClient()
+    client.close()
+    client.close()
+
+    with pytest.raises(RuntimeError, match="Client is closed"):
+        client.update(HOST)
+
+
+def test_client_close_with_call_in_progress() -> None:
+    """Test that closing the client ends calls in progress in other threads."""
+    brother = AsyncMock()
+    started = threading.Event()
+
+    async def hang() -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    brother.async_update.side_effect = hang
+
+    with (
+        patch("brother.sync.Brother.create", return_value=brother),
+        ThreadPoolExecutor(max_workers=1) as executor,
+    ):
+        client = BrotherClient()
+        future = executor.submit(client.update, HOST)
+        assert started.wait(5)
+
+        client.close()
+
+        with pytest.raises(RuntimeError, match="Client is closed"):
+            future.result(timeout=5)
+
+    assert client._calls == set()
+
+
+def test_client_timeout() -> None:
+    """Test that a call is cancelled when the timeout passes."""
+    brother = AsyncMock()
+
+    async def hang() -> None:
+        await asyncio.Event().wait()
+
+    brother.async_update.side_effect = hang
+
+    with (
+        patch("brother.sync.Brother.create", return_value=brother),
+        BrotherClient() as client,
+        pytest.raises(TimeoutError),
+    ):
+        client.update(HOST, timeout=0.01)
@@ -0,0 +1,154 @@
+"""Tests for brother trap listener."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from pysnmp.hlapi.v3arch.asyncio import (
+    CommunityData,
+    ContextData,
+    NotificationType,
+    ObjectIdentity,
+    SnmpEngine,
+    UdpTransportTarget,
+    send_notification,
+)
+
+from brother import SnmpError
+from brother.traps import TrapListener
+
+HOST = "127.0.0.1"
+# linkUp notification
+NOTIFICATION = "1.3.6.1.6.3.1.1.5.4"
+
+
+def mock_printer(host: str = HOST) -> Mock:
+    """Return mocked Brother instance."""
+    printer = Mock(host=host)
+    printer.async_update = AsyncMock(return_value="data")
+    return printer
+
+
+def mock_engine(address: str) -> Mock:
+    """Return mocked SNMP engine that received a notification from address."""
+    snmp_engine = Mock()
+    snmp_engine.observer.get_execution_context.return_value = {
+        "transportAddress": (address, 1024)
+    }
+    return snmp_engine
+
+
+async def send_trap(port: int, community: str = "public") -> None:
+    """Send a notification to the listener."""
+    snmp_engine = SnmpEngine()
+    await send_notification(
+        snmp_engine,
+        CommunityData(community, mpModel=1),
+        await UdpTransportTarget.create((HOST, port)),
+        ContextData(),
+        "trap",
+        NotificationType(ObjectIdentity(NOTIFICATION)),
+    )
+    snmp_engine.close_dispatcher()
+
+
+@pytest.mark.asyncio
+async def test_trap_listener() -> None:
+    """Test updating printer after a notification."""
+    updated = asyncio.Event()
+    on_update = Mock(side_effect=lambda *_: updated.set())
+    printer = mock_printer()
+
+    async with TrapListener(on_update, host=HOST, port=0) as listener:
+        await listener.async_add(printer)
+        assert listener.port != 0
+
+        await send_trap(listener.port)
+        async with asyncio.timeout(5):
+            await updated.wait()
+
+    printer.async_update.assert_awaited_once()
+    on_update.assert_called_once_with(printer, "data")
+
+
+@pytest.mark.asyncio
+async def test_trap_listener_wrong_community() -> None:
+    """Test that notifications with wrong community are dropped."""
+    on_update = Mock()
+    printer = mock_printer()
+
+    async with TrapListener(on_update, host=HOST, port=0) as listener:
+        await listener.async_add(printer)
+        await send_trap(listener.port, community="private")
+        await asyncio.sleep(0.2)
+
+    printer.async_update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_trap_listener_unknown_host() -> None:
+    """Test that notifications from unknown hosts are ignored."""
+    printer = mock_printer()
+    listener = TrapListener(Mock())
+    await listener.async_add(printer)
+    listener.remove(printer)
+
+    listener._receive(mock_engine(HOST), None, None, None, None, None)
+
+    assert not listener._tasks
+
+
+@pytest.mark.asyncio
+async def test_trap_listener_coalesce() -> None:
+    """Test that notifications during an update trigger one more update."""
+    on_update = Mock()
+    release = asyncio.Event()
+
+    async def async_update() -> str:
+        await release.wait()
+        return "data"
+
+    printer = mock_printer()
+    printer.async_update.side_effect = async_update
+    listener = TrapListener(on_update)
+    await listener.async_add(printer)
+
+    listener._receive(mock_engine(HOST), None, None, None, None, None)
+    await asyncio.sleep(0)
+    for _ in range(4):
+        listener._receive(mock_engine(HOST), None, None, None, None, None)
+    release.set()
+    await asyncio.gather(*listener._tasks.values())
+
+    assert printer.async_update.await_count == 2
+    assert on_update.call_count == 2
+    assert not listener._tasks
+
+
+@pytest.mark.asyncio
+async def test_trap_listener_update_error() -> None:
+    """Test that a failed update is not passed to the callback."""
+    on_update = Mock()
+    printer = mock_printer()
+    printer.async_update.side_effect = SnmpError("SNMP error")
+    listener = TrapListener(on_update)
+    await listener.async_add(printer)
+
+    listener._receive(mock_engine(HOST), None, None, None, None, None)
+    await asyncio.gather(*listener._tasks.values())
+
+    on_update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_trap_listener_port_in_use() -> None:
+    """Test starting listener on a port that is already in use."""
+    async with TrapListener(Mock(), host=HOST, port=0) as listener:
+        other = TrapListener(Mock(), host=HOST, port=listener.port)
+        with (
+            patch("brother.traps.async_get_snmp_engine") as mock_engine_factory,
+            pytest.raises(ConnectionError),
+        ):
+            await other.async_start()
+
+    mock_engine_factory.assert_not_called()
@@ -1,12 +1,41 @@
 """Tests for brother utils."""
 
 import asyncio
-from unittest.mock import MagicMock, patch
+import json
+import socket
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from freezegun import freeze_time
 from pysnmp.hlapi.v3arch.asyncio import SnmpEngine
+from pysnmp.proto.rfc1902 import Integer32, ObjectName, OctetString
+from pysnmp.smi.view import MibViewController
 
-from brother.utils import _get_snmp_engine, async_get_snmp_engine, bytes_to_hex_string
+from brother.const import (
+    ATTR_MAINTENANCE,
+    ATTR_MODEL,
+    ATTR_STATUS,
+    OID_DATETIME,
+    OIDS,
+    SLOT_MAINTENANCE,
+    SLOT_MODEL,
+    SLOT_STATUS,
+)
+from brother.utils import (
+    _get_snmp_engine,
+    async_gather_bounded,
+    async_get_snmp_engine,
+    async_resolve_host,
+    build_set_varbinds,
+    bytes_to_hex_string,
+    cleanse_status,
+    clear_resolve_cache,
+    decode_status,
+    get_oid_table,
+    nearest_rank,
+    raw_data_from_dict,
+    raw_data_to_dict,
+)
 
 
 def test_get_snmp_engine() -> None:
@@ -90,3 +119,217 @@ def test_bytes_to_hex_string() -> None:
     two_bytes = b"\xab\xcd"
     result = bytes_to_hex_string(two_bytes)
     assert result == "ab"
+
+
+@pytest.mark.parametrize(
+    ("status", "encoding", "expected"),
+    [
+        (b"TRYB U\xa6PIENIA", "latin2", "tryb uśpienia"),
+        (b"PROSZ\xca CZEKA\xc6", "latin2", "proszę czekać"),
+        (b"MA\xa3O TONERU (Y)", "latin2", "mało toneru (y)"),
+        (b"\xe8\xaf\xb7\xe7\xad\x89\xe5\xbe\x85", "utf-8", "请等待"),
+        (b"Stap. Kopie\xcdn:01", "roman8", "stap. kopieën:01"),
+        (b"\xc1\xdf\xef\xe9\xd8\xd9 \xe0\xd5\xd6\xd8\xdc", "cyrillic", "спящий режим"),
+        (b"OCZEKIWANIE     ", "latin2", "oczekiwanie"),
+    ],
+)
+def test_decode_status(status: bytes, encoding: str, expected: str) -> None:
+    """Test decoding status."""
+    result = decode_status(status, encoding)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [
+        ("  ready   to   print  ", "ready to print"),
+        ("ready\t\nto\n\tprint", "ready to print"),
+        ("SLEEP           ", "sleep"),
+        ("", ""),
+        ("   \t\n  ", ""),
+    ],
+)
+def test_cleanse_status(status: str, expected: str) -> None:
+    """Test cleansing status strings."""
+    assert cleanse_status(status) == expected
+
+
+@pytest.mark.parametrize(
+    ("percentile", "expected"), [(1, 1.0), (50, 5.0), (90, 9.0), (95, 10.0)]
+)
+def test_nearest_rank(percentile: int, expected: float) -> None:
+    """Test percentile of sorted samples."""
+    assert (
+        nearest_rank([float(value) for value in range(1, 11)], percentile) == expected
+    )
+
+
+def test_decode_status_unicode_error() -> None:
+    """Test decoding status with UnicodeDecodeError."""
+    # Invalid bytes that can't be decoded with the specified encoding
+    invalid_status = b"\xff\xfe\xfd"
+
+    result = decode_status(invalid_status, "utf-8")
+
+    assert result is None
+
+
+def test_decode_status_cache() -> None:
+    """Test that decoded statuses are cached per raw bytes and encoding."""
+    decode_status.cache_clear()
+
+    assert decode_status(b"Sleep  ", "roman8") == "sleep"
+    assert decode_status(b"Sleep  ", "roman8") == "sleep"
+    assert decode_status(b"Sleep  ", "latin2") == "sleep"
+
+    info = decode_status.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.currsize == 2
+
+
+def test_get_oid_table() -> None:
+    """Test that OID objects are resolved once per engine."""
+    engine = _get_snmp_engine()
+
+    oid_table = get_oid_table(engine)
+
+    assert get_oid_table(engine) is oid_table
+    assert [oid[0].get_oid() for oid in oid_table] == [
+        ObjectName(oid) for oid in OIDS.values()
+    ]
+    assert get_oid_table(_get_snmp_engine()) is not oid_table
+
+
+@pytest.mark.asyncio
+async def test_async_resolve_host_cache() -> None:
+    """Test that resolved addresses are cached until TTL expires."""
+    clear_resolve_cache()
+    addrinfo = [(socket.AF_INET, socket.SOCK_DGRAM, 17, "", ("192.168.1.10", 0))]
+
+    with (
+        freeze_time("2026-01-01 00:00:00") as frozen,
+        patch.object(
+            asyncio.get_running_loop(),
+            "getaddrinfo",
+            AsyncMock(return_value=addrinfo),
+        ) as mock_getaddrinfo,
+    ):
+        assert await async_resolve_host("printer.local") == "192.168.1.10"
+        assert await async_resolve_host("printer.local") == "192.168.1.10"
+        assert mock_getaddrinfo.call_count == 1
+
+        frozen.tick(301)
+        assert await async_resolve_host("printer.local") == "192.168.1.10"
+        assert mock_getaddrinfo.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_resolve_host_negative_cache() -> None:
+    """Test that resolution failures are cached."""
+    clear_resolve_cache()
+
+    with (
+        freeze_time("2026-01-01 00:00:00") as frozen,
+        patch.object(
+            asyncio.get_running_loop(),
+            "getaddrinfo",
+            AsyncMock(side_effect=socket.gaierror("Name or service not known")),
+        ) as mock_getaddrinfo,
+    ):
+        with pytest.raises(ConnectionError, match="Name or service not known"):
+            await async_resolve_host("foo.local")
+        with pytest.raises(
+            ConnectionError, match=r"Could not resolve host foo\.local$"
+        ):
+            await async_resolve_host("foo.local")
+        assert mock_getaddrinfo.call_count == 1
+
+        frozen.tick(31)
+        with pytest.raises(ConnectionError):
+            await async_resolve_host("foo.local")
+        assert mock_getaddrinfo.call_count == 2
+
+
+def test_build_set_varbinds(mib_view_controller: MibViewController) -> None:
+    """Test building varbinds of SNMP SET request."""
+    datetime_value = OctetString(b"\x07\xea\x01\x01\x00\x00\x00\x00")
+
+    varbinds = build_set_varbinds(
+        {OID_DATETIME: datetime_value, "1.3.6.1.2.1.1.7.0": Integer32(72)}
+    )
+
+    assert [
+        varbind.resolve_with_mib(mib_view_controller)[1] for varbind in varbinds
+    ] == [datetime_value, Integer32(72)]
+
+
+@pytest.mark.parametrize(
+    ("values", "error"),
+    [
+        ({}, "No values to set"),
+        ({"sysName.0": OctetString("printer")}, "sysName.0 is not a numeric OID"),
+        ({"1.3.6.1.2.1.1.5.0": "printer"}, "'printer' is not an SNMP value"),
+        ({"1.3.6.1.2.1.1.5.0": OctetString()}, "is not an SNMP value"),
+        ({OID_DATETIME: OctetString(b"\x07\xea")}, "is not a valid DateAndTime"),
+        (
+            {OID_DATETIME: OctetString(b"\x07\xea\x0d\x01\x00\x00\x00\x00")},
+            "is not a valid DateAndTime",
+        ),
+    ],
+)
+def test_build_set_varbinds_invalid(values: dict[str, object], error: str) -> None:
+    """Test validation of values to set."""
+    with pytest.raises(ValueError, match=error):
+        build_set_varbinds(values)
+
+
+def test_raw_data_conversion() -> None:
+    """Test converting raw data between fixture format and OIDS slots."""
+    with open("tests/fixtures/hl-l2340dw.json", encoding="utf-8") as file:
+        data = json.load(file)
+
+    raw_data = raw_data_from_dict(data)
+
+    assert len(raw_data) == len(OIDS)
+    assert raw_data[SLOT_MODEL] == data[OIDS[ATTR_MODEL]]
+    assert raw_data[SLOT_MAINTENANCE] == bytes.fromhex(
+        "".join(data[OIDS[ATTR_MAINTENANCE]])
+    )
+    # the status is cleansed as statuses of polls are
+    assert raw_data[SLOT_STATUS] == "oczekiwanie"
+    assert raw_data_to_dict(raw_data) == data | {OIDS[ATTR_STATUS]: "oczekiwanie"}
+
+
+@pytest.mark.asyncio
+async def test_async_gather_bounded(caplog: pytest.LogCaptureFixture) -> None:
+    """Test bounded concurrency and per-call errors."""
+    running = 0
+    max_running = 0
+
+    async def call(error: Exception | None = None) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        if error:
+            raise error
+
+    connection_error = ConnectionError("Connection refused")
+    bug = KeyError("bug")
+    errors: list[tuple[int, Exception]] = []
+
+    results = await async_gather_bounded(
+        [call, lambda: call(connection_error), lambda: call(bug), call],
+        concurrency=2,
+        on_error=lambda index, err: errors.append((index, err)),
+    )
+
+    # an unexpected error does not lose results of other calls
+    assert results == [None, connection_error, bug, None]
+    assert errors == [(1, connection_error), (2, bug)]
+    assert max_running == 2
+    # only the unexpected error is logged with the traceback
+    assert [record.exc_info[1] for record in caplog.records if record.exc_info] == [bug]